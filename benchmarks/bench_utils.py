@@ -0,0 +1,55 @@
+"""Small helpers shared by the benchmark scripts"""
+import os
+import statistics
+import sys
+import time
+
+# Benchmarks live one level below the application modules
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile of an already sorted list"""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, int(round(pct / 100.0 * (len(samples) - 1)))))
+    return samples[index]
+
+
+def summarize(samples):
+    """Summarize a list of durations in seconds as milliseconds"""
+    ordered = sorted(samples)
+    return {
+        'runs': len(ordered),
+        'mean_ms': statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        'p50_ms': percentile(ordered, 50) * 1000,
+        'p95_ms': percentile(ordered, 95) * 1000,
+        'p99_ms': percentile(ordered, 99) * 1000,
+        'max_ms': ordered[-1] * 1000 if ordered else 0.0
+    }
+
+
+def time_calls(fn, iterations, warmup=0):
+    """Call fn repeatedly and return the duration of each timed call"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def print_summary_table(title, rows):
+    """Print {label: summary} rows as an aligned table"""
+    print(f"\n{title}")
+    print("=" * 78)
+    print(f"{'Variant':<28}{'runs':>6}{'mean ms':>11}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}")
+    print("-" * 78)
+    for label, summary in rows.items():
+        print(f"{label:<28}{summary['runs']:>6}{summary['mean_ms']:>11.2f}"
+              f"{summary['p50_ms']:>11.2f}{summary['p95_ms']:>11.2f}{summary['p99_ms']:>11.2f}")
+    print("=" * 78)
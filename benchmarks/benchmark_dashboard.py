@@ -0,0 +1,70 @@
+"""Compare the consolidated dashboard queries with the original four-query path
+
+Usage:
+    python benchmarks/benchmark_dashboard.py --iterations 500
+
+Needs the database configured in db_backend (DB_BACKEND=sqlite works without a server).
+"""
+import argparse
+
+import bench_utils  # noqa: F401  (puts the project root on sys.path)
+from bench_utils import time_calls, summarize, print_summary_table
+
+from flask_app import app, execute_query, load_dashboard_data, TODAY_APPOINTMENTS_QUERY
+
+
+def legacy_dashboard():
+    """The original /api/dashboard implementation: four sequential queries"""
+    patient_count = execute_query("SELECT COUNT(*) as count FROM patients", fetch_one=True)
+    doctor_count = execute_query("SELECT COUNT(*) as count FROM doctors WHERE is_active = TRUE", fetch_one=True)
+    today_appointments = execute_query(TODAY_APPOINTMENTS_QUERY)
+    available_rooms = execute_query("SELECT COUNT(*) as count FROM rooms WHERE is_occupied = FALSE AND is_active = TRUE", fetch_one=True)
+    return {
+        'patient_count': patient_count['count'] if patient_count else 0,
+        'doctor_count': doctor_count['count'] if doctor_count else 0,
+        'appointment_count': len(today_appointments) if today_appointments else 0,
+        'available_rooms': available_rooms['count'] if available_rooms else 0,
+        'today_appointments': today_appointments or []
+    }
+
+
+def in_request(fn):
+    """Run fn inside an app context so it behaves like one HTTP request"""
+    def run():
+        with app.app_context():
+            return fn()
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/dashboard query strategies")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    args = parser.parse_args()
+
+    variants = {
+        'four queries (legacy)': in_request(legacy_dashboard),
+        'consolidated': in_request(lambda: load_dashboard_data()),
+        'consolidated + concurrent': in_request(lambda: load_dashboard_data(concurrent=True))
+    }
+
+    # Sanity check: every variant must report the same numbers
+    baseline = variants['four queries (legacy)']()
+    for label, fn in variants.items():
+        result = fn()
+        for key in ('patient_count', 'doctor_count', 'appointment_count', 'available_rooms'):
+            if result[key] != baseline[key]:
+                raise SystemExit(f"{label} disagrees on {key}: {result[key]} != {baseline[key]}")
+
+    results = {label: summarize(time_calls(fn, args.iterations, args.warmup))
+               for label, fn in variants.items()}
+    print_summary_table(f"/api/dashboard data path ({args.iterations} iterations)", results)
+
+    legacy_mean = results['four queries (legacy)']['mean_ms']
+    for label, summary in results.items():
+        if summary['mean_ms']:
+            print(f"{label:<28} {legacy_mean / summary['mean_ms']:.2f}x vs legacy")
+
+
+if __name__ == "__main__":
+    main()
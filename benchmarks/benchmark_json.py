@@ -0,0 +1,122 @@
+"""Compare JSON serialization of API payloads
+
+Usage:
+    python benchmarks/benchmark_json.py --rows 1000 10000 --iterations 20
+
+Serializes synthetic appointment, medical record and billing payloads
+(dates, TIME values as timedelta, DECIMAL amounts) with the original
+DateTimeEncoder, the stdlib fallback of json_provider and, when it is
+installed, its orjson fast path. No database needed.
+"""
+import argparse
+import json
+import random
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import bench_utils
+
+import json_provider
+
+STATUSES = ['Scheduled', 'Completed', 'Cancelled', 'In Progress']
+REASONS = ['Routine checkup', 'Follow-up visit', 'Chest pain', 'Fever and cough', 'Knee pain']
+DIAGNOSES = ['Type 2 Diabetes Mellitus', 'Hypertension (Essential)', 'Dengue Fever', 'Migraine']
+FIRST_NAMES = ['Aarav', 'Priya', 'Rohan', 'Ananya', 'Vikram', 'Meera', 'Arjun', 'Kavya']
+LAST_NAMES = ['Sharma', 'Patel', 'Reddy', 'Iyer', 'Gupta', 'Nair', 'Khan', 'Singh']
+
+
+class LegacyDateTimeEncoder(json.JSONEncoder):
+    """The original flask_app.DateTimeEncoder, kept verbatim for comparison"""
+    def default(self, obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        elif isinstance(obj, timedelta):
+            # Convert timedelta to string format (HH:MM:SS)
+            total_seconds = int(obj.total_seconds())
+            hours = total_seconds // 3600
+            minutes = (total_seconds % 3600) // 60
+            seconds = total_seconds % 60
+            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        if isinstance(obj, Decimal):
+            # Not handled originally; added so every payload can be compared
+            return str(obj)
+        return super().default(obj)
+
+
+def generate_payloads(count, seed=42):
+    """Build response bodies shaped like the appointment, record and billing queries"""
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    appointments = []
+    records = []
+    bills = []
+    for row_id in range(1, count + 1):
+        day = start + timedelta(days=rng.randint(0, 2000))
+        appointments.append({
+            'appointment_id': row_id,
+            'patient_id': rng.randint(1, 5000),
+            'doctor_id': rng.randint(1, 12),
+            'appointment_date': day,
+            'appointment_time': timedelta(hours=rng.randint(9, 17), minutes=rng.choice([0, 15, 30, 45])),
+            'status': rng.choice(STATUSES),
+            'reason': rng.choice(REASONS),
+            'patient_first_name': rng.choice(FIRST_NAMES),
+            'patient_last_name': rng.choice(LAST_NAMES),
+            'created_at': datetime(day.year, day.month, day.day, rng.randint(0, 23), rng.randint(0, 59))
+        })
+        records.append({
+            'record_id': row_id,
+            'patient_id': rng.randint(1, 5000),
+            'visit_date': day,
+            'diagnosis': rng.choice(DIAGNOSES),
+            'treatment': 'Medication and lifestyle changes. ' * 3,
+            'prescription': 'Metformin 500mg twice daily after meals',
+            'notes': 'Patient advised to follow up in two weeks. ' * 4
+        })
+        bills.append({
+            'bill_id': row_id,
+            'patient_id': rng.randint(1, 5000),
+            'amount': Decimal(rng.randint(500, 500000)) / 100,
+            'bill_date': day,
+            'due_date': day + timedelta(days=30)
+        })
+    return {
+        'appointments': {'status': 'success', 'data': appointments},
+        'medical records': {'status': 'success', 'data': records},
+        'billing': {'status': 'success', 'data': bills}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    args = parser.parse_args()
+
+    orjson = json_provider.orjson
+    print(f"orjson: {'installed ' + orjson.__version__ if orjson else 'not installed'}")
+
+    def stdlib_dumps(payload):
+        json_provider.orjson = None
+        try:
+            return json_provider.dumps_bytes(payload)
+        finally:
+            json_provider.orjson = orjson
+
+    for count in args.rows:
+        for name, payload in generate_payloads(count).items():
+            variants = {
+                'DateTimeEncoder (original)': lambda: json.dumps(payload, cls=LegacyDateTimeEncoder),
+                'provider, stdlib fallback': lambda: stdlib_dumps(payload)
+            }
+            if orjson is not None:
+                variants['provider, orjson'] = lambda: json_provider.dumps_bytes(payload)
+
+            rows = {label: bench_utils.summarize(bench_utils.time_calls(fn, args.iterations, args.warmup))
+                    for label, fn in variants.items()}
+            bench_utils.print_summary_table(f"{name}: {count} rows", rows)
+
+
+if __name__ == "__main__":
+    main()
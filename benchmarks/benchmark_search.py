@@ -0,0 +1,58 @@
+"""Compare the indexed patient search with the original leading-wildcard LIKE
+
+Usage:
+    python create_hospital_database.py --migrate      # adds the search indexes
+    python benchmarks/benchmark_search.py --seed-patients 1000000 --iterations 50
+
+--seed-patients appends synthetic patients to the configured database before
+timing, so only point it at a disposable copy.
+"""
+import argparse
+
+import bench_utils  # noqa: F401  (puts the project root on sys.path)
+from bench_utils import time_calls, summarize, print_summary_table
+
+from data_generator import generate_database
+from flask_app import app, db_pool, search_patient_rows, patient_search_mode
+
+SEARCH_TERMS = ['Sharma', 'raj', 'priya patel', 'deepika.nair', '9876543210', '3210', '98765', 'K']
+
+
+def seed_patients(count, chunk_size=5000, seed=7):
+    """Append count synthetic patients using chunked executemany inserts"""
+    connection = db_pool.acquire()
+    try:
+        generate_database(connection, {'patients': count}, seed=seed, chunk_size=chunk_size)
+    finally:
+        db_pool.release(connection)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark patient search strategies")
+    parser.add_argument('--seed-patients', type=int, default=0)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--limit', type=int, default=50)
+    args = parser.parse_args()
+
+    if args.seed_patients:
+        seed_patients(args.seed_patients)
+
+    # 'fulltext' needs the search indexes, which SQLite and unmigrated MySQL lack
+    with app.app_context():
+        modes = ['like', 'fulltext'] if patient_search_mode() == 'fulltext' else ['like']
+    if 'fulltext' not in modes:
+        print("⚠️ Skipping 'fulltext': the search indexes are not available on this database")
+
+    for term in SEARCH_TERMS:
+        results = {}
+        for mode in modes:
+            def run(mode=mode):
+                with app.app_context():
+                    return search_patient_rows(term, args.limit, mode=mode)
+            hits = len(run())
+            results[f"{mode} ({hits} hits)"] = summarize(time_calls(run, args.iterations, warmup=3))
+        print_summary_table(f"search_term={term!r}", results)
+
+
+if __name__ == "__main__":
+    main()
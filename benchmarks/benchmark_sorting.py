@@ -0,0 +1,133 @@
+"""Compare the keyed sort engine with the original recursive quick sort
+
+Usage:
+    python benchmarks/benchmark_sorting.py --sizes 10000 100000 1000000
+
+Runs entirely in memory on synthetic medical records; no database needed.
+The original quick sort is only timed up to --legacy-max rows because it
+becomes impractically slow beyond that.
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+import bench_utils  # noqa: F401  (puts the project root on sys.path)
+
+from record_sort import sort_records
+
+DIAGNOSES = [
+    'Type 2 Diabetes Mellitus', 'Hypertension (Essential)', 'Acute Gastroenteritis',
+    'Dengue Fever', 'Bronchial Asthma', 'Thyroid Disorder', 'Vitamin D Deficiency',
+    'Iron Deficiency Anemia', 'Migraine', 'Osteoarthritis', 'Allergic Rhinitis'
+]
+SPECIALIZATIONS = ['Cardiology', 'Pediatrics', 'Orthopedics', 'Neurology', 'General Medicine', 'Dermatology']
+
+
+def legacy_quick_sort_records(records, sort_by='visit_date', order='desc'):
+    """The original flask_app.quick_sort_records, kept verbatim for comparison"""
+    if len(records) <= 1:
+        return records
+
+    def compare_records(a, b, sort_field, sort_order):
+        val_a = a.get(sort_field, '')
+        val_b = b.get(sort_field, '')
+
+        if sort_field == 'visit_date':
+            try:
+                from datetime import datetime
+                if isinstance(val_a, str):
+                    val_a = datetime.strptime(val_a.split(',')[1].strip() if ',' in val_a else val_a, '%d %b %Y %H:%M:%S %Z')
+                if isinstance(val_b, str):
+                    val_b = datetime.strptime(val_b.split(',')[1].strip() if ',' in val_b else val_b, '%d %b %Y %H:%M:%S %Z')
+            except:
+                pass
+        elif sort_field in ['patient_id', 'doctor_id', 'record_id']:
+            try:
+                val_a = int(val_a)
+                val_b = int(val_b)
+            except:
+                pass
+        else:
+            val_a = str(val_a).lower()
+            val_b = str(val_b).lower()
+
+        if sort_order == 'asc':
+            return val_a < val_b
+        else:
+            return val_a > val_b
+
+    pivot = records[len(records) // 2]
+    left = [x for x in records if compare_records(x, pivot, sort_by, order)]
+    middle = [x for x in records if x == pivot]
+    right = [x for x in records if compare_records(pivot, x, sort_by, order)]
+
+    return legacy_quick_sort_records(left, sort_by, order) + middle + legacy_quick_sort_records(right, sort_by, order)
+
+
+def generate_records(count, seed=42):
+    """Build synthetic rows shaped like the /api/records/sorted query result"""
+    rng = random.Random(seed)
+    start = date(2015, 1, 1)
+    records = []
+    for record_id in range(1, count + 1):
+        records.append({
+            'record_id': record_id,
+            'patient_id': rng.randint(1, max(1, count // 4)),
+            'doctor_id': rng.randint(1, 12),
+            'visit_date': start + timedelta(days=rng.randint(0, 3650)),
+            'diagnosis': rng.choice(DIAGNOSES) if rng.random() > 0.02 else None,
+            'specialization': rng.choice(SPECIALIZATIONS)
+        })
+    return records
+
+
+def time_once(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark record sorting")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--legacy-max', type=int, default=100000,
+                        help="largest size the original quick sort is run at")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    cases = [
+        ('visit_date desc', [('visit_date', True)]),
+        ('specialization asc', [('specialization', False)]),
+        ('diagnosis asc', [('diagnosis', False)]),
+        ('specialization, visit_date desc', [('specialization', False), ('visit_date', True)])
+    ]
+
+    print(f"{'rows':>9}  {'sort':<34}{'keyed ms':>11}{'legacy ms':>12}{'legacy rows out':>17}")
+    print("-" * 83)
+    for size in args.sizes:
+        records = generate_records(size)
+        for label, spec in cases:
+            keyed_time, keyed_result = time_once(lambda: sort_records(records, spec))
+            assert len(keyed_result) == size
+
+            legacy_ms = '-'
+            legacy_rows = '-'
+            if size <= args.legacy_max and len(spec) == 1:
+                field, descending = spec[0]
+                order = 'desc' if descending else 'asc'
+                try:
+                    legacy_time, legacy_result = time_once(
+                        lambda: legacy_quick_sort_records(records, field, order))
+                    legacy_ms = f"{legacy_time * 1000:.1f}"
+                    # The original drops rows whose key ties with a pivot
+                    legacy_rows = str(len(legacy_result))
+                except (RecursionError, TypeError) as e:
+                    legacy_ms = type(e).__name__
+            print(f"{size:>9}  {label:<34}{keyed_time * 1000:>11.1f}{legacy_ms:>12}{legacy_rows:>17}")
+
+
+if __name__ == "__main__":
+    main()
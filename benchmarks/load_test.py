@@ -0,0 +1,340 @@
+"""Drive a weighted mix of API routes concurrently and report latency per route
+
+Usage:
+    python benchmarks/load_test.py --duration 30 --concurrency 16
+    python benchmarks/load_test.py --url http://localhost:5000/api --output results.json
+    python benchmarks/load_test.py --mix dashboard=5,book=1 --baseline results.json
+
+Without --url the requests go through Flask's test client in this process.
+Each route reports throughput, p50/p95/p99 latency, HTTP statuses and the
+database statements per request (the X-DB-Round-Trips header). --output
+saves the results as JSON and --baseline prints the change against an
+earlier file. --seed-patients/--seed-records/--seed-appointments append
+synthetic rows first, so only point them at a disposable copy. Bookings
+go to far-future slots and are deleted again at the end.
+"""
+import argparse
+import json
+import platform
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import bench_utils  # noqa: F401  (puts the project root on sys.path)
+from bench_utils import summarize
+
+from flask_app import app, db_pool, execute_query
+from benchmark_search import seed_patients, SEARCH_TERMS
+
+# Relative weight of each route in the default mix
+DEFAULT_MIX = {
+    'dashboard': 20,
+    'patients': 10,
+    'search': 15,
+    'book': 10,
+    'status': 5,
+    'records': 15,
+    'records_sorted': 5,
+    'patients_sorted': 5,
+    'appointments_sorted': 5
+}
+
+STATUSES = ['Scheduled', 'In Progress', 'Completed']
+DIAGNOSES = ['Type 2 Diabetes Mellitus', 'Hypertension (Essential)', 'Dengue Fever', 'Migraine',
+             'Bronchial Asthma', 'Viral Fever', 'Osteoarthritis']
+REASONS = ['Routine checkup', 'Follow-up visit', 'Fever and cough', 'Chest pain', 'Knee pain']
+
+
+def parse_mix(value):
+    """Parse "route=weight,..." into a dict, rejecting unknown routes"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown route {name!r}; use {', '.join(DEFAULT_MIX)}")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight for {name}: {weight!r}")
+    return mix
+
+
+def seed_rows(table, columns, make_row, count, chunk_size=5000, seed=11):
+    """Append count rows to table using chunked executemany inserts"""
+    rng = random.Random(seed)
+    connection = db_pool.acquire()
+    try:
+        cursor = connection.cursor()
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        inserted = 0
+        while inserted < count:
+            rows = [make_row(rng) for _ in range(min(chunk_size, count - inserted))]
+            cursor.executemany(query, rows)
+            connection.commit()
+            inserted += len(rows)
+            print(f"  seeded {inserted}/{count} {table}", end='\r')
+        print()
+        cursor.close()
+    finally:
+        db_pool.release(connection)
+
+
+def id_range(table, key):
+    row = execute_query(f"SELECT MIN({key}) as low, MAX({key}) as high FROM {table}", fetch_one=True)
+    if not row or row['low'] is None:
+        raise SystemExit(f"❌ No rows in {table}; seed the database first")
+    return row['low'], row['high']
+
+
+def table_sizes():
+    sizes = {}
+    for table in ('patients', 'doctors', 'appointments', 'medical_records'):
+        row = execute_query(f"SELECT COUNT(*) as count FROM {table}", fetch_one=True)
+        sizes[table] = row['count'] if row else None
+    return sizes
+
+
+def make_sender(url):
+    """Return a function sending one request and returning (status_code, body, round_trips)"""
+    local = threading.local()
+
+    if url:
+        import requests
+
+        def send(method, path, payload=None):
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+            response = local.session.request(method, f"{url}/{path}", json=payload, timeout=60)
+            body = response.json() if response.content else {}
+            return response.status_code, body, response.headers.get('X-DB-Round-Trips')
+        return send
+
+    def send(method, path, payload=None):
+        if not hasattr(local, 'client'):
+            local.client = app.test_client()
+        response = local.client.open(f"/api/{path}", method=method, json=payload)
+        return response.status_code, response.get_json(silent=True) or {}, response.headers.get('X-DB-Round-Trips')
+    return send
+
+
+class Workload:
+    """Builds the request for each route from the IDs present in the database"""
+
+    def __init__(self, patient_ids, doctor_ids, page_size):
+        self.patient_ids = patient_ids
+        self.doctor_ids = doctor_ids
+        self.page_size = page_size
+        self.lock = threading.Lock()
+        self.booked = {}  # appointment_id -> status set by this run
+
+    def request(self, route, rng):
+        """Return (route, method, path, payload) for one call of route
+
+        "status" turns into "book" until this run has booked something.
+        """
+        if route == 'dashboard':
+            return route, 'GET', 'dashboard', None
+        if route == 'patients':
+            return route, 'GET', f'patients?limit={self.page_size}', None
+        if route == 'search':
+            return route, 'POST', 'patients/search', {'search_term': rng.choice(SEARCH_TERMS)}
+        if route == 'records':
+            return route, 'GET', f'patients/{rng.randint(*self.patient_ids)}/medical-records?limit={self.page_size}', None
+        if route == 'status':
+            with self.lock:
+                if self.booked:
+                    appointment_id = rng.choice(list(self.booked))
+                    # A different status, since an update that changes nothing reports failure
+                    status = rng.choice([s for s in STATUSES if s != self.booked[appointment_id]])
+                    self.booked[appointment_id] = status
+                    return route, 'PUT', f'appointments/{appointment_id}/status', {'status': status}
+            route = 'book'  # nothing booked yet to update
+        if route == 'book':
+            # Far-future slots so real schedules are untouched
+            slot = date.today() + timedelta(days=rng.randint(3000, 6000))
+            return route, 'POST', 'appointments', {
+                'patient_id': rng.randint(*self.patient_ids),
+                'doctor_id': rng.randint(*self.doctor_ids),
+                'appointment_date': slot.isoformat(),
+                'appointment_time': f"{rng.randint(8, 17):02d}:{rng.choice(['00', '15', '30', '45'])}:00",
+                'reason': 'Load test'
+            }
+        sort_by = {
+            'records_sorted': 'visit_date',
+            'patients_sorted': 'last_name',
+            'appointments_sorted': 'appointment_date'
+        }[route]
+        endpoint = route.replace('_sorted', '/sorted')
+        return route, 'POST', endpoint, {'sort_by': sort_by, 'order': rng.choice(['asc', 'desc']), 'limit': self.page_size}
+
+    def record(self, route, status_code, body):
+        if route == 'book' and status_code == 200 and body.get('appointment_id'):
+            with self.lock:
+                self.booked[body['appointment_id']] = 'Scheduled'
+
+    def cleanup(self):
+        """Delete the appointments booked during the run"""
+        booked = list(self.booked)
+        for start in range(0, len(booked), 1000):
+            chunk = booked[start:start + 1000]
+            execute_query(f"DELETE FROM appointments WHERE appointment_id IN ({', '.join(['%s'] * len(chunk))})",
+                          tuple(chunk), fetch_all=False)
+
+
+def run_load(send, workload, mix, concurrency, duration, seed):
+    """Run the mix for duration seconds and return {route: [(latency, status, round_trips)]}"""
+    routes = list(mix)
+    weights = [mix[route] for route in routes]
+    deadline = time.perf_counter() + duration
+    results = {route: [] for route in routes}
+    results_lock = threading.Lock()
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        samples = {route: [] for route in routes}
+        while time.perf_counter() < deadline:
+            route = rng.choices(routes, weights)[0]
+            route, method, path, payload = workload.request(route, rng)
+            started = time.perf_counter()
+            try:
+                status_code, body, round_trips = send(method, path, payload)
+            except Exception as e:
+                print(f"  {route}: {e}")
+                status_code, body, round_trips = None, {}, None
+            samples[route].append((time.perf_counter() - started, status_code, round_trips))
+            workload.record(route, status_code, body)
+        with results_lock:
+            for route, route_samples in samples.items():
+                results[route].extend(route_samples)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, range(concurrency)))
+    return results
+
+
+def summarize_route(samples, elapsed):
+    summary = summarize([latency for latency, _, _ in samples])
+    round_trips = [int(value) for _, _, value in samples if value is not None]
+    summary['throughput_rps'] = len(samples) / elapsed if elapsed else 0.0
+    summary['statuses'] = {str(status): count for status, count in
+                           sorted(Counter(status for _, status, _ in samples).items(), key=str)}
+    summary['db_round_trips_mean'] = sum(round_trips) / len(round_trips) if round_trips else None
+    summary['db_round_trips_max'] = max(round_trips) if round_trips else None
+    return summary
+
+
+def print_results(results):
+    print(f"\n{'Route':<22}{'reqs':>7}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'DB trips':>10}  statuses")
+    print("=" * 100)
+    for route, summary in list(results['routes'].items()) + [('TOTAL', results['total'])]:
+        trips = summary.get('db_round_trips_mean')
+        statuses = ' '.join(f"{status}:{count}" for status, count in summary['statuses'].items())
+        print(f"{route:<22}{summary['runs']:>7}{summary['throughput_rps']:>9.1f}{summary['p50_ms']:>10.2f}"
+              f"{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}"
+              f"{(f'{trips:.1f}' if trips is not None else '-'):>10}  {statuses}")
+    print("=" * 100)
+
+
+def print_comparison(results, baseline):
+    """Print throughput and latency change per route against an earlier results file"""
+    def change(new, old):
+        if not old:
+            return '     -'
+        return f"{(new - old) / old * 100:+6.1f}%"
+
+    print(f"\nChange vs baseline ({baseline['meta'].get('started_at', '?')})")
+    print(f"{'Route':<22}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    print("-" * 62)
+    rows = list(results['routes'].items()) + [('TOTAL', results['total'])]
+    for route, summary in rows:
+        old = baseline['total'] if route == 'TOTAL' else baseline['routes'].get(route)
+        if not old:
+            continue
+        print(f"{route:<22}{change(summary['throughput_rps'], old['throughput_rps']):>10}"
+              f"{change(summary['p50_ms'], old['p50_ms']):>10}{change(summary['p95_ms'], old['p95_ms']):>10}"
+              f"{change(summary['p99_ms'], old['p99_ms']):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Flask API")
+    parser.add_argument('--url', help="API base URL of a running server, e.g. http://localhost:5000/api")
+    parser.add_argument('--duration', type=float, default=30, help="seconds to run after warm-up")
+    parser.add_argument('--warmup', type=float, default=3, help="seconds of untimed load first")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help="route=weight list, e.g. dashboard=5,book=1 (routes: %s)" % ', '.join(DEFAULT_MIX))
+    parser.add_argument('--page-size', type=int, default=100, help="limit sent to the paged and sorted routes")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--seed-patients', type=int, default=0)
+    parser.add_argument('--seed-records', type=int, default=0)
+    parser.add_argument('--seed-appointments', type=int, default=0)
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--baseline', help="earlier --output file to compare against")
+    args = parser.parse_args()
+
+    if args.seed_patients:
+        seed_patients(args.seed_patients, seed=args.seed)
+    patient_ids = id_range('patients', 'patient_id')
+    doctor_ids = id_range('doctors', 'doctor_id')
+    if args.seed_records:
+        seed_rows('medical_records', ['patient_id', 'doctor_id', 'visit_date', 'diagnosis', 'treatment', 'prescription'],
+                  lambda rng: (rng.randint(*patient_ids), rng.randint(*doctor_ids),
+                               date(2015, 1, 1) + timedelta(days=rng.randint(0, 3650)),
+                               rng.choice(DIAGNOSES), 'Medication and rest', 'Paracetamol 500mg'),
+                  args.seed_records, seed=args.seed)
+    if args.seed_appointments:
+        seed_rows('appointments', ['patient_id', 'doctor_id', 'appointment_date', 'appointment_time', 'status', 'reason'],
+                  lambda rng: (rng.randint(*patient_ids), rng.randint(*doctor_ids),
+                               date(2015, 1, 1) + timedelta(days=rng.randint(0, 3650)),
+                               f"{rng.randint(8, 17):02d}:{rng.choice(['00', '15', '30', '45'])}:00",
+                               rng.choice(['Completed', 'Cancelled']), rng.choice(REASONS)),
+                  args.seed_appointments, seed=args.seed)
+
+    send = make_sender(args.url)
+    workload = Workload(patient_ids, doctor_ids, args.page_size)
+    print(f"Mix: {', '.join(f'{route}={weight:g}' for route, weight in args.mix.items())}")
+    print(f"{args.concurrency} workers, {args.duration:g}s against {args.url or 'the in-process test client'}")
+
+    started_at = datetime.now().isoformat(timespec='seconds')
+    try:
+        if args.warmup > 0:
+            run_load(send, workload, args.mix, args.concurrency, args.warmup, args.seed + 1000)
+        started = time.perf_counter()
+        samples = run_load(send, workload, args.mix, args.concurrency, args.duration, args.seed)
+        elapsed = time.perf_counter() - started
+    finally:
+        workload.cleanup()
+
+    results = {
+        'meta': {
+            'started_at': started_at,
+            'target': args.url or 'test_client',
+            'duration_s': round(elapsed, 3),
+            'concurrency': args.concurrency,
+            'mix': args.mix,
+            'page_size': args.page_size,
+            'seed': args.seed,
+            'table_sizes': table_sizes(),
+            'python': platform.python_version()
+        },
+        'routes': {route: summarize_route(route_samples, elapsed)
+                   for route, route_samples in samples.items() if route_samples},
+        'total': summarize_route([sample for route_samples in samples.values() for sample in route_samples], elapsed)
+    }
+    print_results(results)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            print_comparison(results, json.load(f))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
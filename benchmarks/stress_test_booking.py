@@ -0,0 +1,104 @@
+"""Fire many parallel bookings at one appointment slot and check exactly one wins
+
+Usage:
+    python benchmarks/stress_test_booking.py --requests 300 --concurrency 50
+    python benchmarks/stress_test_booking.py --url http://localhost:5000/api
+
+Without --url the requests go through Flask's test client in this process.
+The booked appointment is deleted again afterwards.
+"""
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import bench_utils  # noqa: F401  (puts the project root on sys.path)
+
+from flask_app import app, execute_query
+
+
+def make_sender(url):
+    """Return a function posting one booking and returning (status_code, body)"""
+    if url:
+        import requests
+        local = threading.local()
+
+        def send(payload):
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+            response = local.session.post(f"{url}/appointments", json=payload, timeout=30)
+            return response.status_code, response.json()
+        return send
+
+    def send(payload):
+        response = app.test_client().post('/api/appointments', json=payload)
+        return response.status_code, response.get_json()
+    return send
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent booking stress test")
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--patient-id', type=int, default=1)
+    parser.add_argument('--doctor-id', type=int, default=1)
+    parser.add_argument('--url', help="API base URL of a running server, e.g. http://localhost:5000/api")
+    args = parser.parse_args()
+
+    # A slot far enough ahead that nothing real is booked there
+    slot_date = (date.today() + timedelta(days=random.randint(3000, 6000))).isoformat()
+    slot_time = f"{random.randint(8, 17):02d}:{random.choice(['00', '15', '30', '45'])}:00"
+    payload = {
+        'patient_id': args.patient_id,
+        'doctor_id': args.doctor_id,
+        'appointment_date': slot_date,
+        'appointment_time': slot_time,
+        'reason': 'Booking stress test'
+    }
+    send = make_sender(args.url)
+
+    # Line every worker up on a barrier so the requests really overlap
+    barrier = threading.Barrier(min(args.concurrency, args.requests))
+
+    def book(_):
+        try:
+            barrier.wait(timeout=10)
+        except threading.BrokenBarrierError:
+            pass
+        return send(payload)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(book, range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    statuses = Counter(status for status, _ in results)
+    booked_ids = [body.get('appointment_id') for status, body in results if status == 200]
+    rows = execute_query("""
+        SELECT appointment_id FROM appointments
+        WHERE doctor_id = %s AND appointment_date = %s AND appointment_time = %s
+        AND status IN ('Scheduled', 'In Progress')
+    """, (args.doctor_id, slot_date, slot_time)) or []
+
+    print(f"Slot {slot_date} {slot_time}, doctor {args.doctor_id}")
+    print(f"{args.requests} requests, {args.concurrency} concurrent, {elapsed:.2f}s "
+          f"({args.requests / elapsed:.0f} req/s)")
+    for status, count in sorted(statuses.items()):
+        print(f"  HTTP {status}: {count}")
+    print(f"Active appointments in the slot: {len(rows)}")
+
+    for row in rows:
+        execute_query("DELETE FROM appointments WHERE appointment_id = %s", (row['appointment_id'],), fetch_all=False)
+
+    if len(booked_ids) != 1 or len(rows) != 1:
+        raise SystemExit("❌ FAILED: the slot must be booked exactly once")
+    if set(statuses) - {200, 409}:
+        raise SystemExit("❌ FAILED: unexpected status codes")
+    print("✅ PASSED: exactly one booking won, the rest got 409 Conflict")
+
+
+if __name__ == "__main__":
+    main()
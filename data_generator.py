@@ -0,0 +1,447 @@
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+from db_backend import is_sqlite
+
+# Row counts for a fresh demo database (create_hospital_database.py)
+DEFAULT_SIZES = {
+    'doctors': 12,
+    'patients': 30,
+    'rooms': 11,
+    'appointments': 500,
+    'medical_records': 150
+}
+DEFAULT_SEED = 42
+# Rows per executemany / LOAD DATA statement; each chunk is committed
+DEFAULT_CHUNK_SIZE = 10000
+
+# Appointments span this window around today; records go back further
+APPOINTMENT_DAYS_BACK = 90
+APPOINTMENT_DAYS_AHEAD = 14
+RECORD_DAYS_BACK = 5 * 365
+
+# Columns written for each table, primary key first
+TABLE_COLUMNS = {
+    'patients': ('patient_id', 'first_name', 'last_name', 'date_of_birth', 'gender', 'phone', 'email',
+                 'address', 'emergency_contact_name', 'emergency_contact_phone', 'blood_type'),
+    'doctors': ('doctor_id', 'first_name', 'last_name', 'specialization', 'phone', 'email',
+                'license_number', 'is_active'),
+    'rooms': ('room_id', 'room_number', 'room_type', 'bed_count', 'is_occupied', 'is_active'),
+    'appointments': ('appointment_id', 'patient_id', 'doctor_id', 'appointment_date', 'appointment_time',
+                     'status', 'reason'),
+    'medical_records': ('record_id', 'patient_id', 'doctor_id', 'visit_date', 'diagnosis', 'treatment',
+                        'prescription', 'notes'),
+    'billing': ('bill_id', 'patient_id', 'appointment_id', 'amount', 'description', 'status',
+                'bill_date', 'due_date')
+}
+
+MALE_NAMES = ['Aarav', 'Vivaan', 'Aditya', 'Vihaan', 'Arjun', 'Sai', 'Reyansh', 'Ayaan', 'Krishna', 'Ishaan',
+              'Rajesh', 'Vikram', 'Karan', 'Rohit', 'Siddharth', 'Nikhil', 'Harsh', 'Manish', 'Amit', 'Rahul',
+              'Vishal', 'Suresh', 'Kunal', 'Rohan', 'Yash', 'Aryan', 'Deepak', 'Sunil', 'Ravi', 'Anil']
+FEMALE_NAMES = ['Ananya', 'Diya', 'Saanvi', 'Aadhya', 'Pari', 'Anika', 'Navya', 'Myra', 'Riya', 'Kiara',
+                'Priya', 'Sneha', 'Deepika', 'Kavya', 'Ishita', 'Aditi', 'Nisha', 'Pooja', 'Neha', 'Swati',
+                'Anjali', 'Ritu', 'Tanvi', 'Divya', 'Shruti', 'Priyanka', 'Sakshi', 'Meera', 'Sunita', 'Kavita']
+LAST_NAMES = ['Sharma', 'Patel', 'Singh', 'Reddy', 'Gupta', 'Iyer', 'Joshi', 'Nair', 'Malhotra', 'Agarwal',
+              'Kapoor', 'Bansal', 'Chopra', 'Menon', 'Sinha', 'Verma', 'Pandey', 'Saxena', 'Tiwari', 'Bhatt',
+              'Kumar', 'Mishra', 'Yadav', 'Jain', 'Rao', 'Mehta', 'Pillai', 'Chatterjee', 'Ghosh', 'Shetty']
+LOCALITIES = ['Sector 15, Noida, UP', 'Andheri West, Mumbai, MH', 'Lajpat Nagar, New Delhi',
+              'Banjara Hills, Hyderabad, TS', 'Salt Lake, Kolkata, WB', 'Koramangala, Bangalore, KA',
+              'Pune Camp, Pune, MH', 'Marine Drive, Kochi, KL', 'Sector 17, Chandigarh', 'Malviya Nagar, Jaipur, RJ',
+              'Gomti Nagar, Lucknow, UP', 'Cyber City, Gurgaon, HR', 'Satellite, Ahmedabad, GJ',
+              'T. Nagar, Chennai, TN', 'Boring Road, Patna, BR', 'Vijay Nagar, Indore, MP']
+# Blood group frequencies in India
+BLOOD_TYPES = ['O+', 'B+', 'A+', 'AB+', 'O-', 'B-', 'A-', 'AB-']
+BLOOD_TYPE_WEIGHTS = [37, 32, 22, 7, 0.8, 0.6, 0.4, 0.2]
+
+SPECIALIZATIONS = ['General Medicine', 'Pediatrics', 'Gynecology', 'Orthopedics', 'Cardiology', 'Dermatology',
+                   'Neurology', 'Psychiatry', 'Pulmonology', 'Endocrinology', 'Surgery', 'Radiology']
+SPECIALIZATION_WEIGHTS = [25, 12, 10, 9, 8, 7, 6, 5, 5, 5, 5, 3]
+
+# (diagnosis, treatment, prescription) seen by each specialization
+CASES = {
+    'General Medicine': [
+        ('Viral Hepatitis A', 'Supportive care, liver function monitoring', 'Ursodeoxycholic acid 300mg BD, Multivitamins'),
+        ('Scrub Typhus', 'Doxycycline therapy, supportive care', 'Doxycycline 100mg BD for 7 days, Paracetamol 650mg TDS'),
+        ('Hypertension (Essential)', 'Salt restriction, regular BP monitoring', 'Amlodipine 5mg OD, Telmisartan 40mg OD'),
+        ('Type 2 Diabetes Mellitus', 'Lifestyle modification, regular monitoring', 'Metformin 500mg BD, Glimepiride 2mg OD'),
+        ('Dengue Fever', 'Supportive care, platelet monitoring', 'Paracetamol 650mg TDS, Oral fluids'),
+        ('Acute Upper Respiratory Infection', 'Rest, fluids, steam inhalation', 'Paracetamol 500mg TDS, Cetirizine 10mg OD')
+    ],
+    'Pediatrics': [
+        ('Iron Deficiency Anemia', 'Iron supplementation, dietary counseling', 'Ferrous sulfate drops 3mg/kg/day, Vitamin C 25mg OD'),
+        ('Routine Immunization - MMR and Varicella', 'Vaccination as per IAP schedule', 'MMR vaccine 0.5ml SC, Varicella vaccine 0.5ml SC'),
+        ('Acute Bronchiolitis', 'Supportive care, bronchodilator therapy', 'Salbutamol nebulization 2.5mg TDS, Prednisolone 1mg/kg for 3 days')
+    ],
+    'Gynecology': [
+        ('Routine Gynecological Examination', 'Preventive screening', 'Folic acid 5mg OD, Calcium + Vitamin D supplements'),
+        ('Ovarian Cyst (Functional)', 'Conservative management, follow-up', 'Oral contraceptive pills for 3 months'),
+        ('Dysfunctional Uterine Bleeding', 'Hormonal regulation', 'Tranexamic acid 500mg TDS during menses, Iron supplements')
+    ],
+    'Orthopedics': [
+        ('Bilateral Knee Osteoarthritis Grade II', 'Physiotherapy, weight management', 'Glucosamine 1500mg OD, Paracetamol 650mg SOS'),
+        ('Right Shoulder Impingement Syndrome', 'Subacromial steroid injection, physiotherapy', 'Methylprednisolone 40mg injection, Physiotherapy exercises'),
+        ('Cervical Spondylosis with Myelopathy', 'Cervical collar, neuroprotective agents', 'Methylcobalamin 1500mcg OD, Pregabalin 75mg BD, Soft cervical collar')
+    ],
+    'Cardiology': [
+        ('Unstable Angina', 'Medical management, risk stratification', 'Aspirin 75mg, Clopidogrel 75mg, Atorvastatin 20mg, Metoprolol 12.5mg BD'),
+        ('Pulmonary Hypertension (Secondary)', 'Pulmonary vasodilator therapy', 'Sildenafil 25mg TDS, Bosentan 62.5mg BD'),
+        ('Ventricular Tachycardia (Sustained)', 'Antiarrhythmic therapy, ICD implantation', 'Amiodarone 200mg BD, ICD implantation')
+    ],
+    'Dermatology': [
+        ('Acne Vulgaris (Moderate)', 'Topical retinoids and antibiotics', 'Tretinoin 0.025% gel at night, Clindamycin 1% gel in morning'),
+        ('Seborrheic Dermatitis', 'Antifungal shampoo, topical corticosteroids', 'Ketoconazole 2% shampoo twice weekly, Fluocinolone 0.01% lotion'),
+        ('Melasma (Facial)', 'Topical depigmenting agents, sun protection', 'Hydroquinone 2% + Tretinoin 0.025% + Fluocinolone 0.01% cream')
+    ],
+    'Neurology': [
+        ('Migraine with Aura (Episodic)', 'Prophylactic therapy initiated', 'Propranolol 40mg BD, Sumatriptan 50mg SOS, Topiramate 25mg OD'),
+        ('Benign Paroxysmal Positional Vertigo', 'Canalith repositioning maneuver', 'Betahistine 16mg TDS for 1 week'),
+        ('Carpal Tunnel Syndrome (Bilateral)', 'Wrist splints, nerve conduction study', 'Pregabalin 75mg BD, Wrist splints at night')
+    ],
+    'Psychiatry': [
+        ('Generalized Anxiety Disorder', 'SSRI therapy, CBT', 'Escitalopram 10mg OD, Cognitive Behavioral Therapy'),
+        ('Panic Disorder with Agoraphobia', 'SSRI therapy, CBT', 'Sertraline 100mg OD, Cognitive Behavioral Therapy'),
+        ('Insomnia (Chronic)', 'Sleep hygiene, CBT-I', 'Melatonin 3mg at bedtime, Sleep hygiene counseling')
+    ],
+    'Pulmonology': [
+        ('Bronchial Asthma', 'Avoid triggers, regular follow-up', 'Salbutamol inhaler, Budesonide inhaler'),
+        ('Chronic Cough (Post-infectious)', 'Bronchodilators, cough suppressants', 'Montelukast 10mg OD, Dextromethorphan 15mg TDS'),
+        ('Pneumonia (Community-acquired)', 'Antibiotic therapy, chest physiotherapy', 'Amoxicillin-Clavulanate 625mg TDS, Azithromycin 500mg OD')
+    ],
+    'Endocrinology': [
+        ('Primary Hypothyroidism', 'Levothyroxine replacement therapy', 'Levothyroxine 75mcg OD on empty stomach'),
+        ('Vitamin D Deficiency', 'High-dose vitamin D supplementation', 'Cholecalciferol 60,000 IU weekly for 8 weeks'),
+        ('Hyperthyroidism (Graves Disease)', 'Antithyroid therapy, beta-blocker', 'Carbimazole 20mg BD, Propranolol 40mg BD')
+    ],
+    'Surgery': [
+        ('Acute Appendicitis', 'Laparoscopic appendectomy', 'Ceftriaxone 1g IV BD, Paracetamol 1g IV TDS'),
+        ('Inguinal Hernia (Right)', 'Laparoscopic mesh repair', 'Paracetamol 650mg TDS, Stool softener'),
+        ('Cholelithiasis', 'Laparoscopic cholecystectomy', 'Pantoprazole 40mg OD, Paracetamol 650mg SOS')
+    ],
+    'Radiology': [
+        ('Chest X-ray Review', 'Imaging interpretation', 'No medication, report sent to referring doctor'),
+        ('Abdominal Ultrasound', 'Imaging interpretation', 'No medication, follow-up scan in 6 months'),
+        ('MRI Lumbar Spine', 'Imaging interpretation', 'No medication, orthopedic referral')
+    ]
+}
+FOLLOW_UPS = ['Follow-up in 2 weeks.', 'Follow-up in 1 month.', 'Review with reports.', 'Follow-up as needed.']
+
+REASONS = ['Regular checkup', 'Follow-up visit', 'Consultation', 'Health screening', 'Medication review',
+           'Symptom evaluation', 'Fever and cough', 'Chest pain', 'Knee pain', 'Vaccination']
+
+# Clinic hours: 15-minute slots from 09:00 to 16:45
+APPOINTMENT_TIMES = [f"{9 + minutes // 60:02d}:{minutes % 60:02d}:00" for minutes in range(0, 8 * 60, 15)]
+# Relative patient volume Monday..Sunday
+WEEKDAY_VOLUME = [1.25, 1.1, 1.0, 1.0, 1.1, 0.6, 0.15]
+# Share of the usable doctor slots a run may fill
+MAX_SLOT_FILL = 0.8
+
+# (type, share of rooms, beds, chance occupied)
+ROOM_TYPES = [('General', 0.55, 4, 0.7), ('Private', 0.25, 1, 0.6), ('ICU', 0.12, 1, 0.8), ('Emergency', 0.08, 1, 0.4)]
+ROOMS_PER_FLOOR = 50
+
+CONSULTATION_FEES = [300, 500, 750, 1000, 1500]
+
+
+class SyntheticData:
+    """Seedable generator of realistic rows for every hospital table
+
+    Each method returns an iterator of row tuples in TABLE_COLUMNS order,
+    with explicit primary keys starting at ``start_id``. Output depends
+    only on the seed, ``today`` and the arguments, so a run can be
+    reproduced exactly and rows are never held in memory all at once.
+    """
+
+    def __init__(self, seed=DEFAULT_SEED, today=None):
+        self.seed = seed
+        self.today = today or date.today()
+
+    def _random(self, table, start_id):
+        # Appending to a table starts a fresh, but still reproducible, stream
+        return random.Random(f"{self.seed}:{table}:{start_id}")
+
+    def _days_before(self, days):
+        """ISO dates for today minus 0..days-1 days"""
+        ordinal = self.today.toordinal()
+        return [date.fromordinal(ordinal - offset).isoformat() for offset in range(days)]
+
+    def patients(self, count, start_id=1):
+        rng = self._random('patients', start_id)
+        rand = rng.random
+        birth_dates = self._days_before(90 * 365)
+        blood_types = rng.choices(BLOOD_TYPES, BLOOD_TYPE_WEIGHTS, k=1000)
+        # Indexing with rand() is several times cheaper than rng.choice() per column
+        names = {'Male': MALE_NAMES, 'Female': FEMALE_NAMES}
+        spouse_names = {'Male': FEMALE_NAMES, 'Female': MALE_NAMES}
+        last_count, locality_count = len(LAST_NAMES), len(LOCALITIES)
+        for patient_id in range(start_id, start_id + count):
+            gender = 'Male' if rand() < 0.5 else 'Female'
+            pool = names[gender]
+            first = pool[int(rand() * len(pool))]
+            last = LAST_NAMES[int(rand() * last_count)]
+            # Ages skew towards adults; the multiplier keeps every phone number distinct
+            yield (
+                patient_id, first, last,
+                birth_dates[int(rng.triangular(0, len(birth_dates) - 1, 35 * 365))],
+                gender,
+                f"+91-{6000000000 + patient_id * 7919 % 4000000000}",
+                f"{first.lower()}.{last.lower()}{patient_id}@email.com",
+                f"{chr(65 + patient_id % 26)}-{100 + int(rand() * 900)}, {LOCALITIES[int(rand() * locality_count)]}",
+                f"{spouse_names[gender][int(rand() * len(spouse_names[gender]))]} {last}",
+                f"+91-{9000000000 + int(rand() * 999999999)}",
+                blood_types[int(rand() * 1000)]
+            )
+
+    def doctors(self, count, start_id=1):
+        rng = self._random('doctors', start_id)
+        for doctor_id in range(start_id, start_id + count):
+            first = rng.choice(MALE_NAMES + FEMALE_NAMES)
+            last = rng.choice(LAST_NAMES)
+            # Every specialization is staffed before the weighted mix applies
+            specialization = (SPECIALIZATIONS[doctor_id - 1] if doctor_id <= len(SPECIALIZATIONS)
+                              else rng.choices(SPECIALIZATIONS, SPECIALIZATION_WEIGHTS)[0])
+            yield (
+                doctor_id, first, last, specialization,
+                f"+91-{9876500000 + doctor_id}",
+                f"dr.{first.lower()}.{last.lower()}{doctor_id}@hospital.com",
+                f"MCI{doctor_id:06d}",
+                rng.random() < 0.97
+            )
+
+    def rooms(self, count, start_id=1):
+        rng = self._random('rooms', start_id)
+        for room_id in range(start_id, start_id + count):
+            floor, number = divmod(room_id - 1, ROOMS_PER_FLOOR)
+            room_type, _, max_beds, occupancy = rng.choices(ROOM_TYPES, [share for _, share, _, _ in ROOM_TYPES])[0]
+            yield (
+                room_id, f"{floor + 1}{number + 1:02d}", room_type,
+                rng.randint(2, max_beds) if max_beds > 1 else 1,
+                rng.random() < occupancy,
+                rng.random() < 0.98
+            )
+
+    def appointments(self, count, patient_ids, doctor_ids, start_id=1, taken=frozenset(),
+                     days_back=APPOINTMENT_DAYS_BACK, days_ahead=APPOINTMENT_DAYS_AHEAD):
+        """Appointments spread over the days around today
+
+        Daily volume follows WEEKDAY_VOLUME and each doctor slot is used at
+        most once a day. Past visits are mostly completed, today's morning
+        is done and the afternoon still scheduled, future ones are booked.
+        ``taken`` holds (doctor_id, date, time) slots already active in the
+        database, which are skipped, so slightly fewer rows may come back.
+        """
+        days = [self.today + timedelta(days=offset) for offset in range(-days_back, days_ahead + 1)]
+        slots_per_day = len(doctor_ids) * len(APPOINTMENT_TIMES)
+        if count > MAX_SLOT_FILL * slots_per_day * len(days):
+            raise ValueError(f"{count} appointments do not fit {len(doctor_ids)} doctors over {len(days)} days; "
+                             "generate more doctors first")
+
+        # Largest-remainder split of count over the days, by weekday volume
+        weights = [WEEKDAY_VOLUME[day.weekday()] for day in days]
+        shares = [count * weight / sum(weights) for weight in weights]
+        per_day = [int(share) for share in shares]
+        by_remainder = sorted(range(len(days)), key=lambda index: per_day[index] - shares[index])
+        for index in by_remainder[:count - sum(per_day)]:
+            per_day[index] += 1
+        # Returned from a plain method so the check above runs before any row is written
+        return self._appointment_rows(zip(days, per_day), slots_per_day, patient_ids, doctor_ids, start_id, taken)
+
+    def _appointment_rows(self, days, slots_per_day, patient_ids, doctor_ids, start_id, taken):
+        rng = self._random('appointments', start_id)
+        rand = rng.random
+        low, high = patient_ids
+        span = high - low + 1
+        appointment_id = start_id
+        for day, booked in days:
+            day_string = day.isoformat()
+            for slot in sorted(rng.sample(range(slots_per_day), min(booked, slots_per_day))):
+                doctor_id = doctor_ids[slot // len(APPOINTMENT_TIMES)]
+                slot_time = APPOINTMENT_TIMES[slot % len(APPOINTMENT_TIMES)]
+                if day < self.today:
+                    status = 'Completed' if rand() < 0.85 else 'Cancelled'
+                elif day > self.today:
+                    status = 'Scheduled' if rand() < 0.92 else 'Cancelled'
+                elif slot_time < '12:00:00':
+                    status = 'Completed' if rand() < 0.9 else 'Cancelled'
+                else:
+                    status = 'In Progress' if slot_time < '13:00:00' else 'Scheduled'
+                patient_id = low + int(rand() * span)
+                reason = REASONS[int(rand() * len(REASONS))]
+                if status in ('Scheduled', 'In Progress') and (doctor_id, day_string, slot_time) in taken:
+                    continue
+                yield appointment_id, patient_id, doctor_id, day_string, slot_time, status, reason
+                appointment_id += 1
+
+    def medical_records(self, count, patient_ids, doctors, start_id=1, days_back=RECORD_DAYS_BACK):
+        """Visit records; doctors is a list of (doctor_id, specialization)
+
+        Lower patient IDs (longer-standing patients) get more visits.
+        """
+        rng = self._random('medical_records', start_id)
+        rand = rng.random
+        low, high = patient_ids
+        span = high - low + 1
+        visit_dates = self._days_before(days_back)
+        doctor_cases = [(doctor_id, CASES.get(specialization, CASES['General Medicine']))
+                        for doctor_id, specialization in doctors]
+        for record_id in range(start_id, start_id + count):
+            doctor_id, cases = doctor_cases[int(rand() * len(doctor_cases))]
+            diagnosis, treatment, prescription = cases[int(rand() * len(cases))]
+            notes = (f"BP: {100 + int(rand() * 60)}/{60 + int(rand() * 35)} mmHg, pulse {60 + int(rand() * 40)}/min. "
+                     f"{FOLLOW_UPS[int(rand() * len(FOLLOW_UPS))]}")
+            yield (record_id, low + int(span * rand() ** 1.5), doctor_id,
+                   visit_dates[int(rand() * days_back)], diagnosis, treatment, prescription, notes)
+
+    def billing(self, appointments, start_id=1):
+        """One bill per completed appointment, from appointments() rows"""
+        rng = self._random('billing', start_id)
+        rand = rng.random
+        overdue = (self.today - timedelta(days=30)).isoformat()
+        bill_id = start_id
+        for appointment_id, patient_id, _, day, _, status, reason in appointments:
+            if status != 'Completed':
+                continue
+            bill_date = date.fromisoformat(day)
+            if day < overdue:
+                bill_status = 'Paid' if rand() < 0.95 else 'Cancelled'
+            else:
+                bill_status = 'Paid' if rand() < 0.4 else 'Pending'
+            yield (bill_id, patient_id, appointment_id,
+                   f"{CONSULTATION_FEES[int(rand() * len(CONSULTATION_FEES))]}.00",
+                   f"Consultation - {reason}", bill_status, day, (bill_date + timedelta(days=15)).isoformat())
+            bill_id += 1
+
+
+def _tsv_field(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def _load_data_chunk(cursor, table, columns, chunk):
+    """Send one chunk through LOAD DATA LOCAL INFILE via a temporary TSV file"""
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', encoding='utf-8', newline='', delete=False) as f:
+        for row in chunk:
+            f.write('\t'.join(_tsv_field(value) for value in row) + '\n')
+    try:
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(columns)})",
+            (f.name,)
+        )
+    finally:
+        os.unlink(f.name)
+
+
+def insert_rows(connection, table, rows, chunk_size=DEFAULT_CHUNK_SIZE, load_data=False):
+    """Stream rows into table in committed chunks and return how many were written
+
+    Chunks go through executemany, which mysql-connector sends as one
+    multi-row INSERT, or with load_data=True through LOAD DATA LOCAL INFILE
+    (MySQL only; the connection needs allow_local_infile=True).
+    """
+    columns = TABLE_COLUMNS[table]
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    cursor = connection.cursor()
+    rows = iter(rows)
+    inserted = 0
+    started = time.perf_counter()
+    try:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            if load_data:
+                _load_data_chunk(cursor, table, columns, chunk)
+            else:
+                cursor.executemany(query, chunk)
+            connection.commit()
+            inserted += len(chunk)
+            print(f"  {table}: {inserted:,} rows", end='\r')
+    finally:
+        cursor.close()
+    elapsed = time.perf_counter() - started
+    print(f"✅ {inserted:,} rows inserted into {table} ({inserted / elapsed if elapsed else 0:,.0f} rows/s)")
+    return inserted
+
+
+def _next_id(cursor, table, key):
+    cursor.execute(f"SELECT COALESCE(MAX({key}), 0) + 1 FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def _active_slots(cursor):
+    """(doctor_id, date, time) of appointments currently holding their slot"""
+    cursor.execute("""
+        SELECT doctor_id, appointment_date, appointment_time FROM appointments
+        WHERE appointment_date >= CURDATE() AND status IN ('Scheduled', 'In Progress')
+    """)
+    slots = set()
+    for doctor_id, day, slot_time in cursor.fetchall():
+        if isinstance(slot_time, timedelta):
+            slot_time = f"{slot_time.seconds // 3600:02d}:{slot_time.seconds % 3600 // 60:02d}:00"
+        slots.add((doctor_id, str(day), str(slot_time)[:8]))
+    return slots
+
+
+def generate_database(connection, sizes, seed=DEFAULT_SEED, today=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE, load_data=False):
+    """Append synthetic rows to every table and return the row count per table
+
+    sizes maps table name to how many rows to add (see DEFAULT_SIZES).
+    Billing is derived from the completed appointments. Appointments and
+    records go to the patients added in this run, or to all existing
+    patients when none are added.
+    """
+    if load_data and is_sqlite():
+        raise ValueError("LOAD DATA LOCAL INFILE needs the MySQL backend")
+    generator = SyntheticData(seed, today)
+    cursor = connection.cursor()
+    counts = {}
+
+    def load(table, key, make_rows):
+        start_id = _next_id(cursor, table, key)
+        counts[table] = insert_rows(connection, table, make_rows(start_id), chunk_size, load_data)
+        return start_id
+
+    try:
+        if sizes.get('doctors'):
+            load('doctors', 'doctor_id', lambda start: generator.doctors(sizes['doctors'], start))
+        if sizes.get('rooms'):
+            load('rooms', 'room_id', lambda start: generator.rooms(sizes['rooms'], start))
+        if sizes.get('patients'):
+            first = load('patients', 'patient_id', lambda start: generator.patients(sizes['patients'], start))
+            patient_ids = (first, first + counts['patients'] - 1)
+        else:
+            cursor.execute("SELECT MIN(patient_id), MAX(patient_id) FROM patients")
+            patient_ids = cursor.fetchone()
+
+        if sizes.get('appointments') or sizes.get('medical_records'):
+            if patient_ids[0] is None:
+                raise ValueError("No patients to generate appointments or records for")
+            cursor.execute("SELECT doctor_id, specialization FROM doctors WHERE is_active = TRUE ORDER BY doctor_id")
+            doctors = cursor.fetchall()
+            if not doctors:
+                raise ValueError("No active doctors to generate appointments or records for")
+
+        if sizes.get('appointments'):
+            taken = _active_slots(cursor)
+            doctor_ids = [doctor_id for doctor_id, _ in doctors]
+
+            def appointment_rows(start):
+                return generator.appointments(sizes['appointments'], patient_ids, doctor_ids, start, taken)
+            first = load('appointments', 'appointment_id', appointment_rows)
+            # Same seed and arguments, so the stream is regenerated rather than kept in memory
+            load('billing', 'bill_id', lambda start: generator.billing(appointment_rows(first), start))
+
+        if sizes.get('medical_records'):
+            load('medical_records', 'record_id',
+                 lambda start: generator.medical_records(sizes['medical_records'], patient_ids, doctors, start))
+    finally:
+        cursor.close()
+    return counts
@@ -0,0 +1,325 @@
+import os
+import re
+import sqlite3
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+
+try:
+    import mysql.connector
+except ImportError:  # only needed for DB_BACKEND=mysql
+    mysql = None
+
+# Database backend: 'mysql' (the default, a MySQL server) or 'sqlite', an
+# embedded database file for local benchmarks and tests without a server
+BACKENDS = ['mysql', 'sqlite']
+DB_BACKEND = os.environ.get('DB_BACKEND', 'mysql').lower()
+if DB_BACKEND not in BACKENDS:
+    raise ValueError(f"DB_BACKEND must be one of {BACKENDS}, not {DB_BACKEND!r}")
+
+# MySQL connection settings (overridable through the environment)
+DB_CONFIG = {
+    'host': os.environ.get('DB_HOST', 'localhost'),
+    'database': os.environ.get('DB_NAME', 'hospital_management'),
+    'user': os.environ.get('DB_USER', 'amaanraza'),
+    'password': os.environ.get('DB_PASSWORD', 'Amaan123!'),
+    'port': int(os.environ.get('DB_PORT', 3306))
+}
+
+SQLITE_PATH = os.environ.get('SQLITE_PATH', 'hospital_management.db')
+
+# Errors raised by either backend, for except clauses
+DB_ERRORS = (mysql.connector.Error, sqlite3.Error) if mysql else (sqlite3.Error,)
+
+
+def is_sqlite():
+    return DB_BACKEND == 'sqlite'
+
+
+def connect(use_database=True, **options):
+    """Open a connection to the configured backend
+
+    ``use_database=False`` connects to the MySQL server without selecting
+    the hospital database, so it can be created. Extra options (such as
+    ``allow_local_infile``) go to mysql-connector; SQLite ignores both.
+    """
+    if is_sqlite():
+        return SQLiteConnection(SQLITE_PATH)
+    if mysql is None:
+        raise RuntimeError("DB_BACKEND=mysql needs mysql-connector-python installed")
+    config = dict(DB_CONFIG, **options)
+    if not use_database:
+        config.pop('database')
+    return mysql.connector.connect(**config)
+
+
+class SQLiteError(sqlite3.DatabaseError):
+    """sqlite3 error carrying the MySQL error code the application checks for"""
+
+    def __init__(self, msg, errno=None):
+        super().__init__(msg)
+        self.msg = msg
+        self.errno = errno
+
+
+# sqlite3 messages and the MySQL errno with the same meaning
+SQLITE_ERRNOS = [
+    (re.compile(r'UNIQUE constraint failed'), 1062),   # ER_DUP_ENTRY
+    (re.compile(r'FOREIGN KEY constraint failed'), 1452),  # ER_NO_REFERENCED_ROW_2
+    (re.compile(r'duplicate column name'), 1060),  # ER_DUP_FIELDNAME
+    (re.compile(r'index \S+ already exists'), 1061),  # ER_DUP_KEYNAME
+    (re.compile(r'trigger \S+ already exists'), 1359),  # ER_TRG_ALREADY_EXISTS
+]
+
+
+def _sqlite_error(error):
+    message = str(error)
+    for pattern, errno in SQLITE_ERRNOS:
+        if pattern.search(message):
+            return SQLiteError(message, errno)
+    return SQLiteError(message)
+
+
+# Python values sent as parameters, stored the way MySQL would return them as text
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(time, time.isoformat)
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(
+    timedelta, lambda value: '%02d:%02d:%02d' % (value.seconds // 3600 + value.days * 24,
+                                                 value.seconds % 3600 // 60, value.seconds % 60))
+
+
+# ---- MySQL to SQLite statement translation ----
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'")
+# Statements with no SQLite equivalent; they are accepted and do nothing
+_NO_OP = re.compile(r'^\s*(CREATE\s+DATABASE|DROP\s+DATABASE|USE\s|SET\s+SESSION|CREATE\s+FULLTEXT\s+INDEX)', re.I)
+# Statements after which the cursor reports lastrowid, as in mysql-connector
+_INSERT = re.compile(r'\s*(INSERT|REPLACE)\b', re.I)
+_NO_OP_STATEMENT = 'SELECT 1 WHERE 0'
+# MySQL TIME_FORMAT/DATE_FORMAT specifiers that differ in strftime
+_FORMAT_SPECIFIERS = {'%i': '%M', '%s': '%S', '%T': '%H:%M:%S'}
+_NOW_MICROSECONDS = "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+def _literal_spans(sql):
+    return [match.span() for match in _LITERAL.finditer(sql)]
+
+
+def _outside(spans, position):
+    return not any(start <= position < end for start, end in spans)
+
+
+def _rewrite_calls(sql, name, render):
+    """Replace every NAME(args) outside string literals with render(args)"""
+    pattern = re.compile(rf'\b{name}\s*\(', re.I)
+    position = 0
+    while True:
+        spans = _literal_spans(sql)
+        match = next((m for m in pattern.finditer(sql, position) if _outside(spans, m.start())), None)
+        if match is None:
+            return sql
+        args, depth, start, index = [], 1, match.end(), match.end()
+        while depth:
+            literal = next((span for span in spans if span[0] == index), None)
+            if literal:
+                index = literal[1]
+                continue
+            char = sql[index]
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif char == ',' and depth == 1:
+                args.append(sql[start:index].strip())
+                start = index + 1
+            index += 1
+        last = sql[start:index - 1].strip()
+        if last or args:
+            args.append(last)
+        replacement = render(args)
+        sql = sql[:match.start()] + replacement + sql[index:]
+        position = match.start() + len(replacement)
+
+
+def _strftime_format(literal):
+    fmt = literal[1:-1]
+    for mysql_spec, sqlite_spec in _FORMAT_SPECIFIERS.items():
+        fmt = fmt.replace(mysql_spec, sqlite_spec)
+    return f"'{fmt}'"
+
+
+def _translate_ddl(sql):
+    """Rewrite MySQL column types and table options; returns (sql, follow-up statements)"""
+    followups = []
+    table = re.search(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', sql, re.I)
+
+    sql = re.sub(r'\b(?:BIG)?INT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY', 'INTEGER PRIMARY KEY AUTOINCREMENT', sql, flags=re.I)
+    sql = re.sub(r'(\w+)\s+ENUM\s*\(([^)]*)\)', r'\1 TEXT CHECK (\1 IN (\2))', sql, flags=re.I)
+    sql = re.sub(r'DEFAULT\s+CURRENT_TIMESTAMP\(6\)', f'DEFAULT ({_NOW_MICROSECONDS})', sql, flags=re.I)
+
+    if table:
+        # ON UPDATE CURRENT_TIMESTAMP becomes a trigger that stamps the column
+        for column in re.findall(r'(\w+)\s+TIMESTAMP\b[^,]*?\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP', sql, re.I):
+            followups.append(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table.group(1)}_{column}
+                AFTER UPDATE ON {table.group(1)} FOR EACH ROW WHEN NEW.{column} = OLD.{column}
+                BEGIN UPDATE {table.group(1)} SET {column} = CURRENT_TIMESTAMP WHERE rowid = NEW.rowid; END
+            """)
+        sql = re.sub(r'\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP(?:\(\d*\))?', '', sql, flags=re.I)
+
+        # Inline INDEX definitions become CREATE INDEX statements
+        for name, columns in re.findall(r',\s*(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\)', sql, re.I):
+            followups.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table.group(1)} ({columns})")
+        sql = re.sub(r',\s*(?:INDEX|KEY)\s+\w+\s*\([^)]*\)', '', sql, flags=re.I)
+
+    if re.match(r'\s*ALTER\s+TABLE', sql, re.I):
+        # SQLite can only add virtual generated columns to an existing table
+        sql = re.sub(r'\bSTORED\b', 'VIRTUAL', sql, flags=re.I)
+
+    if re.match(r'\s*CREATE\s+TRIGGER', sql, re.I) and not re.search(r'FOR\s+EACH\s+ROW\s+BEGIN\b', sql, re.I):
+        sql = re.sub(r'(FOR\s+EACH\s+ROW)\s+(.*)$', r'\1 BEGIN \2; END', sql, flags=re.I | re.S)
+
+    return sql, followups
+
+
+@lru_cache(maxsize=1024)
+def translate_sql(sql):
+    """Translate one MySQL statement for SQLite
+
+    Returns a tuple of statements: the translated statement followed by
+    any it needs (indexes, triggers). Covers the MySQL the application
+    uses: %s placeholders, CURDATE(), NOW(), TIME_FORMAT, UNIX_TIMESTAMP,
+    FROM_UNIXTIME, IF(), CAST(... AS CHAR), INTERVAL n DAY, FOR UPDATE,
+    backslash LIKE escapes, and in DDL AUTO_INCREMENT, ENUM, ON UPDATE
+    CURRENT_TIMESTAMP, inline indexes and single-statement triggers.
+    """
+    if _NO_OP.match(sql):
+        return (_NO_OP_STATEMENT,)
+
+    followups = []
+    if re.match(r'\s*(CREATE|ALTER)\s', sql, re.I):
+        sql, followups = _translate_ddl(sql)
+
+    sql = re.sub(r'\bNOW\(\d*\)\s*-\s*INTERVAL\s+(%s|\d+)\s+DAY\b',
+                 r"STRFTIME('%Y-%m-%d %H:%M:%f', 'now', '-' || \1 || ' days')", sql, flags=re.I)
+    sql = _rewrite_calls(sql, 'TIME_FORMAT', lambda a: f"STRFTIME({_strftime_format(a[1])}, {a[0]})")
+    sql = _rewrite_calls(sql, 'DATE_FORMAT', lambda a: f"STRFTIME({_strftime_format(a[1])}, {a[0]})")
+    sql = _rewrite_calls(sql, 'UNIX_TIMESTAMP',
+                         lambda a: f"((JULIANDAY({a[0] if a else repr('now')}) - 2440587.5) * 86400.0)")
+    sql = _rewrite_calls(sql, 'FROM_UNIXTIME', lambda a: f"STRFTIME('%Y-%m-%d %H:%M:%f', {a[0]}, 'unixepoch')")
+    sql = _rewrite_calls(sql, 'CURDATE', lambda a: "DATE('now', 'localtime')")
+    sql = _rewrite_calls(sql, 'NOW', lambda a: _NOW_MICROSECONDS if a else "DATETIME('now')")
+    sql = _rewrite_calls(sql, 'IF', lambda a: f"IIF({', '.join(a)})")
+
+    # Outside string literals only: placeholders and keyword-level rewrites
+    parts = []
+    position = 0
+    for start, end in _literal_spans(sql) + [(len(sql), len(sql))]:
+        code = sql[position:start]
+        code = code.replace('%s', '?')
+        code = re.sub(r'\bAS\s+CHAR\s*\)', 'AS TEXT)', code, flags=re.I)
+        code = re.sub(r'\s+FOR\s+UPDATE\b', '', code, flags=re.I)
+        # MySQL treats backslash as the LIKE escape character by default
+        code = re.sub(r'\bLIKE\s+\?', "LIKE ? ESCAPE '\\\\'", code, flags=re.I)
+        parts.append(code + sql[start:end])
+        position = end
+    return (''.join(parts),) + tuple(followups)
+
+
+# ---- Connection and cursor with the mysql-connector interface ----
+
+def _reverse(value):
+    return None if value is None else str(value)[::-1]
+
+
+def _regexp_replace(value, pattern, replacement):
+    return None if value is None else re.sub(pattern, replacement, str(value))
+
+
+class SQLiteCursor:
+    """Cursor with the parts of the mysql-connector cursor API the app uses"""
+
+    def __init__(self, connection, dictionary=False):
+        self._connection = connection
+        self._cursor = connection.cursor()
+        self._dictionary = dictionary
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def _run(self, method, query, params):
+        statements = translate_sql(query)
+        try:
+            method(statements[0], params)
+            for statement in statements[1:]:
+                self._connection.execute(statement)
+        except sqlite3.Error as e:
+            raise _sqlite_error(e) from e
+        self.rowcount = self._cursor.rowcount
+        # sqlite3 reports the connection's last insert rowid after any
+        # statement; mysql-connector only sets it for inserts
+        self.lastrowid = self._cursor.lastrowid if _INSERT.match(query) else None
+
+    def execute(self, query, params=None):
+        self._run(self._cursor.execute, query, tuple(params or ()))
+
+    def executemany(self, query, seq_of_params):
+        self._run(self._cursor.executemany, query, [tuple(params) for params in seq_of_params])
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip((column[0] for column in self._cursor.description), row))
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self):
+        return (self._row(row) for row in self._cursor)
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """sqlite3 connection with the mysql-connector methods the app uses
+
+    Opened with check_same_thread=False because the pool hands connections
+    between threads (one thread at a time). The file uses WAL so readers do
+    not block the single writer.
+    """
+
+    def __init__(self, path):
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.create_function('REVERSE', 1, _reverse, deterministic=True)
+        self._connection.create_function('REGEXP_REPLACE', 3, _regexp_replace, deterministic=True)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._open = True
+
+    def cursor(self, dictionary=False, buffered=None, **kwargs):
+        return SQLiteCursor(self._connection, dictionary=dictionary)
+
+    def commit(self):
+        self._connection.commit()
+
+    def rollback(self):
+        self._connection.rollback()
+
+    def is_connected(self):
+        return self._open
+
+    def close(self):
+        self._open = False
+        self._connection.close()
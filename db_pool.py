@@ -0,0 +1,223 @@
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the wait timeout"""
+
+
+def default_health_check(connection):
+    """Return True if the connection is still usable"""
+    try:
+        return connection.is_connected()
+    except Exception:
+        return False
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of database connections
+
+    Connections are created lazily up to ``max_size`` and kept warm down to
+    ``min_size``. Every checkout runs ``health_check`` on the connection so a
+    socket dropped by the server is replaced transparently, and connections
+    idle for longer than ``idle_timeout`` seconds are closed by a background
+    reaper (never below ``min_size``).
+    """
+
+    def __init__(self, connect, min_size=2, max_size=10, wait_timeout=5.0,
+                 idle_timeout=300.0, reap_interval=60.0, health_check=default_health_check):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.wait_timeout = wait_timeout
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._health_check = health_check
+
+        self._condition = threading.Condition()
+        self._idle = deque()  # (connection, released_at), most recently used on the right
+        self._size = 0  # connections owned by the pool, idle or checked out
+        self._closed = False
+        self._reaper = None
+
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'discarded': 0,
+            'reaped': 0,
+            'timeouts': 0,
+            'wait_time': 0.0
+        }
+
+    def acquire(self, timeout=None):
+        """Check out a healthy connection, waiting up to ``timeout`` seconds"""
+        timeout = self.wait_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        self._start_reaper()
+
+        while True:
+            connection = None
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    if self._idle:
+                        connection, _ = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        # Reserve a slot and connect outside the lock
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f"No database connection available after {timeout:.1f}s "
+                            f"(pool size {self.max_size})")
+                    self._condition.wait(remaining)
+
+            if connection is None:
+                connection = self._create()
+                self._record_wait(started)
+                return connection
+
+            if self._health_check(connection):
+                with self._condition:
+                    self._stats['reused'] += 1
+                self._record_wait(started)
+                return connection
+
+            # Stale connection, drop it and try again
+            self._discard(connection)
+
+    def release(self, connection, discard=False):
+        """Return a connection to the pool, or close it if ``discard`` is set"""
+        if connection is None:
+            return
+
+        if not discard:
+            try:
+                # End any open transaction so the next user starts from a clean snapshot
+                connection.rollback()
+            except Exception:
+                discard = True
+
+        with self._condition:
+            if not discard and not self._closed:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+                return
+
+        self._discard(connection)
+
+    def reap_idle(self):
+        """Close connections idle longer than ``idle_timeout``, keeping ``min_size`` open"""
+        now = time.monotonic()
+        expired = []
+        with self._condition:
+            # Oldest connections sit on the left of the deque
+            while self._idle and self._size - len(expired) > self.min_size:
+                connection, released_at = self._idle[0]
+                if now - released_at < self.idle_timeout:
+                    break
+                self._idle.popleft()
+                expired.append(connection)
+            self._size -= len(expired)
+            self._stats['reaped'] += len(expired)
+            if expired:
+                self._condition.notify_all()
+
+        for connection in expired:
+            self._close_quietly(connection)
+        return len(expired)
+
+    def fill(self):
+        """Open connections until the pool holds at least ``min_size``"""
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                connection = self._create()
+            except Exception:
+                return
+            self.release(connection)
+
+    def close(self):
+        """Close every idle connection and refuse further checkouts"""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for connection in idle:
+            self._close_quietly(connection)
+
+    def stats(self):
+        """Return a snapshot of pool counters"""
+        with self._condition:
+            snapshot = dict(self._stats)
+            snapshot.update({
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'min_size': self.min_size,
+                'max_size': self.max_size
+            })
+        return snapshot
+
+    def _create(self):
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._stats['created'] += 1
+        return connection
+
+    def _discard(self, connection):
+        with self._condition:
+            self._size -= 1
+            self._stats['discarded'] += 1
+            self._condition.notify()
+        self._close_quietly(connection)
+
+    def _record_wait(self, started):
+        with self._condition:
+            self._stats['wait_time'] += time.monotonic() - started
+
+    def _start_reaper(self):
+        if self._reaper is not None or self.reap_interval <= 0:
+            return
+        with self._condition:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name='db-pool-reaper', daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._closed:
+            time.sleep(self.reap_interval)
+            try:
+                self.reap_idle()
+                self.fill()
+            except Exception as e:
+                print(f"Connection pool maintenance error: {e}")
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,105 @@
+import time
+
+# Tables a client can replicate through /api/sync/<table>: primary key and
+# the columns sent for each row
+SYNC_TABLES = {
+    'patients': {
+        'key': 'patient_id',
+        'columns': "patient_id, first_name, last_name, phone, email, date_of_birth, gender"
+    },
+    'doctors': {
+        'key': 'doctor_id',
+        'columns': "doctor_id, first_name, last_name, specialization, phone, email, is_active"
+    },
+    'appointments': {
+        'key': 'appointment_id',
+        # %S rather than %s in TIME_FORMAT so the query can take parameters
+        'columns': """appointment_id, patient_id, doctor_id, appointment_date,
+                      TIME_FORMAT(appointment_time, '%H:%i:%S') as appointment_time, status, reason"""
+    },
+    'rooms': {
+        'key': 'room_id',
+        'columns': "room_id, room_number, room_type, bed_count, is_occupied, is_active"
+    }
+}
+
+# The next token starts this many seconds before the sync ran. updated_at is
+# stamped when a statement runs, not when it commits, and only has second
+# precision, so rows at the boundary are sent again rather than missed.
+SYNC_OVERLAP_SECONDS = 5
+
+# Tombstones older than this are pruned; older tokens get a full reload
+TOMBSTONE_RETENTION_DAYS = 30
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+class SyncError(ValueError):
+    """Raised for an unknown table or a malformed since token"""
+
+
+def sync_table_config(table):
+    if table not in SYNC_TABLES:
+        raise SyncError(f'Unknown sync table. Use one of: {list(SYNC_TABLES)}')
+    return SYNC_TABLES[table]
+
+
+def parse_since_token(token):
+    """Return the epoch seconds encoded in a since token, or None for a full sync"""
+    if token is None or token == '':
+        return None
+    try:
+        since = float(token)
+    except (TypeError, ValueError):
+        raise SyncError('Invalid since token')
+    if since < 0:
+        raise SyncError('Invalid since token')
+    return since
+
+
+def make_since_token(server_time):
+    """Token for the next sync, given the database time the sync started at"""
+    return f"{max(0.0, float(server_time) - SYNC_OVERLAP_SECONDS):.6f}"
+
+
+def token_expired(since, server_time):
+    """True if tombstones for since may already have been pruned"""
+    return float(server_time) - since > TOMBSTONE_RETENTION_DAYS * 86400
+
+
+def build_changes_query(table, since):
+    """Return (sql, params) for rows inserted or updated at or after since"""
+    config = sync_table_config(table)
+    query = f"SELECT {config['columns']} FROM {table}"
+    if since is None:
+        return query + f" ORDER BY {config['key']}", ()
+    # Range scan on the updated_at index (schema migration 5)
+    return query + f" WHERE updated_at >= FROM_UNIXTIME(%s) ORDER BY {config['key']}", (since,)
+
+
+def build_tombstone_query(table, since):
+    """Return (sql, params) for keys of rows deleted at or after since"""
+    sync_table_config(table)
+    return """
+        SELECT DISTINCT row_id FROM deleted_rows
+        WHERE table_name = %s AND deleted_at >= FROM_UNIXTIME(%s)
+        ORDER BY row_id
+    """, (table, since)
+
+
+class TombstonePruner:
+    """Deletes expired tombstones at most once per PRUNE_INTERVAL_SECONDS"""
+
+    def __init__(self):
+        self._last_run = 0.0
+
+    def due(self):
+        now = time.monotonic()
+        if now - self._last_run < PRUNE_INTERVAL_SECONDS:
+            return False
+        self._last_run = now
+        return True
+
+    @staticmethod
+    def query():
+        return ("DELETE FROM deleted_rows WHERE deleted_at < NOW(6) - INTERVAL %s DAY",
+                (TOMBSTONE_RETENTION_DAYS,))
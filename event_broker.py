@@ -0,0 +1,127 @@
+import queue
+import threading
+import uuid
+from collections import deque
+
+from json_provider import dumps_bytes
+
+# A comment line is sent when no event arrives for this long, so proxies
+# keep the stream open and a client that went away is noticed
+HEARTBEAT_SECONDS = 15
+# Reconnect delay suggested to EventSource clients
+RETRY_MILLISECONDS = 3000
+
+
+def format_sse(event_id, event_type, data):
+    """Encode one event in the text/event-stream format"""
+    return f"id: {event_id}\nevent: {event_type}\ndata: {dumps_bytes(data).decode('utf-8')}\n\n"
+
+
+class Subscription:
+    """Bounded queue of events for one connected client"""
+
+    def __init__(self, queue_size):
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._lost_at = None
+
+    def offer(self, event):
+        """Queue an event without blocking; a full queue marks the client as lost"""
+        with self._lock:
+            if self._lost_at is None:
+                try:
+                    self._queue.put_nowait(event)
+                    return
+                except queue.Full:
+                    pass
+            self._lost_at = event[0]
+
+    def mark_lost(self, event_id):
+        with self._lock:
+            self._lost_at = event_id
+
+    def next_event(self, timeout):
+        """Return the next (id, type, data), or None after timeout seconds
+
+        A client that missed events gets a single "resync" event instead,
+        telling it to reload what it shows.
+        """
+        with self._lock:
+            if self._lost_at is not None:
+                while not self._queue.empty():
+                    self._queue.get_nowait()
+                event_id, self._lost_at = self._lost_at, None
+                return event_id, 'resync', {}
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBroker:
+    """In-process publish/subscribe hub behind the /api/events stream
+
+    publish() gives every event an id and hands it to each subscriber's
+    queue without ever blocking on a slow client. The last
+    ``history_size`` events are kept so a client reconnecting with
+    Last-Event-ID gets what it missed; one that is too far behind, or whose
+    ids come from before a server restart, is sent "resync". Only events
+    published by this process are seen.
+    """
+
+    def __init__(self, history_size=500, queue_size=500):
+        self.queue_size = queue_size
+        # Ids are "<run>-<n>" so ids from an earlier server run are recognised
+        self._run_id = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._history = deque(maxlen=history_size)
+        self._last_id = 0
+        self._subscribers = set()
+
+    def _event_id(self, number):
+        return f"{self._run_id}-{number}"
+
+    def _parse_event_id(self, event_id):
+        """Sequence number of an id from this run, or None"""
+        run_id, _, number = str(event_id).partition('-')
+        if run_id != self._run_id or not number.isdigit():
+            return None
+        return int(number)
+
+    def publish(self, event_type, data):
+        """Send an event to every subscriber and return its id"""
+        with self._lock:
+            self._last_id += 1
+            event = (self._event_id(self._last_id), event_type, data)
+            self._history.append((self._last_id, event))
+            for subscription in self._subscribers:
+                subscription.offer(event)
+        return event[0]
+
+    def subscribe(self, last_event_id=None):
+        """Register a client, replaying events after last_event_id if given"""
+        subscription = Subscription(self.queue_size)
+        with self._lock:
+            if last_event_id:
+                number = self._parse_event_id(last_event_id)
+                oldest = self._history[0][0] if self._history else self._last_id + 1
+                if number is None or number > self._last_id or number < oldest - 1:
+                    subscription.mark_lost(self._event_id(self._last_id))
+                else:
+                    for sequence, event in self._history:
+                        if sequence > number:
+                            subscription.offer(event)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'published': self._last_id,
+                'subscribers': len(self._subscribers),
+                'last_event_id': self._event_id(self._last_id)
+            }
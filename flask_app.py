@@ -1,39 +1,239 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, make_response, g, has_app_context, has_request_context, stream_with_context
 from flask_cors import CORS
-import mysql.connector
-from datetime import datetime, date, timedelta
+from datetime import date, datetime, timezone, time as time_of_day
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
+import hashlib
 import json
 import os
+import threading
+import time
+
+import db_backend
+from db_pool import ConnectionPool
+from json_provider import FastJSONProvider, dumps_bytes
+from pagination import PaginationError, parse_limit, build_page_query, build_page
+from record_sort import SortSpecError, parse_sort_spec, sort_records
+from order_by import OrderByBuilder
+from patient_search import SearchError, DEFAULT_RESULT_LIMIT, build_search_query, parse_result_limit
+from delta_sync import (SyncError, SYNC_OVERLAP_SECONDS, TombstonePruner, sync_table_config,
+                        parse_since_token, make_since_token, token_expired, build_changes_query,
+                        build_tombstone_query)
+from patient_import import (PatientImportError, PATIENT_IMPORT_FIELDS, missing_required_field,
+                            detect_format, parse_chunk_size, iter_patient_batches)
+from event_broker import EventBroker, HEARTBEAT_SECONDS, RETRY_MILLISECONDS, format_sse
+from sql_metrics import SqlInstrumentation, RequestStats, CallbackMetric, BACKGROUND
+from statement_cache import StatementCacheRegistry, CachedStatementCursor
 
 app = Flask(__name__)
+# ISO dates, HH:MM:SS times and DECIMAL amounts in every JSON response
+app.json = FastJSONProvider(app)
 CORS(app)
 
-# Database configuration
-DB_CONFIG = {
-    'host': 'localhost',
-    'database': 'hospital_management',
-    'user': 'amaanraza',
-    'password': 'Amaan123!',
-    'port': 3306
+# Connection pool configuration (overridable through the environment)
+POOL_CONFIG = {
+    'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+    'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+    'wait_timeout': float(os.environ.get('DB_POOL_WAIT_TIMEOUT', 5)),
+    'idle_timeout': float(os.environ.get('DB_POOL_IDLE_TIMEOUT', 300)),
+    'reap_interval': float(os.environ.get('DB_POOL_REAP_INTERVAL', 60))
 }
 
+# Connections come from the backend chosen in db_backend (DB_BACKEND=mysql|sqlite)
+db_pool = ConnectionPool(db_backend.connect, **POOL_CONFIG)
+
+# Prepared statements kept per pooled connection (0 sends every statement as text)
+statement_caches = StatementCacheRegistry(int(os.environ.get('STATEMENT_CACHE_SIZE', 64)))
+
+# Statements taking at least SLOW_QUERY_MS go to the slow-query log at
+# SLOW_QUERY_LOG (stderr when unset); a negative threshold disables it
+sql_metrics = SqlInstrumentation(
+    slow_query_ms=float(os.environ.get('SLOW_QUERY_MS', 200)),
+    slow_query_log=os.environ.get('SLOW_QUERY_LOG', '')
+)
+
 def get_db_connection():
-    """Get database connection"""
+    """Get a pooled database connection
+
+    Inside an app context the connection is checked out once and reused for
+    the rest of the request; it goes back to the pool on teardown.
+    """
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        return connection
+        if has_app_context():
+            if 'db_connection' not in g:
+                g.db_connection = acquire_connection()
+            return g.db_connection
+        return acquire_connection()
     except Exception as e:
         print(f"Database connection error: {e}")
         return None
 
-def execute_query(query, params=None, fetch_one=False, fetch_all=True):
-    """Execute database query"""
+def release_db_connection(connection, discard=False):
+    """Hand a connection back to the pool unless it belongs to the current request"""
+    if connection is None:
+        return
+    if has_app_context() and g.get('db_connection') is connection:
+        if discard:
+            g.pop('db_connection')
+            db_pool.release(connection, discard=True)
+        return
+    db_pool.release(connection, discard=discard)
+
+class InstrumentedCursor:
+    """Cursor wrapper that times each statement and counts the rows fetched
+    
+    Statements are recorded against the current request (Server-Timing,
+    X-DB-Round-Trips) and in the process-wide metrics; outside a request
+    they only reach the metrics, under the 'background' endpoint.
+    """
+    
+    def __init__(self, cursor):
+        self._cursor = cursor
+    
+    def _run(self, method, query, params, many, kwargs):
+        started = time.perf_counter()
+        try:
+            result = method(query, params, **kwargs)
+        except Exception:
+            sql_metrics.record_statement(request_sql_stats(), metrics_endpoint(), query, params,
+                                         time.perf_counter() - started, many, failed=True)
+            raise
+        sql_metrics.record_statement(request_sql_stats(), metrics_endpoint(), query, params,
+                                     time.perf_counter() - started, many)
+        return result
+    
+    def execute(self, query, params=(), **kwargs):
+        return self._run(self._cursor.execute, query, params, False, kwargs)
+    
+    def executemany(self, query, seq_params, **kwargs):
+        # mysql-connector sends a multi-row INSERT as one statement
+        return self._run(self._cursor.executemany, query, seq_params, True, kwargs)
+    
+    def _fetched(self, rows, started):
+        sql_metrics.record_fetch(request_sql_stats(), metrics_endpoint(), rows, time.perf_counter() - started)
+    
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(0 if row is None else 1, started)
+        return row
+    
+    def fetchmany(self, *args, **kwargs):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._fetched(len(rows), started)
+        return rows
+    
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(len(rows), started)
+        return rows
+    
+    def __iter__(self):
+        return iter(self._cursor)
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+def request_sql_stats():
+    """SQL stats of the current request, or None outside a request"""
+    if not has_request_context():
+        return None
+    if 'sql_stats' not in g:
+        g.sql_stats = RequestStats()
+    return g.sql_stats
+
+def metrics_endpoint():
+    """Endpoint label for metrics recorded now"""
+    if not has_request_context():
+        return BACKGROUND
+    return request.endpoint or 'unmatched'
+
+def open_cursor(connection, prepared=False, **kwargs):
+    """connection.cursor(**kwargs), with its statements recorded for the current request
+    
+    With prepared=True statements go through the connection's prepared
+    statement cache instead, on a buffered dictionary cursor.
+    """
+    if prepared and statement_caches.enabled:
+        return InstrumentedCursor(CachedStatementCursor(statement_caches.for_connection(connection)))
+    return InstrumentedCursor(connection.cursor(**kwargs))
+
+def acquire_connection():
+    """db_pool.acquire(), with the wait recorded for the current request"""
+    started = time.perf_counter()
+    connection = db_pool.acquire()
+    sql_metrics.record_acquire(request_sql_stats(), time.perf_counter() - started)
+    return connection
+
+def pool_connection_counts():
+    stats = db_pool.stats()
+    return {('idle',): stats['idle'], ('in_use',): stats['in_use']}
+
+def pool_timeout_count():
+    return {(): db_pool.stats()['timeouts']}
+
+def statement_cache_lookups():
+    stats = statement_caches.stats()
+    return {('hit',): stats['hits'], ('miss',): stats['misses']}
+
+def statement_cache_evictions():
+    return {(): statement_caches.stats()['evictions']}
+
+sql_metrics.registry.add(CallbackMetric('hospital_db_pool_connections', "Pooled connections by state",
+                                        pool_connection_counts, ('state',)))
+sql_metrics.registry.add(CallbackMetric('hospital_db_pool_timeouts_total', "Acquires that gave up waiting",
+                                        pool_timeout_count, kind='counter'))
+sql_metrics.registry.add(CallbackMetric('hospital_db_statement_cache_lookups_total',
+                                        "Prepared statement cache lookups by result",
+                                        statement_cache_lookups, ('result',), kind='counter'))
+sql_metrics.registry.add(CallbackMetric('hospital_db_statement_cache_evictions_total',
+                                        "Prepared statements closed to make room",
+                                        statement_cache_evictions, kind='counter'))
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def add_sql_timing_headers(response):
+    """Report the request's SQL work in Server-Timing and X-DB-Round-Trips
+    
+    Streamed responses only include the statements run before streaming
+    began, and work handed to other threads is not included.
+    """
+    stats = g.get('sql_stats') or RequestStats()
+    elapsed = time.perf_counter() - g.get('request_started', time.perf_counter())
+    response.headers['X-DB-Round-Trips'] = str(stats.queries)
+    response.headers['Server-Timing'] = stats.server_timing(elapsed)
+    # Let the GUI read Server-Timing across origins, as CORS already allows
+    response.headers['Timing-Allow-Origin'] = '*'
+    sql_metrics.record_request(metrics_endpoint(), request.method, response.status_code, elapsed, stats)
+    return response
+
+@app.teardown_appcontext
+def close_db_connection(exception):
+    """Return the request's connection to the pool"""
+    connection = g.pop('db_connection', None)
+    if connection is not None:
+        db_pool.release(connection)
+
+def execute_query(query, params=None, fetch_one=False, fetch_all=True, prepared=False):
+    """Execute database query
+
+    prepared=True runs it through the connection's prepared statement cache;
+    use it for hot statements whose SQL text is fixed, not for SQL built per
+    request (IN lists, search terms, keyset pages).
+    """
     connection = get_db_connection()
     if not connection:
         return None
     
+    cursor = None
     try:
-        cursor = connection.cursor(dictionary=True, buffered=True)
+        cursor = open_cursor(connection, prepared=prepared, dictionary=True, buffered=True)
         cursor.execute(query, params or ())
         
         if query.strip().upper().startswith('SELECT'):
@@ -48,30 +248,212 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=True):
             result = cursor.lastrowid if cursor.lastrowid else cursor.rowcount
         
         cursor.close()
-        connection.close()
+        release_db_connection(connection)
         return result
         
     except Exception as e:
         print(f"Query execution error: {e}")
-        if connection:
-            connection.close()
+        if cursor:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        try:
+            connection.rollback()
+            release_db_connection(connection)
+        except Exception:
+            release_db_connection(connection, discard=True)
+        return None
+
+class DatabaseUnavailableError(Exception):
+    """Raised when no database connection can be obtained"""
+
+@contextmanager
+def transaction(prepared=False):
+    """Run several statements as one transaction on one connection
+
+    Yields a dictionary cursor. Commits when the block completes and rolls
+    back if it raises. Inside a request this uses the request's connection.
+    prepared=True sends the block's statements through the prepared statement
+    cache, as in execute_query.
+    """
+    connection = get_db_connection()
+    if not connection:
+        raise DatabaseUnavailableError('Database connection unavailable')
+    
+    discard = False
+    cursor = None
+    try:
+        # End any implicit read transaction so the block starts from a fresh snapshot
+        connection.commit()
+        cursor = open_cursor(connection, prepared=prepared, dictionary=True, buffered=True)
+        yield cursor
+        connection.commit()
+    except Exception:
+        try:
+            connection.rollback()
+        except Exception:
+            discard = True
+        raise
+    finally:
+        if cursor:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        release_db_connection(connection, discard=discard)
+
+def is_duplicate_key_error(error):
+    """True if error is a unique constraint violation"""
+    return getattr(error, 'errno', None) == 1062
+
+def is_foreign_key_error(error):
+    """True if error is a foreign key violation on insert/update"""
+    return getattr(error, 'errno', None) == 1452
+
+def get_page_args(source):
+    """Return (limit, cursor) if the client asked for a keyset page, otherwise None"""
+    if source.get('limit') in (None, '') and not source.get('after'):
         return None
+    return parse_limit(source.get('limit')), source.get('after') or None
+
+def fetch_keyset_page(base_query, conditions, params, order_columns, cursor_fields, page_args):
+    """Run one keyset page of base_query and return (rows, pagination info)
+
+    ``order_columns`` are (sql_expression, descending) pairs ending with a
+    unique key; ``cursor_fields`` are the matching keys of the result rows.
+    """
+    limit, cursor = page_args
+    query, query_params = build_page_query(base_query, conditions, params, order_columns, limit, cursor)
+    rows = execute_query(query, query_params)
+    return build_page(rows, limit, cursor_fields)
+
+# Rows fetched from the server per round trip while streaming an export
+STREAM_FETCH_SIZE = 500
+
+def wants_ndjson(source):
+    """True if the client asked for a streamed NDJSON export"""
+    if source.get('format') == 'ndjson':
+        return True
+    return request.accept_mimetypes.best == 'application/x-ndjson'
 
-# Custom JSON encoder for date and time objects
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        elif isinstance(obj, timedelta):
-            # Convert timedelta to string format (HH:MM:SS)
-            total_seconds = int(obj.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        return super().default(obj)
-
-app.json_encoder = DateTimeEncoder
+def stream_query_rows(query, params=None, fetch_size=STREAM_FETCH_SIZE):
+    """Run a query on an unbuffered cursor and return a generator of row batches
+
+    The connection comes straight from the pool rather than from the
+    request, and the query is executed before returning so connection and
+    SQL errors still surface as a normal error response. Rows are pulled
+    from the server fetch_size at a time, so memory stays flat however large
+    the result is. If the client goes away mid-stream the unread result set
+    leaves the connection unusable, so it is discarded instead of reused.
+    """
+    connection = acquire_connection()
+    try:
+        cursor = open_cursor(connection, dictionary=True)
+        cursor.execute(query, params or ())
+    except Exception:
+        db_pool.release(connection, discard=True)
+        raise
+    
+    def generate():
+        finished = False
+        try:
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield rows
+            cursor.close()
+            finished = True
+        finally:
+            db_pool.release(connection, discard=not finished)
+    
+    return generate()
+
+def ndjson_response(row_batches):
+    """Stream row batches to the client as NDJSON, one object per line"""
+    def generate():
+        for rows in row_batches:
+            yield b''.join(dumps_bytes(row) + b'\n' for row in rows)
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
+# Tables whose updated_at high-water mark can back an ETag
+VERSIONED_TABLES = ('patients', 'doctors', 'appointments', 'medical_records', 'rooms', 'billing')
+
+def table_version(*tables):
+    """Return (token, last_modified) describing the current state of tables
+
+    The token combines MAX(updated_at) and COUNT(*) of every table, so inserts
+    and updates (updated_at) as well as deletes (count) change it, plus the
+    database date for endpoints built on CURDATE(). Returns None when the
+    database cannot be reached, or while the newest change is less than
+    SYNC_OVERLAP_SECONDS old: updated_at has one-second precision and is set
+    before commit, so a further write in that window may not move the token.
+    """
+    columns = ['CURDATE() as today', 'UNIX_TIMESTAMP(NOW(6)) as server_time']
+    for table in tables:
+        if table not in VERSIONED_TABLES:
+            raise ValueError(f"Unknown versioned table: {table}")
+        columns.append(f"(SELECT UNIX_TIMESTAMP(MAX(updated_at)) FROM {table}) as {table}_modified")
+        columns.append(f"(SELECT COUNT(*) FROM {table}) as {table}_count")
+    
+    row = execute_query('SELECT ' + ', '.join(columns), fetch_one=True, prepared=True)
+    if not row:
+        return None
+    
+    server_time = float(row.pop('server_time'))
+    modified = [float(row[f'{table}_modified']) for table in tables if row[f'{table}_modified'] is not None]
+    if modified and max(modified) > server_time - SYNC_OVERLAP_SECONDS:
+        return None
+    
+    token = '|'.join(str(value) for value in row.values())
+    last_modified = datetime.fromtimestamp(max(modified), timezone.utc) if modified else None
+    return token, last_modified
+
+def conditional_get(get_version):
+    """Answer GET requests with 304 Not Modified while the client's copy is current
+
+    ``get_version`` returns (token, last_modified) for the data behind the
+    view, or None if it is unknown or not yet stable. It runs before the view, so a change
+    racing with the request can only make the ETag older than the body and
+    the client refetches next time. The ETag also covers the query string.
+    If-None-Match takes precedence over If-Modified-Since, which cannot see
+    deleted rows.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET' or wants_ndjson(request.args):
+                return view(*args, **kwargs)
+            
+            version = get_version()
+            if version is None:
+                return view(*args, **kwargs)
+            token, last_modified = version
+            etag = hashlib.sha1(f"{request.full_path}|{token}".encode('utf-8')).hexdigest()
+            
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains_weak(etag)
+            else:
+                not_modified = (last_modified is not None and request.if_modified_since is not None
+                                and last_modified.replace(microsecond=0) <= request.if_modified_since)
+            
+            if not_modified:
+                response = app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag, weak=True)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            # Clients may keep the body but must revalidate before using it
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
 
 # API Routes
 
@@ -80,87 +462,175 @@ def test_connection():
     """Test API connection"""
     return jsonify({'status': 'success', 'message': 'Flask API is running'})
 
+# Dashboard queries: every counter in one statement, today's list in a second one
+DASHBOARD_COUNTS_QUERY = """
+    SELECT (SELECT COUNT(*) FROM patients) as patient_count,
+           (SELECT COUNT(*) FROM doctors WHERE is_active = TRUE) as doctor_count,
+           (SELECT COUNT(*) FROM rooms WHERE is_occupied = FALSE AND is_active = TRUE) as available_rooms,
+           CAST(CURDATE() AS CHAR) as today
+"""
+
+TODAY_APPOINTMENTS_QUERY = """
+    SELECT a.appointment_id, TIME_FORMAT(a.appointment_time, '%H:%i:%s') as appointment_time, 
+           a.status, a.reason,
+           p.first_name, p.last_name,
+           d.first_name as doctor_first_name, d.last_name as doctor_last_name
+    FROM appointments a
+    JOIN patients p ON a.patient_id = p.patient_id
+    JOIN doctors d ON a.doctor_id = d.doctor_id
+    WHERE a.appointment_date = CURDATE()
+    ORDER BY a.appointment_time
+"""
+
+dashboard_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='dashboard')
+
+def load_dashboard_data(concurrent=False):
+    """Collect dashboard counters and today's appointments
+
+    The counters come back from a single statement. With ``concurrent`` the
+    counters and the appointment list run in parallel on two pooled
+    connections instead of one after the other.
+    """
+    if concurrent:
+        counts_future = dashboard_executor.submit(execute_query, DASHBOARD_COUNTS_QUERY, fetch_one=True)
+        today_appointments = execute_query(TODAY_APPOINTMENTS_QUERY, prepared=True)
+        counts = counts_future.result()
+    else:
+        counts = execute_query(DASHBOARD_COUNTS_QUERY, fetch_one=True, prepared=True)
+        today_appointments = execute_query(TODAY_APPOINTMENTS_QUERY, prepared=True)
+    
+    counts = counts or {}
+    today_appointments = today_appointments or []
+    return {
+        'patient_count': counts.get('patient_count') or 0,
+        'doctor_count': counts.get('doctor_count') or 0,
+        'appointment_count': len(today_appointments),
+        'available_rooms': counts.get('available_rooms') or 0,
+        'today': counts.get('today'),
+        'today_appointments': today_appointments
+    }
+
 @app.route('/api/dashboard', methods=['GET'])
+@conditional_get(lambda: table_version('patients', 'doctors', 'rooms', 'appointments'))
 def get_dashboard_data():
     """Get dashboard statistics"""
     try:
-        # Patient count
-        patient_count = execute_query("SELECT COUNT(*) as count FROM patients", fetch_one=True)
-        
-        # Doctor count
-        doctor_count = execute_query("SELECT COUNT(*) as count FROM doctors WHERE is_active = TRUE", fetch_one=True)
-        
-        # Today's appointments
-        today_appointments = execute_query("""
-            SELECT TIME_FORMAT(a.appointment_time, '%H:%i:%s') as appointment_time, 
-                   a.status, a.reason,
-                   p.first_name, p.last_name,
-                   d.first_name as doctor_first_name, d.last_name as doctor_last_name
-            FROM appointments a
-            JOIN patients p ON a.patient_id = p.patient_id
-            JOIN doctors d ON a.doctor_id = d.doctor_id
-            WHERE a.appointment_date = CURDATE()
-            ORDER BY a.appointment_time
-        """)
-        
-        # Available rooms
-        available_rooms = execute_query("SELECT COUNT(*) as count FROM rooms WHERE is_occupied = FALSE AND is_active = TRUE", fetch_one=True)
+        concurrent = request.args.get('concurrent', '').lower() in ('1', 'true', 'yes')
         
         return jsonify({
             'status': 'success',
-            'data': {
-                'patient_count': patient_count['count'] if patient_count else 0,
-                'doctor_count': doctor_count['count'] if doctor_count else 0,
-                'appointment_count': len(today_appointments) if today_appointments else 0,
-                'available_rooms': available_rooms['count'] if available_rooms else 0,
-                'today_appointments': today_appointments or []
-            }
+            'data': load_dashboard_data(concurrent=concurrent)
         })
         
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/patients', methods=['GET'])
+@conditional_get(lambda: table_version('patients'))
 def get_patients():
-    """Get all patients"""
+    """Get all patients, or one page of them when limit/after is given"""
     try:
-        patients = execute_query("""
+        base_query = """
             SELECT patient_id, first_name, last_name, phone, email, date_of_birth, gender
-            FROM patients 
-            ORDER BY first_name, last_name
-        """)
+            FROM patients
+        """
+        page_args = get_page_args(request.args)
+        
+        if wants_ndjson(request.args):
+            if page_args:
+                return jsonify({'status': 'error', 'message': 'format=ndjson streams every row; drop limit/after'}), 400
+            return ndjson_response(stream_query_rows(base_query + " ORDER BY first_name, last_name, patient_id"))
+        
+        if page_args:
+            patients, pagination = fetch_keyset_page(
+                base_query, [], [],
+                [('first_name', False), ('last_name', False), ('patient_id', False)],
+                ['first_name', 'last_name', 'patient_id'],
+                page_args)
+            return jsonify({
+                'status': 'success',
+                'data': patients,
+                'pagination': pagination
+            })
+        
+        patients = execute_query(base_query + " ORDER BY first_name, last_name", prepared=True)
         
         return jsonify({
             'status': 'success',
             'data': patients or []
         })
         
+    except PaginationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+# Search strategy for /api/patients/search. When unset it is 'fulltext' if
+# schema migrations 3 and 7 (the search indexes) have been applied and 'like'
+# otherwise, and always 'like' on SQLite, which has no MATCH ... AGAINST.
+# The check runs on the first search; restart the API after migrating.
+PATIENT_SEARCH_MODE = os.environ.get('PATIENT_SEARCH_MODE')
+SEARCH_INDEX_MIGRATIONS = (3, 7)
+# MySQL error for a missing table (schema_migrations before any migration)
+ER_NO_SUCH_TABLE = 1146
+
+detected_search_mode = None
+
+def patient_search_mode():
+    """PATIENT_SEARCH_MODE, or the best mode the database schema supports"""
+    global detected_search_mode
+    if PATIENT_SEARCH_MODE:
+        return PATIENT_SEARCH_MODE
+    if detected_search_mode is None:
+        if db_backend.is_sqlite():
+            detected_search_mode = 'like'
+        else:
+            try:
+                with transaction() as cursor:
+                    cursor.execute("SELECT COUNT(*) as applied FROM schema_migrations WHERE version IN (%s, %s)",
+                                   SEARCH_INDEX_MIGRATIONS)
+                    applied = cursor.fetchone()['applied'] == len(SEARCH_INDEX_MIGRATIONS)
+            except db_backend.DB_ERRORS as e:
+                if getattr(e, 'errno', None) != ER_NO_SUCH_TABLE:
+                    raise
+                applied = False
+            detected_search_mode = 'fulltext' if applied else 'like'
+            if not applied:
+                print(f"⚠️ Schema migrations {SEARCH_INDEX_MIGRATIONS} not applied, patient search uses 'like'")
+    return detected_search_mode
+
+def search_patient_rows(search_term, limit=DEFAULT_RESULT_LIMIT, mode=None):
+    """Run a ranked patient search and return at most limit rows
+
+    Database errors are raised rather than returned as an empty result.
+    """
+    query, params = build_search_query(search_term, limit, mode or patient_search_mode())
+    with transaction() as cursor:
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
 @app.route('/api/patients/search', methods=['POST'])
 def search_patients():
-    """Search patients"""
+    """Search patients by name, email or phone number"""
     try:
-        data = request.get_json()
+        data = request.get_json() or {}
         search_term = data.get('search_term', '')
         
         if not search_term:
             return jsonify({'status': 'error', 'message': 'Search term is required'}), 400
         
-        search_pattern = f"%{search_term}%"
-        patients = execute_query("""
-            SELECT patient_id, first_name, last_name, phone, email, date_of_birth
-            FROM patients 
-            WHERE first_name LIKE %s OR last_name LIKE %s OR phone LIKE %s OR email LIKE %s
-            ORDER BY first_name, last_name
-        """, (search_pattern, search_pattern, search_pattern, search_pattern))
+        limit = parse_result_limit(data.get('limit'))
+        patients = search_patient_rows(search_term, limit)
         
         return jsonify({
             'status': 'success',
-            'data': patients or []
+            'data': patients
         })
         
+    except SearchError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except DatabaseUnavailableError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
@@ -171,10 +641,9 @@ def add_patient():
         data = request.get_json()
         
         # Validate required fields
-        required_fields = ['first_name', 'last_name', 'date_of_birth', 'gender']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'status': 'error', 'message': f'{field} is required'}), 400
+        field = missing_required_field(data)
+        if field:
+            return jsonify({'status': 'error', 'message': f'{field} is required'}), 400
         
         # Insert patient
         patient_id = execute_query("""
@@ -189,9 +658,10 @@ def add_patient():
             data.get('email'),
             data.get('address'),
             data.get('blood_type')
-        ), fetch_all=False)
+        ), fetch_all=False, prepared=True)
         
         if patient_id:
+            event_broker.publish('patients_added', {'count': 1})
             return jsonify({
                 'status': 'success',
                 'message': 'Patient registered successfully',
@@ -203,85 +673,547 @@ def add_patient():
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+PATIENT_INSERT_QUERY = f"""
+    INSERT INTO patients ({', '.join(PATIENT_IMPORT_FIELDS)})
+    VALUES ({', '.join(['%s'] * len(PATIENT_IMPORT_FIELDS))})
+"""
+
+def insert_patient_batch(batch):
+    """Insert one import chunk; returns (imported count, [(line, message)] failures)
+
+    The chunk goes in with a single executemany in one transaction. If the
+    database rejects it, the rows are retried one by one so only the bad
+    rows are reported and the rest of the chunk is still imported.
+    """
+    try:
+        with transaction() as cursor:
+            cursor.executemany(PATIENT_INSERT_QUERY, [params for _, params in batch])
+        return len(batch), []
+    except DatabaseUnavailableError:
+        raise
+    except Exception:
+        pass
+    
+    imported = 0
+    failures = []
+    for line_number, params in batch:
+        try:
+            with transaction() as cursor:
+                cursor.execute(PATIENT_INSERT_QUERY, params)
+            imported += 1
+        except DatabaseUnavailableError:
+            raise
+        except Exception as e:
+            failures.append((line_number, str(e)))
+    return imported, failures
+
+@app.route('/api/patients/import', methods=['POST'])
+def import_patients():
+    """Import patients from a streamed CSV or NDJSON body
+
+    CSV needs a header row naming the patient columns; NDJSON has one
+    object per line. Rows are validated as they are read and inserted in
+    chunks of ``chunk_size``. The response is NDJSON as well: a "rejected"
+    line per bad row, a "progress" line per chunk and a final "summary".
+    """
+    try:
+        import_format = detect_format(request.args.get('format'), request.content_type)
+        chunk_size = parse_chunk_size(request.args.get('chunk_size'))
+    except PatientImportError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    
+    stream = request.stream
+    
+    def generate():
+        counts = {'processed': 0, 'imported': 0, 'rejected': 0}
+        started = time.perf_counter()
+        status = 'success'
+        message = None
+        try:
+            for batch, rejected in iter_patient_batches(stream, import_format, chunk_size):
+                if batch:
+                    imported, failures = insert_patient_batch(batch)
+                    rejected = sorted(rejected + failures)
+                    counts['imported'] += imported
+                counts['rejected'] += len(rejected)
+                counts['processed'] = counts['imported'] + counts['rejected']
+                for line_number, reason in rejected:
+                    yield json.dumps({'event': 'rejected', 'line': line_number, 'message': reason}) + '\n'
+                yield json.dumps(dict(counts, event='progress')) + '\n'
+        except Exception as e:
+            status = 'error'
+            message = str(e)
+        
+        if counts['imported']:
+            event_broker.publish('patients_added', {'count': counts['imported']})
+        summary = dict(counts, event='summary', status=status,
+                       elapsed_seconds=round(time.perf_counter() - started, 3))
+        if message:
+            summary['message'] = message
+        yield json.dumps(summary) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+class DoctorCache:
+    """In-process cache of the active doctors
+
+    Doctors change a few times a month, so the ordered active list and an
+    id -> row map are loaded with one query and served from memory until
+    ``ttl`` seconds pass or invalidate() is called. Anything that writes to
+    the doctors table must call invalidate_doctor_cache(). Cached rows are
+    shared between requests and must be treated as read-only.
+    """
+    
+    def __init__(self, loader, ttl=300):
+        self._loader = loader
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._doctors = None
+        self._by_id = {}
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._version = None
+        self._version_source = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def _snapshot(self):
+        with self._lock:
+            if self._doctors is not None and time.monotonic() - self._loaded_at < self.ttl:
+                self.hits += 1
+                return self._doctors, self._by_id
+            self.misses += 1
+            generation = self._generation
+        
+        doctors = self._loader()
+        if doctors is None:
+            # Database error: serve stale data if there is any, never cache the failure
+            with self._lock:
+                return self._doctors or [], self._by_id
+        
+        by_id = {doctor['doctor_id']: doctor for doctor in doctors}
+        with self._lock:
+            # Skip the store if an invalidation happened while loading
+            if generation == self._generation:
+                self._doctors = doctors
+                self._by_id = by_id
+                self._loaded_at = time.monotonic()
+        return doctors, by_id
+    
+    def active_doctors(self):
+        """Active doctors ordered by specialization and name"""
+        return self._snapshot()[0]
+    
+    def get(self, doctor_id):
+        """Return the active doctor row for doctor_id, or None"""
+        try:
+            doctor_id = int(doctor_id)
+        except (TypeError, ValueError):
+            return None
+        return self._snapshot()[1].get(doctor_id)
+    
+    def version(self):
+        """(token, None) for conditional GETs: a hash of the cached list
+
+        Derived from the cached snapshot rather than the doctors table so the
+        ETag changes exactly when the served list does, TTL reloads included.
+        """
+        doctors = self.active_doctors()
+        with self._lock:
+            if self._version_source is not doctors:
+                self._version = hashlib.sha1(dumps_bytes(doctors)).hexdigest()
+                self._version_source = doctors
+            return self._version, None
+    
+    def invalidate(self):
+        with self._lock:
+            self._doctors = None
+            self._by_id = {}
+            self._generation += 1
+            self.invalidations += 1
+    
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'invalidations': self.invalidations,
+                'cached_doctors': len(self._by_id),
+                'age_seconds': round(time.monotonic() - self._loaded_at, 1) if self._doctors is not None else None,
+                'ttl_seconds': self.ttl
+            }
+
+def load_active_doctors():
+    """Load every active doctor for the cache"""
+    return execute_query("""
+        SELECT doctor_id, first_name, last_name, specialization, phone, email
+        FROM doctors 
+        WHERE is_active = TRUE
+        ORDER BY specialization, first_name, last_name
+    """, prepared=True)
+
+doctor_cache = DoctorCache(load_active_doctors, ttl=float(os.environ.get('DOCTOR_CACHE_TTL', 300)))
+
+def invalidate_doctor_cache():
+    """Drop cached doctor data; call after any change to the doctors table"""
+    doctor_cache.invalidate()
+
 @app.route('/api/doctors', methods=['GET'])
+@conditional_get(lambda: doctor_cache.version())
 def get_doctors():
     """Get all doctors"""
     try:
-        doctors = execute_query("""
-            SELECT doctor_id, first_name, last_name, specialization, phone, email
-            FROM doctors 
-            WHERE is_active = TRUE
-            ORDER BY specialization, first_name, last_name
-        """)
+        return jsonify({
+            'status': 'success',
+            'data': doctor_cache.active_doctors()
+        })
+        
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Hit/miss counters of the in-process caches and the prepared statement caches"""
+    return jsonify({
+        'status': 'success',
+        'data': {
+            'doctors': doctor_cache.stats(),
+            'statements': statement_caches.stats()
+        }
+    })
+
+@app.route('/api/cache/doctors/invalidate', methods=['POST'])
+def invalidate_doctors():
+    """Invalidate the doctor cache after doctors were changed outside the API"""
+    invalidate_doctor_cache()
+    return jsonify({'status': 'success', 'message': 'Doctor cache invalidated'})
+
+tombstone_pruner = TombstonePruner()
+
+@app.route('/api/sync/<table>', methods=['GET'])
+def sync_table(table):
+    """Rows of a table changed since the client's last sync
+
+    Without ``since`` the whole table is returned with ``reset: true``. With
+    it, only rows inserted or updated since then come back as ``upserts``
+    and the keys of deleted rows as ``deletes``; clients apply upserts
+    first, then deletes, and send ``next_token`` as ``since`` next time.
+    Needs schema migrations 5 and 6.
+    """
+    try:
+        config = sync_table_config(table)
+        since = parse_since_token(request.args.get('since'))
+        
+        with transaction() as cursor:
+            if tombstone_pruner.due():
+                cursor.execute(*tombstone_pruner.query())
+            
+            # Taken first: anything changed after this shows up in the next sync
+            cursor.execute("SELECT UNIX_TIMESTAMP(NOW(6)) as server_time")
+            server_time = cursor.fetchone()['server_time']
+            
+            reset = since is None or token_expired(since, server_time)
+            if reset:
+                since = None
+            
+            cursor.execute(*build_changes_query(table, since))
+            upserts = cursor.fetchall()
+            
+            deletes = []
+            if not reset:
+                cursor.execute(*build_tombstone_query(table, since))
+                deletes = [row['row_id'] for row in cursor.fetchall()]
         
         return jsonify({
             'status': 'success',
-            'data': doctors or []
+            'table': table,
+            'key': config['key'],
+            'reset': reset,
+            'data': {
+                'upserts': upserts,
+                'deletes': deletes
+            },
+            'next_token': make_since_token(server_time)
         })
         
+    except SyncError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except DatabaseUnavailableError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+class BookingError(Exception):
+    """A booking request that cannot be fulfilled, with its HTTP status"""
+    
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+SLOT_UNAVAILABLE_MESSAGE = 'Doctor not available at that time'
+
 @app.route('/api/appointments', methods=['POST'])
 def book_appointment():
-    """Book new appointment"""
+    """Book new appointment
+
+    Validation and insert run in one transaction on one connection. The
+    unique active-slot index (schema migration 4) is what makes concurrent
+    bookings of the same slot safe: the losing insert fails with a duplicate
+    key and is reported as 409 Conflict.
+    """
     try:
-        data = request.get_json()
+        # Validate required fields; the time is stored as HH:MM:SS so that
+        # "10:00" and "10:00:00" are the same slot
+        patient_id, doctor_id, appointment_date, appointment_time, reason = normalize_booking(request.get_json())
         
-        # Validate required fields
-        required_fields = ['patient_id', 'doctor_id', 'appointment_date', 'appointment_time']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'status': 'error', 'message': f'{field} is required'}), 400
-        
-        # Check if patient exists
-        patient_check = execute_query("""
-            SELECT patient_id FROM patients WHERE patient_id = %s
-        """, (data['patient_id'],), fetch_one=True)
-        
-        if not patient_check:
-            return jsonify({'status': 'error', 'message': f'Patient ID {data["patient_id"]} does not exist'}), 400
-        
-        # Check if doctor exists
-        doctor_check = execute_query("""
-            SELECT doctor_id FROM doctors WHERE doctor_id = %s AND is_active = TRUE
-        """, (data['doctor_id'],), fetch_one=True)
-        
-        if not doctor_check:
-            return jsonify({'status': 'error', 'message': f'Doctor ID {data["doctor_id"]} does not exist or is not active'}), 400
-        
-        # Check doctor availability
-        availability = execute_query("""
-            SELECT COUNT(*) as count FROM appointments 
-            WHERE doctor_id = %s AND appointment_date = %s AND appointment_time = %s 
-            AND status IN ('Scheduled', 'In Progress')
-        """, (data['doctor_id'], data['appointment_date'], data['appointment_time']), fetch_one=True)
-        
-        if availability and availability['count'] > 0:
-            return jsonify({'status': 'error', 'message': 'Doctor not available at that time'}), 400
-        
-        # Book appointment
-        appointment_id = execute_query("""
-            INSERT INTO appointments (patient_id, doctor_id, appointment_date, appointment_time, reason, status)
-            VALUES (%s, %s, %s, %s, %s, 'Scheduled')
-        """, (
-            data['patient_id'],
-            data['doctor_id'],
-            data['appointment_date'],
-            data['appointment_time'],
-            data.get('reason', '')
-        ), fetch_all=False)
-        
-        if appointment_id:
-            return jsonify({
-                'status': 'success',
-                'message': 'Appointment booked successfully',
-                'appointment_id': appointment_id
-            })
-        else:
-            return jsonify({'status': 'error', 'message': 'Failed to book appointment'}), 500
+        with transaction(prepared=True) as cursor:
+            # Check if patient exists
+            cursor.execute("""
+                SELECT patient_id, first_name, last_name FROM patients WHERE patient_id = %s
+            """, (patient_id,))
+            
+            patient = cursor.fetchone()
+            if not patient:
+                raise BookingError(f'Patient ID {patient_id} does not exist')
+            
+            # Check if doctor exists
+            doctor = doctor_cache.get(doctor_id)
+            if not doctor:
+                raise BookingError(f'Doctor ID {doctor_id} does not exist or is not active')
             
+            # Check doctor availability (fast path; the unique index settles races)
+            cursor.execute("""
+                SELECT COUNT(*) as count FROM appointments 
+                WHERE doctor_id = %s AND appointment_date = %s AND appointment_time = %s 
+                AND status IN ('Scheduled', 'In Progress')
+            """, (doctor_id, appointment_date, appointment_time))
+            
+            if cursor.fetchone()['count'] > 0:
+                raise BookingError(SLOT_UNAVAILABLE_MESSAGE, 409)
+            
+            # Book appointment
+            cursor.execute("""
+                INSERT INTO appointments (patient_id, doctor_id, appointment_date, appointment_time, reason, status)
+                VALUES (%s, %s, %s, %s, %s, 'Scheduled')
+            """, (patient_id, doctor_id, appointment_date, appointment_time, reason))
+            appointment_id = cursor.lastrowid
+        
+        # Published after the commit so subscribers never see a rolled back booking
+        event_broker.publish('appointment_booked', {
+            'appointment_id': appointment_id,
+            'appointment_date': appointment_date,
+            'appointment_time': appointment_time,
+            'status': 'Scheduled',
+            'reason': reason,
+            'first_name': patient['first_name'],
+            'last_name': patient['last_name'],
+            'doctor_first_name': doctor['first_name'],
+            'doctor_last_name': doctor['last_name']
+        })
+        
+        return jsonify({
+            'status': 'success',
+            'message': 'Appointment booked successfully',
+            'appointment_id': appointment_id
+        })
+        
+    except BookingError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), e.status_code
+    except DatabaseUnavailableError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
+    except Exception as e:
+        if is_duplicate_key_error(e):
+            return jsonify({'status': 'error', 'message': SLOT_UNAVAILABLE_MESSAGE}), 409
+        if is_foreign_key_error(e):
+            return jsonify({'status': 'error', 'message': 'Patient or doctor does not exist'}), 400
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+# Upper bound on bookings accepted by one /api/appointments/bulk request
+MAX_BULK_APPOINTMENTS = 5000
+# Rows per IN (...) list and per executemany batch
+BULK_CHUNK_SIZE = 1000
+
+def chunked(items, size=BULK_CHUNK_SIZE):
+    """Yield successive lists of at most size items"""
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def normalize_booking(item):
+    """Validate one booking and return (patient_id, doctor_id, date, time, reason)
+
+    Dates come back as YYYY-MM-DD and times as HH:MM:SS, the form the slot
+    checks and the unique active-slot index compare.
+    """
+    if not isinstance(item, dict):
+        raise BookingError('Each booking must be an object')
+    
+    for field in ['patient_id', 'doctor_id', 'appointment_date', 'appointment_time']:
+        if not item.get(field):
+            raise BookingError(f'{field} is required')
+    
+    try:
+        patient_id = int(item['patient_id'])
+        doctor_id = int(item['doctor_id'])
+    except (TypeError, ValueError):
+        raise BookingError('patient_id and doctor_id must be integers')
+    
+    try:
+        appointment_date = date.fromisoformat(str(item['appointment_date'])).isoformat()
+    except ValueError:
+        raise BookingError('appointment_date must be YYYY-MM-DD')
+    
+    try:
+        parts = [int(part) for part in str(item['appointment_time']).split(':')]
+        if len(parts) not in (2, 3):
+            raise ValueError
+        parts += [0] * (3 - len(parts))
+        appointment_time = time_of_day(*parts).strftime('%H:%M:%S')
+    except ValueError:
+        raise BookingError('appointment_time must be HH:MM or HH:MM:SS')
+    
+    return patient_id, doctor_id, appointment_date, appointment_time, item.get('reason', '')
+
+@app.route('/api/appointments/bulk', methods=['POST'])
+def book_appointments_bulk():
+    """Book many appointments in one request
+
+    Body: {"appointments": [{patient_id, doctor_id, appointment_date,
+    appointment_time, reason}, ...]}. Patient and doctor IDs are validated
+    with set-based lookups, slot conflicts are detected within the batch and
+    against existing appointments in one query, and every accepted booking
+    is inserted with executemany in a single transaction. Each item gets its
+    own result; rejected items do not stop the rest of the batch.
+    """
+    try:
+        data = request.get_json() or {}
+        items = data.get('appointments')
+        
+        if not isinstance(items, list) or not items:
+            return jsonify({'status': 'error', 'message': 'appointments must be a non-empty list'}), 400
+        if len(items) > MAX_BULK_APPOINTMENTS:
+            return jsonify({'status': 'error', 'message': f'At most {MAX_BULK_APPOINTMENTS} appointments per request'}), 400
+        
+        results = [None] * len(items)
+        candidates = {}  # index -> normalized booking
+        
+        def reject(index, message):
+            results[index] = {'index': index, 'status': 'rejected', 'message': message}
+        
+        for index, item in enumerate(items):
+            try:
+                candidates[index] = normalize_booking(item)
+            except BookingError as e:
+                reject(index, str(e))
+        
+        # Doctors come from the cache
+        for index, booking in list(candidates.items()):
+            if not doctor_cache.get(booking[1]):
+                reject(index, f'Doctor ID {booking[1]} does not exist or is not active')
+                del candidates[index]
+        
+        with transaction() as cursor:
+            # Patients: one IN (...) query per chunk of distinct IDs
+            existing_patients = set()
+            for patient_ids in chunked({booking[0] for booking in candidates.values()}):
+                placeholders = ', '.join(['%s'] * len(patient_ids))
+                cursor.execute(f"SELECT patient_id FROM patients WHERE patient_id IN ({placeholders})",
+                               tuple(patient_ids))
+                existing_patients.update(row['patient_id'] for row in cursor.fetchall())
+            
+            for index, booking in list(candidates.items()):
+                if booking[0] not in existing_patients:
+                    reject(index, f'Patient ID {booking[0]} does not exist')
+                    del candidates[index]
+            
+            # Slots already taken in the table, for every doctor and date range in the batch
+            taken_slots = set()
+            if candidates:
+                doctor_ids = sorted({booking[1] for booking in candidates.values()})
+                dates = [booking[2] for booking in candidates.values()]
+                for doctor_chunk in chunked(doctor_ids):
+                    placeholders = ', '.join(['%s'] * len(doctor_chunk))
+                    cursor.execute(f"""
+                        SELECT doctor_id, appointment_date,
+                               TIME_FORMAT(appointment_time, '%H:%i:%S') as appointment_time
+                        FROM appointments
+                        WHERE doctor_id IN ({placeholders})
+                        AND appointment_date BETWEEN %s AND %s
+                        AND status IN ('Scheduled', 'In Progress')
+                    """, tuple(doctor_chunk) + (min(dates), max(dates)))
+                    for row in cursor.fetchall():
+                        taken_slots.add((row['doctor_id'], str(row['appointment_date']), row['appointment_time']))
+            
+            # Conflicts with the table, then within the batch (first item wins)
+            batch_slots = {}
+            accepted = []
+            for index in sorted(candidates):
+                booking = candidates[index]
+                slot = (booking[1], booking[2], booking[3])
+                if slot in taken_slots:
+                    reject(index, SLOT_UNAVAILABLE_MESSAGE)
+                elif slot in batch_slots:
+                    reject(index, f'{SLOT_UNAVAILABLE_MESSAGE} (conflicts with item {batch_slots[slot]})')
+                else:
+                    batch_slots[slot] = index
+                    accepted.append(index)
+            
+            for chunk in chunked(accepted):
+                cursor.executemany("""
+                    INSERT INTO appointments (patient_id, doctor_id, appointment_date, appointment_time, reason, status)
+                    VALUES (%s, %s, %s, %s, %s, 'Scheduled')
+                """, [candidates[index] for index in chunk])
+            
+            # Read the new IDs back by slot; active slots are unique
+            booked_ids = {}
+            for chunk in chunked(accepted):
+                conditions = ' OR '.join(['(doctor_id = %s AND appointment_date = %s AND appointment_time = %s)'] * len(chunk))
+                params = []
+                for index in chunk:
+                    params.extend(candidates[index][1:4])
+                cursor.execute(f"""
+                    SELECT appointment_id, doctor_id, appointment_date,
+                           TIME_FORMAT(appointment_time, '%H:%i:%S') as appointment_time
+                    FROM appointments
+                    WHERE ({conditions}) AND status = 'Scheduled'
+                """, tuple(params))
+                for row in cursor.fetchall():
+                    booked_ids[(row['doctor_id'], str(row['appointment_date']), row['appointment_time'])] = row['appointment_id']
+        
+        for index in accepted:
+            booking = candidates[index]
+            results[index] = {
+                'index': index,
+                'status': 'booked',
+                'appointment_id': booked_ids.get((booking[1], booking[2], booking[3]))
+            }
+        
+        # One summary event rather than one per booking
+        if accepted:
+            event_broker.publish('appointments_bulk_booked', {
+                'count': len(accepted),
+                'dates': sorted({candidates[index][2] for index in accepted})
+            })
+        
+        return jsonify({
+            'status': 'success',
+            'summary': {
+                'requested': len(items),
+                'booked': len(accepted),
+                'rejected': len(items) - len(accepted)
+            },
+            'results': results
+        })
+        
+    except DatabaseUnavailableError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
     except Exception as e:
+        if is_duplicate_key_error(e):
+            # Another booking took one of the slots after the conflict check; nothing was inserted
+            return jsonify({'status': 'error', 'message': 'A slot in the batch was booked concurrently, nothing was booked. Please retry.'}), 409
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/appointments/today', methods=['GET'])
@@ -299,7 +1231,7 @@ def get_today_appointments():
             JOIN doctors d ON a.doctor_id = d.doctor_id
             WHERE a.appointment_date = CURDATE()
             ORDER BY a.appointment_time
-        """)
+        """, prepared=True)
         
         return jsonify({
             'status': 'success',
@@ -321,9 +1253,10 @@ def update_appointment_status(appointment_id):
         
         result = execute_query("""
             UPDATE appointments SET status = %s WHERE appointment_id = %s
-        """, (status, appointment_id), fetch_all=False)
+        """, (status, appointment_id), fetch_all=False, prepared=True)
         
         if result:
+            event_broker.publish('appointment_status', {'appointment_id': appointment_id, 'status': status})
             return jsonify({
                 'status': 'success',
                 'message': 'Appointment status updated successfully'
@@ -334,26 +1267,184 @@ def update_appointment_status(appointment_id):
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+# Appointment, room and patient changes pushed to /api/events subscribers
+event_broker = EventBroker()
+
+@app.route('/api/events', methods=['GET'])
+def stream_events():
+    """Server-Sent Events stream of bookings, status and room changes
+
+    Events: appointment_booked, appointments_bulk_booked,
+    appointment_status, room_occupancy, patients_added, and resync when
+    the client missed events and should reload. Reconnecting clients send
+    Last-Event-ID to get what they missed.
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    subscription = event_broker.subscribe(last_event_id)
+    
+    def generate():
+        try:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            while True:
+                event = subscription.next_event(timeout=HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield format_sse(*event)
+        finally:
+            # Runs when the client disconnects and the next write fails
+            event_broker.unsubscribe(subscription)
+    
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop reverse proxies from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Request, SQL and pool metrics in the Prometheus text format"""
+    return Response(sql_metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/events/stats', methods=['GET'])
+def get_event_stats():
+    """Published event count and connected subscribers"""
+    return jsonify({
+        'status': 'success',
+        'data': event_broker.stats()
+    })
+
+@app.route('/api/rooms/<int:room_id>/occupancy', methods=['PUT'])
+def update_room_occupancy(room_id):
+    """Mark a room occupied or free"""
+    try:
+        data = request.get_json() or {}
+        is_occupied = data.get('is_occupied')
+        
+        if not isinstance(is_occupied, bool):
+            return jsonify({'status': 'error', 'message': 'is_occupied must be true or false'}), 400
+        
+        with transaction(prepared=True) as cursor:
+            cursor.execute("""
+                SELECT room_id, room_number, is_occupied FROM rooms
+                WHERE room_id = %s AND is_active = TRUE
+                FOR UPDATE
+            """, (room_id,))
+            room = cursor.fetchone()
+            
+            changed = bool(room) and bool(room['is_occupied']) != is_occupied
+            if changed:
+                cursor.execute("""
+                    UPDATE rooms SET is_occupied = %s WHERE room_id = %s
+                """, (is_occupied, room_id))
+                cursor.execute("""
+                    SELECT COUNT(*) as available_rooms FROM rooms
+                    WHERE is_occupied = FALSE AND is_active = TRUE
+                """)
+                available_rooms = cursor.fetchone()['available_rooms']
+        
+        if not room:
+            return jsonify({'status': 'error', 'message': f'Room ID {room_id} does not exist or is not active'}), 404
+        
+        if changed:
+            event_broker.publish('room_occupancy', {
+                'room_id': room_id,
+                'room_number': room['room_number'],
+                'is_occupied': is_occupied,
+                'available_rooms': available_rooms
+            })
+        
+        return jsonify({
+            'status': 'success',
+            'message': 'Room occupancy updated' if changed else 'Room occupancy unchanged'
+        })
+        
+    except DatabaseUnavailableError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
 @app.route('/api/patients/<int:patient_id>/medical-records', methods=['GET'])
 def get_patient_medical_records(patient_id):
-    """Get patient medical records"""
+    """Get patient medical records, newest first, optionally one page at a time"""
     try:
-        records = execute_query("""
+        base_query = """
             SELECT mr.record_id, mr.visit_date, mr.diagnosis, mr.treatment, 
                    mr.prescription, mr.notes,
                    d.first_name as doctor_first_name, d.last_name as doctor_last_name,
                    d.specialization
             FROM medical_records mr
             JOIN doctors d ON mr.doctor_id = d.doctor_id
+        """
+        page_args = get_page_args(request.args)
+        
+        if wants_ndjson(request.args):
+            if page_args:
+                return jsonify({'status': 'error', 'message': 'format=ndjson streams every row; drop limit/after'}), 400
+            return ndjson_response(stream_query_rows(base_query + """
+                WHERE mr.patient_id = %s
+                ORDER BY mr.visit_date DESC, mr.record_id DESC
+            """, (patient_id,)))
+        
+        if page_args:
+            records, pagination = fetch_keyset_page(
+                base_query, ['mr.patient_id = %s'], [patient_id],
+                [('mr.visit_date', True), ('mr.record_id', True)],
+                ['visit_date', 'record_id'],
+                page_args)
+            return jsonify({
+                'status': 'success',
+                'data': records,
+                'pagination': pagination
+            })
+        
+        records = execute_query(base_query + """
             WHERE mr.patient_id = %s
             ORDER BY mr.visit_date DESC
-        """, (patient_id,))
+        """, (patient_id,), prepared=True)
         
         return jsonify({
             'status': 'success',
             'data': records or []
         })
         
+    except PaginationError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+@app.route('/api/medical-records/<int:record_id>', methods=['GET'])
+def get_medical_record(record_id):
+    """Get a single medical record by its ID
+
+    Runs in transaction() rather than execute_query so a failed query is
+    reported as an error instead of looking like a missing record.
+    """
+    try:
+        with transaction(prepared=True) as cursor:
+            cursor.execute("""
+                SELECT mr.record_id, mr.patient_id, mr.doctor_id, mr.visit_date,
+                       mr.diagnosis, mr.treatment, mr.prescription, mr.notes,
+                       p.first_name as patient_first_name, p.last_name as patient_last_name,
+                       d.first_name as doctor_first_name, d.last_name as doctor_last_name,
+                       d.specialization
+                FROM medical_records mr
+                JOIN patients p ON mr.patient_id = p.patient_id
+                JOIN doctors d ON mr.doctor_id = d.doctor_id
+                WHERE mr.record_id = %s
+            """, (record_id,))
+            record = cursor.fetchone()
+
+        if not record:
+            return jsonify({'status': 'error', 'message': f'Medical record ID {record_id} does not exist'}), 404
+
+        return jsonify({
+            'status': 'success',
+            'data': record
+        })
+
+    except DatabaseUnavailableError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
@@ -363,7 +1454,7 @@ def validate_patient(patient_id):
     try:
         patient = execute_query("""
             SELECT patient_id, first_name, last_name FROM patients WHERE patient_id = %s
-        """, (patient_id,), fetch_one=True)
+        """, (patient_id,), fetch_one=True, prepared=True)
         
         if patient:
             return jsonify({
@@ -385,16 +1476,18 @@ def validate_patient(patient_id):
 def validate_doctor(doctor_id):
     """Validate if doctor exists"""
     try:
-        doctor = execute_query("""
-            SELECT doctor_id, first_name, last_name, specialization FROM doctors 
-            WHERE doctor_id = %s AND is_active = TRUE
-        """, (doctor_id,), fetch_one=True)
+        doctor = doctor_cache.get(doctor_id)
         
         if doctor:
             return jsonify({
                 'status': 'success',
                 'exists': True,
-                'doctor': doctor
+                'doctor': {
+                    'doctor_id': doctor['doctor_id'],
+                    'first_name': doctor['first_name'],
+                    'last_name': doctor['last_name'],
+                    'specialization': doctor['specialization']
+                }
             })
         else:
             return jsonify({
@@ -406,71 +1499,137 @@ def validate_doctor(doctor_id):
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-def quick_sort_records(records, sort_by='visit_date', order='desc'):
-    """Quick sort implementation for medical records"""
-    if len(records) <= 1:
-        return records
+# Sort modes accepted by the sorted endpoints: 'database' pushes ORDER BY
+# into MySQL, 'python' fetches unordered rows and sorts them in the app
+SORT_MODES = ['database', 'python']
+DEFAULT_SORT_MODE = 'database'
+
+# Name reported in sort_info for each sort mode
+SORT_ALGORITHMS = {
+    'database': 'MySQL ORDER BY',
+    'python': 'Keyed Timsort'
+}
+
+# Sortable fields of each sorted endpoint and the SQL expression behind them.
+# Nullable text columns are coalesced and ENUMs cast to text so ORDER BY and
+# the keyset cursor comparison agree on the ordering.
+RECORD_ORDER = OrderByBuilder({
+    'visit_date': 'mr.visit_date',
+    'patient_id': 'mr.patient_id',
+    'doctor_id': 'mr.doctor_id',
+    'diagnosis': "COALESCE(mr.diagnosis, '')",
+    'specialization': 'd.specialization',
+    'record_id': 'mr.record_id'
+}, key_field='record_id')
+
+PATIENT_ORDER = OrderByBuilder({
+    'patient_id': 'patient_id',
+    'first_name': 'first_name',
+    'last_name': 'last_name',
+    'date_of_birth': 'date_of_birth',
+    'gender': 'CAST(gender AS CHAR)',
+    'phone': "COALESCE(phone, '')",
+    'email': "COALESCE(email, '')"
+}, key_field='patient_id')
+
+APPOINTMENT_ORDER = OrderByBuilder({
+    'appointment_id': 'a.appointment_id',
+    'patient_id': 'a.patient_id',
+    'doctor_id': 'a.doctor_id',
+    'appointment_date': 'a.appointment_date',
+    'appointment_time': 'a.appointment_time',
+    'status': 'CAST(a.status AS CHAR)'
+}, key_field='appointment_id')
+
+def run_sorted_query(base_query, conditions, params, order_builder, sort_spec, sort_mode, page_args):
+    """Fetch rows for a sorted endpoint in the requested mode
+
+    Returns (rows, pagination) where pagination is None unless a keyset page
+    was requested. Pages are always ordered by the database.
+    """
+    if page_args:
+        return fetch_keyset_page(base_query, conditions, params,
+                                 order_builder.order_columns(sort_spec),
+                                 order_builder.cursor_fields(sort_spec),
+                                 page_args)
     
-    def compare_records(a, b, sort_field, sort_order):
-        """Compare two records based on sort field and order"""
-        val_a = a.get(sort_field, '')
-        val_b = b.get(sort_field, '')
-        
-        # Handle different data types
-        if sort_field == 'visit_date':
-            # Convert date strings to comparable format
-            try:
-                from datetime import datetime
-                if isinstance(val_a, str):
-                    val_a = datetime.strptime(val_a.split(',')[1].strip() if ',' in val_a else val_a, '%d %b %Y %H:%M:%S %Z')
-                if isinstance(val_b, str):
-                    val_b = datetime.strptime(val_b.split(',')[1].strip() if ',' in val_b else val_b, '%d %b %Y %H:%M:%S %Z')
-            except:
-                pass
-        elif sort_field in ['patient_id', 'doctor_id', 'record_id']:
-            # Convert to integers for numeric comparison
-            try:
-                val_a = int(val_a)
-                val_b = int(val_b)
-            except:
-                pass
-        else:
-            # String comparison (case insensitive)
-            val_a = str(val_a).lower()
-            val_b = str(val_b).lower()
-        
-        if sort_order == 'asc':
-            return val_a < val_b
-        else:
-            return val_a > val_b
+    query = base_query
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
     
-    pivot = records[len(records) // 2]
-    left = [x for x in records if compare_records(x, pivot, sort_by, order)]
-    middle = [x for x in records if x == pivot]
-    right = [x for x in records if compare_records(pivot, x, sort_by, order)]
+    if sort_mode == 'database':
+        return execute_query(query + ' ' + order_builder.clause(sort_spec), tuple(params), prepared=True) or [], None
     
-    return quick_sort_records(left, sort_by, order) + middle + quick_sort_records(right, sort_by, order)
+    return sort_records(execute_query(query, tuple(params), prepared=True) or [], sort_spec), None
+
+def stream_sorted_query(base_query, conditions, params, order_builder, sort_spec):
+    """Stream every row of a sorted endpoint as NDJSON, ordered by the database"""
+    query = base_query
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    query += ' ' + order_builder.clause(sort_spec)
+    return ndjson_response(stream_query_rows(query, tuple(params)))
+
+def sorted_response(rows, pagination, sort_by, order, sort_mode, label):
+    """Build the response shared by the sorted endpoints"""
+    algorithm = SORT_ALGORITHMS[sort_mode]
+    response = {
+        'status': 'success',
+        'data': rows,
+        'sort_info': {
+            'sort_by': sort_by,
+            'order': order,
+            'algorithm': algorithm,
+            'sort_mode': sort_mode,
+            'record_count': len(rows),
+            'message': f'{label} sorted by {sort_by} in {order}ending order using {algorithm}'
+        }
+    }
+    if pagination is not None:
+        response['pagination'] = pagination
+    return jsonify(response)
+
+def parse_sort_request(data, default_sort_by, default_order, order_builder):
+    """Validate the sort options of a sorted endpoint request body
+
+    Returns (sort_by, order, sort_spec, sort_mode, page_args).
+    """
+    sort_by = data.get('sort_by', default_sort_by)
+    order = data.get('order', default_order)
+    sort_mode = data.get('sort_mode', DEFAULT_SORT_MODE)
+    
+    # Validate sort parameters against the endpoint's whitelist
+    valid_sort_fields = order_builder.valid_fields
+    if sort_by not in valid_sort_fields:
+        raise SortSpecError(f'Invalid sort field. Use one of: {valid_sort_fields}')
+    if order not in ['asc', 'desc']:
+        raise SortSpecError('Order must be "asc" or "desc"')
+    if sort_mode not in SORT_MODES:
+        raise SortSpecError(f'Invalid sort mode. Use one of: {SORT_MODES}')
+    
+    sort_spec = parse_sort_spec(sort_by, order, data.get('then_by'), valid_sort_fields)
+    page_args = get_page_args(data)
+    if page_args and sort_mode != 'database':
+        raise SortSpecError('limit/after pagination requires sort_mode "database"')
+    if wants_ndjson(data):
+        if page_args:
+            raise SortSpecError('format "ndjson" streams every row; drop limit/after')
+        if sort_mode != 'database':
+            raise SortSpecError('format "ndjson" requires sort_mode "database"')
+    
+    return sort_by, order, sort_spec, sort_mode, page_args
 
 @app.route('/api/records/sorted', methods=['POST'])
 def get_sorted_records():
-    """Get all medical records sorted using quick sort algorithm"""
+    """Get all medical records sorted by the requested field(s)"""
     try:
         data = request.get_json() or {}
-        sort_by = data.get('sort_by', 'visit_date')  # Default sort by visit date
-        order = data.get('order', 'desc')  # Default descending order
         record_type = data.get('record_type', 'all')  # all, patient_specific, doctor_specific
+        sort_by, order, sort_spec, sort_mode, page_args = parse_sort_request(
+            data, 'visit_date', 'desc', RECORD_ORDER)  # Default: newest visits first
         
-        # Validate sort parameters
-        valid_sort_fields = ['visit_date', 'patient_id', 'doctor_id', 'diagnosis', 'specialization', 'record_id']
-        if sort_by not in valid_sort_fields:
-            return jsonify({'status': 'error', 'message': f'Invalid sort field. Use one of: {valid_sort_fields}'}), 400
-        
-        if order not in ['asc', 'desc']:
-            return jsonify({'status': 'error', 'message': 'Order must be "asc" or "desc"'}), 400
-        
-        # Get all medical records with patient and doctor information
-        if record_type == 'patient_specific' and data.get('patient_id'):
-            query = """
+        # Get medical records with patient and doctor information
+        query = """
             SELECT mr.record_id, mr.patient_id, mr.doctor_id, mr.visit_date, 
                    mr.diagnosis, mr.treatment, mr.prescription, mr.notes,
                    p.first_name as patient_first_name, p.last_name as patient_last_name,
@@ -479,145 +1638,67 @@ def get_sorted_records():
             FROM medical_records mr
             JOIN patients p ON mr.patient_id = p.patient_id
             JOIN doctors d ON mr.doctor_id = d.doctor_id
-            WHERE mr.patient_id = %s
-            """
-            records = execute_query(query, (data['patient_id'],))
+        """
+        conditions = []
+        params = []
+        if record_type == 'patient_specific' and data.get('patient_id'):
+            conditions.append('mr.patient_id = %s')
+            params.append(data['patient_id'])
         elif record_type == 'doctor_specific' and data.get('doctor_id'):
-            query = """
-            SELECT mr.record_id, mr.patient_id, mr.doctor_id, mr.visit_date, 
-                   mr.diagnosis, mr.treatment, mr.prescription, mr.notes,
-                   p.first_name as patient_first_name, p.last_name as patient_last_name,
-                   d.first_name as doctor_first_name, d.last_name as doctor_last_name,
-                   d.specialization
-            FROM medical_records mr
-            JOIN patients p ON mr.patient_id = p.patient_id
-            JOIN doctors d ON mr.doctor_id = d.doctor_id
-            WHERE mr.doctor_id = %s
-            """
-            records = execute_query(query, (data['doctor_id'],))
-        else:
-            # Get all records
-            query = """
-            SELECT mr.record_id, mr.patient_id, mr.doctor_id, mr.visit_date, 
-                   mr.diagnosis, mr.treatment, mr.prescription, mr.notes,
-                   p.first_name as patient_first_name, p.last_name as patient_last_name,
-                   d.first_name as doctor_first_name, d.last_name as doctor_last_name,
-                   d.specialization
-            FROM medical_records mr
-            JOIN patients p ON mr.patient_id = p.patient_id
-            JOIN doctors d ON mr.doctor_id = d.doctor_id
-            """
-            records = execute_query(query)
+            conditions.append('mr.doctor_id = %s')
+            params.append(data['doctor_id'])
         
-        if not records:
-            return jsonify({
-                'status': 'success',
-                'data': [],
-                'sort_info': {
-                    'sort_by': sort_by,
-                    'order': order,
-                    'algorithm': 'Quick Sort',
-                    'record_count': 0
-                }
-            })
+        if wants_ndjson(data):
+            return stream_sorted_query(query, conditions, params, RECORD_ORDER, sort_spec)
         
-        # Convert to list of dictionaries for sorting
-        if hasattr(records, 'to_dict'):
-            records_list = records.to_dict('records')
-        else:
-            records_list = records if isinstance(records, list) else []
-        
-        # Apply quick sort
-        sorted_records = quick_sort_records(records_list, sort_by, order)
-        
-        return jsonify({
-            'status': 'success',
-            'data': sorted_records,
-            'sort_info': {
-                'sort_by': sort_by,
-                'order': order,
-                'algorithm': 'Quick Sort',
-                'record_count': len(sorted_records),
-                'message': f'Records sorted by {sort_by} in {order}ending order using Quick Sort algorithm'
-            }
-        })
+        records, pagination = run_sorted_query(query, conditions, params, RECORD_ORDER,
+                                               sort_spec, sort_mode, page_args)
+        return sorted_response(records, pagination, sort_by, order, sort_mode, 'Records')
         
+    except (PaginationError, SortSpecError) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/patients/sorted', methods=['POST'])
 def get_sorted_patients():
-    """Get all patients sorted using quick sort algorithm"""
+    """Get all patients sorted by the requested field(s)"""
     try:
         data = request.get_json() or {}
-        sort_by = data.get('sort_by', 'last_name')  # Default sort by last name
-        order = data.get('order', 'asc')  # Default ascending order
-        
-        # Validate sort parameters
-        valid_sort_fields = ['patient_id', 'first_name', 'last_name', 'date_of_birth', 'gender', 'phone', 'email']
-        if sort_by not in valid_sort_fields:
-            return jsonify({'status': 'error', 'message': f'Invalid sort field. Use one of: {valid_sort_fields}'}), 400
+        sort_by, order, sort_spec, sort_mode, page_args = parse_sort_request(
+            data, 'last_name', 'asc', PATIENT_ORDER)  # Default: alphabetical by last name
         
         # Get all patients
         query = """
         SELECT patient_id, first_name, last_name, date_of_birth, gender, phone, email, address, blood_type
         FROM patients 
         """
-        patients = execute_query(query)
-        
-        if not patients:
-            return jsonify({
-                'status': 'success',
-                'data': [],
-                'sort_info': {
-                    'sort_by': sort_by,
-                    'order': order,
-                    'algorithm': 'Quick Sort',
-                    'record_count': 0
-                }
-            })
         
-        # Convert to list of dictionaries for sorting
-        if hasattr(patients, 'to_dict'):
-            patients_list = patients.to_dict('records')
-        else:
-            patients_list = patients if isinstance(patients, list) else []
+        if wants_ndjson(data):
+            return stream_sorted_query(query, [], [], PATIENT_ORDER, sort_spec)
         
-        # Apply quick sort (reuse the same function with appropriate field)
-        sorted_patients = quick_sort_records(patients_list, sort_by, order)
-        
-        return jsonify({
-            'status': 'success',
-            'data': sorted_patients,
-            'sort_info': {
-                'sort_by': sort_by,
-                'order': order,
-                'algorithm': 'Quick Sort',
-                'record_count': len(sorted_patients),
-                'message': f'Patients sorted by {sort_by} in {order}ending order using Quick Sort algorithm'
-            }
-        })
+        patients, pagination = run_sorted_query(query, [], [], PATIENT_ORDER,
+                                                sort_spec, sort_mode, page_args)
+        return sorted_response(patients, pagination, sort_by, order, sort_mode, 'Patients')
         
+    except (PaginationError, SortSpecError) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/appointments/sorted', methods=['POST'])
 def get_sorted_appointments():
-    """Get all appointments sorted using quick sort algorithm"""
+    """Get all appointments sorted by the requested field(s)"""
     try:
         data = request.get_json() or {}
-        sort_by = data.get('sort_by', 'appointment_date')  # Default sort by appointment date
-        order = data.get('order', 'desc')  # Default descending order
-        
-        # Validate sort parameters
-        valid_sort_fields = ['appointment_id', 'patient_id', 'doctor_id', 'appointment_date', 'appointment_time', 'status']
-        if sort_by not in valid_sort_fields:
-            return jsonify({'status': 'error', 'message': f'Invalid sort field. Use one of: {valid_sort_fields}'}), 400
+        sort_by, order, sort_spec, sort_mode, page_args = parse_sort_request(
+            data, 'appointment_date', 'desc', APPOINTMENT_ORDER)  # Default: latest dates first
         
         # Get all appointments with patient and doctor information
+        # (%S rather than %s in TIME_FORMAT so the query can take parameters)
         query = """
         SELECT a.appointment_id, a.patient_id, a.doctor_id, a.appointment_date, 
-               TIME_FORMAT(a.appointment_time, '%H:%i:%s') as appointment_time, 
+               TIME_FORMAT(a.appointment_time, '%H:%i:%S') as appointment_time, 
                a.status, a.reason,
                p.first_name as patient_first_name, p.last_name as patient_last_name,
                d.first_name as doctor_first_name, d.last_name as doctor_last_name,
@@ -626,41 +1707,16 @@ def get_sorted_appointments():
         JOIN patients p ON a.patient_id = p.patient_id
         JOIN doctors d ON a.doctor_id = d.doctor_id
         """
-        appointments = execute_query(query)
         
-        if not appointments:
-            return jsonify({
-                'status': 'success',
-                'data': [],
-                'sort_info': {
-                    'sort_by': sort_by,
-                    'order': order,
-                    'algorithm': 'Quick Sort',
-                    'record_count': 0
-                }
-            })
-        
-        # Convert to list of dictionaries for sorting
-        if hasattr(appointments, 'to_dict'):
-            appointments_list = appointments.to_dict('records')
-        else:
-            appointments_list = appointments if isinstance(appointments, list) else []
+        if wants_ndjson(data):
+            return stream_sorted_query(query, [], [], APPOINTMENT_ORDER, sort_spec)
         
-        # Apply quick sort
-        sorted_appointments = quick_sort_records(appointments_list, sort_by, order)
-        
-        return jsonify({
-            'status': 'success',
-            'data': sorted_appointments,
-            'sort_info': {
-                'sort_by': sort_by,
-                'order': order,
-                'algorithm': 'Quick Sort',
-                'record_count': len(sorted_appointments),
-                'message': f'Appointments sorted by {sort_by} in {order}ending order using Quick Sort algorithm'
-            }
-        })
+        appointments, pagination = run_sorted_query(query, [], [], APPOINTMENT_ORDER,
+                                                    sort_spec, sort_mode, page_args)
+        return sorted_response(appointments, pagination, sort_by, order, sort_mode, 'Appointments')
         
+    except (PaginationError, SortSpecError) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
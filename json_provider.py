@@ -0,0 +1,83 @@
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib encoder is used instead
+    orjson = None
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def format_timedelta(value):
+    """Format a MySQL TIME value (a timedelta) as HH:MM:SS"""
+    total_seconds = int(value.total_seconds())
+    sign = '-' if total_seconds < 0 else ''
+    total_seconds = abs(total_seconds)
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+    return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def json_default(obj):
+    """Serialize the MySQL column types the standard encoders do not handle
+
+    Dates are ISO 8601, TIME columns HH:MM:SS, and DECIMAL columns such as
+    billing.amount are sent as strings so no precision is lost.
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return format_timedelta(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj):
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed
+
+    orjson writes dates natively and calls json_default only for the other
+    types; anything it rejects (e.g. integers beyond 64 bits) is retried
+    with the stdlib encoder so both paths accept the same input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, default=json_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider with ISO dates, TIME and DECIMAL support
+
+    Installed with ``app.json = FastJSONProvider(app)``; jsonify and every
+    other Flask JSON helper go through it. Keys keep their insertion order.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            kwargs.setdefault('default', json_default)
+            return json.dumps(obj, **kwargs)
+        return dumps_bytes(obj).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        if not args and not kwargs:
+            obj = None
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs
+        return self._app.response_class(dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
@@ -0,0 +1,57 @@
+from pagination import order_by_clause
+from record_sort import SortSpecError
+
+
+class OrderByBuilder:
+    """Whitelisted ORDER BY clauses for one endpoint
+
+    ``columns`` maps every field a client may sort on to the SQL expression
+    behind it. Only those expressions and the keywords ASC/DESC ever reach
+    the SQL text, so client input cannot inject anything into the query.
+    The primary key is always appended as a tiebreaker, which makes the
+    ordering total and lets it double as a keyset pagination order.
+    """
+
+    def __init__(self, columns, key_field):
+        if key_field not in columns:
+            raise ValueError(f"Key field {key_field} must be one of the sortable columns")
+        self.columns = dict(columns)
+        self.key_field = key_field
+
+    @property
+    def valid_fields(self):
+        return list(self.columns)
+
+    def order_columns(self, sort_spec):
+        """Turn a [(field, descending), ...] spec into (sql_expression, descending) pairs"""
+        if not sort_spec:
+            raise SortSpecError('At least one sort field is required')
+
+        order_columns = []
+        seen = set()
+        for field, descending in sort_spec:
+            if field not in self.columns:
+                raise SortSpecError(f'Invalid sort field. Use one of: {self.valid_fields}')
+            if field in seen:
+                continue
+            seen.add(field)
+            order_columns.append((self.columns[field], bool(descending)))
+
+        if self.key_field not in seen:
+            # Break ties in the direction of the last requested key
+            order_columns.append((self.columns[self.key_field], order_columns[-1][1]))
+        return order_columns
+
+    def cursor_fields(self, sort_spec):
+        """Row keys whose values make up a keyset cursor for this spec"""
+        fields = []
+        for field, _ in sort_spec:
+            if field not in fields:
+                fields.append(field)
+        if self.key_field not in fields:
+            fields.append(self.key_field)
+        return fields
+
+    def clause(self, sort_spec):
+        """Render the ORDER BY clause for a spec"""
+        return order_by_clause(self.order_columns(sort_spec))
@@ -0,0 +1,121 @@
+import base64
+import json
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+# Page size used when a client asks for pagination without a limit
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class PaginationError(ValueError):
+    """Raised for a malformed limit or cursor"""
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE):
+    """Validate a page size, clamping it to MAX_PAGE_SIZE"""
+    if value is None or value == '':
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise PaginationError('limit must be a positive integer')
+    if limit < 1:
+        raise PaginationError('limit must be a positive integer')
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _cursor_value(value):
+    """Convert a row value to something JSON can carry and MySQL can compare"""
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (timedelta, Decimal)):
+        return str(value)
+    return value
+
+
+def encode_cursor(values):
+    """Encode the sort key values of the last row on a page"""
+    payload = json.dumps([_cursor_value(v) for v in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, expected_length):
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception:
+        raise PaginationError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != expected_length:
+        raise PaginationError('Cursor does not match the requested sort order')
+    return values
+
+
+def keyset_condition(order_columns, values):
+    """Build the WHERE fragment selecting rows after the cursor position
+
+    ``order_columns`` are ``(sql_expression, descending)`` pairs of the
+    ORDER BY, ending with a unique key. The fragment is expanded to
+    ``a > x OR (a = x AND b > y)`` rather than a row constructor so MySQL can
+    use a range scan on the index, and so each column may have its own
+    direction.
+    """
+    clauses = []
+    params = []
+    for position, (column, descending) in enumerate(order_columns):
+        parts = []
+        for (previous_column, _), previous_value in zip(order_columns[:position], values[:position]):
+            parts.append(f"{previous_column} = %s")
+            params.append(previous_value)
+        parts.append(f"{column} {'<' if descending else '>'} %s")
+        params.append(values[position])
+        clauses.append('(' + ' AND '.join(parts) + ')')
+    return '(' + ' OR '.join(clauses) + ')', params
+
+
+def order_by_clause(order_columns):
+    """Render ``(sql_expression, descending)`` pairs as an ORDER BY clause"""
+    return 'ORDER BY ' + ', '.join(
+        f"{column} {'DESC' if descending else 'ASC'}" for column, descending in order_columns)
+
+
+def build_page_query(base_query, conditions, params, order_columns, limit, cursor=None):
+    """Append WHERE, ORDER BY and LIMIT for one keyset page
+
+    One extra row is requested so the caller can tell whether another page
+    follows without a COUNT query.
+    """
+    conditions = list(conditions)
+    params = list(params)
+
+    if cursor:
+        condition, cursor_params = keyset_condition(
+            order_columns, decode_cursor(cursor, len(order_columns)))
+        conditions.append(condition)
+        params.extend(cursor_params)
+
+    query = base_query
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    query += ' ' + order_by_clause(order_columns) + ' LIMIT %s'
+    params.append(limit + 1)
+    return query, tuple(params)
+
+
+def build_page(rows, limit, cursor_fields):
+    """Trim the look-ahead row and describe the page for the response"""
+    rows = rows or []
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more and rows:
+        last_row = rows[-1]
+        next_cursor = encode_cursor([last_row.get(field) for field in cursor_fields])
+    return rows, {
+        'limit': limit,
+        'has_more': has_more,
+        'next_cursor': next_cursor
+    }
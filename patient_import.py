@@ -0,0 +1,164 @@
+import codecs
+import csv
+import json
+from datetime import date
+
+# Required fields shared by add_patient and the bulk import
+PATIENT_REQUIRED_FIELDS = ['first_name', 'last_name', 'date_of_birth', 'gender']
+# Columns written by an import, in INSERT order
+PATIENT_IMPORT_FIELDS = ['first_name', 'last_name', 'date_of_birth', 'gender',
+                         'phone', 'email', 'address', 'blood_type']
+GENDERS = ('Male', 'Female', 'Other')
+# VARCHAR limits from the patients table
+FIELD_LENGTHS = {'first_name': 50, 'last_name': 50, 'phone': 15, 'email': 100, 'blood_type': 5}
+
+IMPORT_FORMATS = ['csv', 'ndjson']
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+MAX_IMPORT_CHUNK_SIZE = 10000
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class PatientImportError(ValueError):
+    """Raised for an unusable import request or an invalid row"""
+
+
+def missing_required_field(data):
+    """Return the first required patient field that is missing, or None"""
+    for field in PATIENT_REQUIRED_FIELDS:
+        if not data.get(field):
+            return field
+    return None
+
+
+def detect_format(requested, content_type):
+    """Pick the import format from ?format= or the Content-Type header"""
+    if requested:
+        if requested not in IMPORT_FORMATS:
+            raise PatientImportError(f'Invalid format. Use one of: {IMPORT_FORMATS}')
+        return requested
+    content_type = (content_type or '').lower()
+    if 'csv' in content_type:
+        return 'csv'
+    if 'ndjson' in content_type or 'jsonl' in content_type or 'json' in content_type:
+        return 'ndjson'
+    raise PatientImportError('Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson')
+
+
+def parse_chunk_size(value):
+    if value is None or value == '':
+        return DEFAULT_IMPORT_CHUNK_SIZE
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        raise PatientImportError('chunk_size must be a positive integer')
+    if size < 1:
+        raise PatientImportError('chunk_size must be a positive integer')
+    return min(size, MAX_IMPORT_CHUNK_SIZE)
+
+
+def iter_lines(stream, encoding='utf-8'):
+    """Yield decoded lines (newline kept) from a binary stream, one block at a time"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    pending = ''
+    first = True
+    while True:
+        block = stream.read(READ_CHUNK_BYTES)
+        text = decoder.decode(block or b'', final=not block)
+        if first and text:
+            text = text.lstrip('\ufeff')
+            first = False
+        pending += text
+        lines = pending.split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line + '\n'
+        if not block:
+            break
+    if pending:
+        yield pending
+
+
+def iter_raw_rows(lines, import_format):
+    """Yield (line_number, row dict or None, error message or None)"""
+    if import_format == 'csv':
+        reader = csv.DictReader(lines)
+        if not reader.fieldnames:
+            return
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        for row in reader:
+            if not any(value for value in row.values() if isinstance(value, str)):
+                continue
+            if None in row:
+                yield reader.line_num, None, 'Row has more values than the header'
+                continue
+            yield reader.line_num, row, None
+        return
+
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f'Invalid JSON: {e}'
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, 'Each line must be a JSON object'
+            continue
+        yield line_number, row, None
+
+
+def normalize_patient_row(row):
+    """Validate one import row and return the INSERT parameters"""
+    values = {}
+    for field in PATIENT_IMPORT_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+        values[field] = value if value not in ('', None) else None
+
+    field = missing_required_field(values)
+    if field:
+        raise PatientImportError(f'{field} is required')
+
+    try:
+        values['date_of_birth'] = date.fromisoformat(str(values['date_of_birth'])).isoformat()
+    except ValueError:
+        raise PatientImportError('date_of_birth must be YYYY-MM-DD')
+
+    gender = str(values['gender']).capitalize()
+    if gender not in GENDERS:
+        raise PatientImportError(f'gender must be one of: {list(GENDERS)}')
+    values['gender'] = gender
+
+    for field, length in FIELD_LENGTHS.items():
+        if values[field] is not None:
+            values[field] = str(values[field])
+            if len(values[field]) > length:
+                raise PatientImportError(f'{field} is longer than {length} characters')
+
+    return tuple(values[field] for field in PATIENT_IMPORT_FIELDS)
+
+
+def iter_patient_batches(stream, import_format, chunk_size, encoding='utf-8'):
+    """Yield (batch, rejected) lists as the stream is read
+
+    ``batch`` holds (line_number, insert params) for valid rows, at most
+    ``chunk_size`` of them; ``rejected`` holds (line_number, message) for the
+    rows skipped since the previous batch. Only one batch is held in memory.
+    """
+    batch = []
+    rejected = []
+    for line_number, row, error in iter_raw_rows(iter_lines(stream, encoding), import_format):
+        if error is None:
+            try:
+                batch.append((line_number, normalize_patient_row(row)))
+            except PatientImportError as e:
+                error = str(e)
+        if error is not None:
+            rejected.append((line_number, error))
+        if len(batch) >= chunk_size or len(rejected) >= chunk_size:
+            yield batch, rejected
+            batch, rejected = [], []
+    if batch or rejected:
+        yield batch, rejected
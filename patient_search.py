@@ -0,0 +1,124 @@
+import re
+
+# Search strategies: 'fulltext' uses the ngram FULLTEXT index, the reversed
+# phone digits column (schema migration 3) and the forward phone digits
+# column (migration 7), 'like' is the original leading-wildcard scan kept for
+# databases that have not been migrated
+SEARCH_MODES = ['fulltext', 'like']
+
+DEFAULT_RESULT_LIMIT = 50
+MAX_RESULT_LIMIT = 500
+
+# Must match ngram_token_size on the server (MySQL default: 2)
+NGRAM_TOKEN_SIZE = 2
+
+# Country code of stored numbers, for phone searches typed without it
+DEFAULT_COUNTRY_CODE = '91'
+
+SEARCH_COLUMNS = "patient_id, first_name, last_name, phone, email, date_of_birth"
+
+_PHONE_QUERY = re.compile(r'^[\d\s()+\-.]+$')
+_NON_DIGITS = re.compile(r'\D')
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+class SearchError(ValueError):
+    """Raised for an empty or unusable search request"""
+
+
+def normalize_phone(value):
+    """Strip a phone number down to its digits"""
+    return _NON_DIGITS.sub('', value or '')
+
+
+def is_phone_query(term):
+    """True if the term looks like (part of) a phone number"""
+    return bool(_PHONE_QUERY.match(term)) and len(normalize_phone(term)) >= 3
+
+
+def parse_result_limit(value):
+    if value is None or value == '':
+        return DEFAULT_RESULT_LIMIT
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise SearchError('limit must be a positive integer')
+    if limit < 1:
+        raise SearchError('limit must be a positive integer')
+    return min(limit, MAX_RESULT_LIMIT)
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _search_words(term):
+    return [word for word in _BOOLEAN_OPERATORS.sub(' ', term).split() if word]
+
+
+def build_search_query(term, limit, mode='fulltext'):
+    """Return (sql, params) for a patient search
+
+    Phone-like terms match a suffix or a prefix of the stored digits, so
+    "9876543210", "+91 98765 43210" and "3210" (suffix, on the reversed
+    digits) as well as "98765" and "+91 987" (prefix, with or without the
+    country code) all find "+91-9876543210" through index range scans.
+    Other terms require every word to
+    appear as a substring of the first name, last name or email (an ngram
+    phrase match) and are ranked with exact and prefix name matches first,
+    then by FULLTEXT relevance.
+    """
+    term = (term or '').strip()
+    if not term:
+        raise SearchError('Search term is required')
+    if mode not in SEARCH_MODES:
+        raise SearchError(f'Invalid search mode. Use one of: {SEARCH_MODES}')
+
+    if mode == 'like':
+        pattern = f"%{term}%"
+        return f"""
+            SELECT {SEARCH_COLUMNS}
+            FROM patients
+            WHERE first_name LIKE %s OR last_name LIKE %s OR phone LIKE %s OR email LIKE %s
+            ORDER BY first_name, last_name
+            LIMIT %s
+        """, (pattern, pattern, pattern, pattern, limit)
+
+    if is_phone_query(term):
+        digits = normalize_phone(term)
+        return f"""
+            SELECT {SEARCH_COLUMNS}
+            FROM patients
+            WHERE phone_digits_reversed LIKE %s OR phone_digits LIKE %s OR phone_digits LIKE %s
+            ORDER BY first_name, last_name
+            LIMIT %s
+        """, (digits[::-1] + '%', digits + '%', DEFAULT_COUNTRY_CODE + digits + '%', limit)
+
+    words = _search_words(term)
+    if not words:
+        raise SearchError('Search term must contain letters or digits')
+    first_word = words[0]
+    prefix = _escape_like(first_word) + '%'
+    indexed_words = [word for word in words if len(word) >= NGRAM_TOKEN_SIZE]
+
+    if not indexed_words:
+        # Too short for the ngram index: prefix match on the name indexes
+        return f"""
+            SELECT {SEARCH_COLUMNS}
+            FROM patients
+            WHERE first_name LIKE %s OR last_name LIKE %s
+            ORDER BY first_name, last_name
+            LIMIT %s
+        """, (prefix, prefix, limit)
+
+    against = ' '.join(f'+"{word}"' for word in indexed_words)
+    return f"""
+        SELECT {SEARCH_COLUMNS}
+        FROM patients
+        WHERE MATCH(first_name, last_name, email) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY (first_name = %s OR last_name = %s) DESC,
+                 (first_name LIKE %s OR last_name LIKE %s) DESC,
+                 MATCH(first_name, last_name, email) AGAINST (%s IN BOOLEAN MODE) DESC,
+                 first_name, last_name
+        LIMIT %s
+    """, (against, first_word, first_word, prefix, prefix, against, limit)
@@ -0,0 +1,148 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from email.utils import parsedate_to_datetime
+
+# Fields whose type is known up front; anything else is inferred from the data
+DATE_FIELDS = {'visit_date', 'appointment_date', 'date_of_birth', 'bill_date', 'due_date'}
+INTEGER_FIELDS = {'patient_id', 'doctor_id', 'record_id', 'appointment_id', 'bill_id', 'room_id'}
+TIME_FIELDS = {'appointment_time'}
+
+
+class SortSpecError(ValueError):
+    """Raised for an unknown sort field or order"""
+
+
+def _to_datetime(value):
+    """Parse dates from MySQL objects, ISO strings or HTTP-date strings
+
+    Returns a day number (fractional for datetimes) so DATE and DATETIME
+    values compare with each other and stay cheap to compare.
+    """
+    if isinstance(value, datetime):
+        return value.toordinal() + (value.hour * 3600 + value.minute * 60 + value.second) / 86400
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        try:
+            return _to_datetime(datetime.fromisoformat(text))
+        except ValueError:
+            pass
+        try:
+            return _to_datetime(parsedate_to_datetime(text))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_seconds(value):
+    """Convert TIME values (timedelta or 'HH:MM[:SS]' strings) to seconds"""
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, time):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    if isinstance(value, str):
+        try:
+            parts = [int(part) for part in value.strip().split(':')]
+        except ValueError:
+            return None
+        parts += [0] * (3 - len(parts))
+        return parts[0] * 3600 + parts[1] * 60 + parts[2]
+    return None
+
+
+def _to_number(value):
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return value
+    try:
+        return Decimal(str(value))
+    except Exception:
+        return None
+
+
+def _to_text(value):
+    return str(value).casefold()
+
+
+def _converter_for(field, records):
+    """Pick the typed conversion for a field"""
+    if field in DATE_FIELDS:
+        return _to_datetime
+    if field in INTEGER_FIELDS:
+        return _to_int
+    if field in TIME_FIELDS:
+        return _to_seconds
+
+    # Infer from the first non-null value
+    for record in records:
+        value = record.get(field)
+        if value is None:
+            continue
+        if isinstance(value, (datetime, date)):
+            return _to_datetime
+        if isinstance(value, timedelta):
+            return _to_seconds
+        if isinstance(value, (int, float, Decimal)):
+            return _to_number
+        break
+    return _to_text
+
+
+def parse_sort_spec(sort_by, order='asc', then_by=None, valid_fields=None):
+    """Normalize a sort request into [(field, descending), ...]
+
+    ``then_by`` holds secondary keys as ``{'field': ..., 'order': ...}``
+    dicts or ``'field:order'`` strings.
+    """
+    entries = [{'field': sort_by, 'order': order}]
+    for entry in then_by or []:
+        if isinstance(entry, str):
+            field, _, entry_order = entry.partition(':')
+            entry = {'field': field, 'order': entry_order or 'asc'}
+        elif not isinstance(entry, dict):
+            raise SortSpecError('then_by entries must be objects or "field:order" strings')
+        entries.append(entry)
+
+    spec = []
+    for entry in entries:
+        field = entry.get('field')
+        entry_order = (entry.get('order') or 'asc').lower()
+        if valid_fields is not None and field not in valid_fields:
+            raise SortSpecError(f'Invalid sort field. Use one of: {list(valid_fields)}')
+        if entry_order not in ('asc', 'desc'):
+            raise SortSpecError('Order must be "asc" or "desc"')
+        spec.append((field, entry_order == 'desc'))
+    return spec
+
+
+def sort_records(records, sort_spec):
+    """Return records sorted by a [(field, descending), ...] spec
+
+    Each field's typed key is computed once per row, NULLs (and values that
+    cannot be parsed) sort last in either direction, and rows with equal keys
+    keep their original order. Multi-column specs are applied as successive
+    stable sorts from the least significant key to the most significant.
+    """
+    result = list(records)
+    for field, descending in reversed(sort_spec):
+        convert = _converter_for(field, result)
+
+        def key(record, field=field, convert=convert, descending=descending):
+            value = record.get(field)
+            value = None if value is None else convert(value)
+            if value is None:
+                # Lowest rank when reversed, highest when ascending: always last
+                return (0, 0) if descending else (1, 0)
+            return (1, value) if descending else (0, value)
+
+        result.sort(key=key, reverse=descending)
+    return result
@@ -0,0 +1,283 @@
+import logging
+import re
+import threading
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+# Endpoint label for statements run outside a request (worker threads, streaming)
+BACKGROUND = 'background'
+
+OPERATIONS = {'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE'}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)] + list(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value):
+    return str(value) if isinstance(value, int) else f"{value:.9g}"
+
+
+class Counter:
+    """Monotonic counter, one value per combination of label values"""
+    kind = 'counter'
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labels, values)} {_number(value)}" for values, value in items]
+
+
+class Histogram:
+    """Bucketed observations with their sum and count"""
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}  # label values -> [per-bucket counts, sum, count]
+
+    def observe(self, value, *label_values):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((values, (list(counts), total, count))
+                           for values, (counts, total, count) in self._series.items())
+        lines = []
+        for values, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (None,), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound is None else f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labels, values, [le])} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, values)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labels, values)} {count}")
+        return lines
+
+
+class CallbackMetric:
+    """Gauge or counter read from elsewhere (e.g. pool stats) at render time
+
+    read() returns {label values tuple: value}.
+    """
+
+    def __init__(self, name, help_text, read, labels=(), kind='gauge'):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.kind = kind
+        self._read = read
+
+    def samples(self):
+        return [f"{self.name}{_labels(self.labels, values)} {_number(value)}"
+                for values, value in sorted(self._read().items())]
+
+
+class MetricsRegistry:
+    """Metrics rendered together in the Prometheus text exposition format"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+@lru_cache(maxsize=1024)
+def statement_operation(sql):
+    """SELECT, INSERT, UPDATE, DELETE, REPLACE or OTHER, from the statement's first keyword"""
+    words = sql.split(None, 1)
+    keyword = words[0].upper() if words else ''
+    if keyword == 'WITH':
+        return 'SELECT'
+    return keyword if keyword in OPERATIONS else 'OTHER'
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql):
+    """One-line statement text with string literals replaced by '?'"""
+    return ' '.join(_STRING_LITERAL.sub("'?'", sql).split())
+
+
+def _redact(value):
+    if value is None:
+        return 'NULL'
+    for kind in (bool, int, float, Decimal, str, bytes, datetime, date, time, timedelta):
+        if isinstance(value, kind):
+            return f"<{kind.__name__}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_params(params, many=False):
+    """Describe statement parameters by type only, never by value"""
+    if many:
+        params = list(params or [])
+        first = redact_params(params[0]) if params else []
+        return f"{len(params)} rows of {first}"
+    if not params:
+        return []
+    if isinstance(params, dict):
+        return {key: _redact(value) for key, value in params.items()}
+    return [_redact(value) for value in params]
+
+
+class RequestStats:
+    """SQL work done while serving one request"""
+
+    __slots__ = ('queries', 'db_time', 'rows', 'slowest', 'acquire_wait')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.slowest = 0.0
+        self.acquire_wait = 0.0
+
+    def server_timing(self, total=None):
+        """Server-Timing header value; durations in milliseconds"""
+        entries = [
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries, {self.rows} rows"',
+            f'db-acquire;dur={self.acquire_wait * 1000:.2f}'
+        ]
+        if self.queries:
+            entries.append(f'db-slowest;dur={self.slowest * 1000:.2f}')
+        if total is not None:
+            entries.append(f'total;dur={total * 1000:.2f}')
+        return ', '.join(entries)
+
+
+class SlowQueryLog:
+    """Logs statements that take at least threshold_ms, with parameters redacted
+
+    Lines go to the file at ``path``, or stderr when it is empty. A
+    negative threshold turns the log off.
+    """
+
+    def __init__(self, threshold_ms, path=''):
+        self.threshold = threshold_ms / 1000.0
+        self.logger = logging.getLogger('hospital.slow_queries')
+        self.logger.setLevel(logging.WARNING)
+        self.logger.propagate = False
+        if self.enabled and not self.logger.handlers:
+            handler = logging.FileHandler(path, encoding='utf-8') if path else logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self.logger.addHandler(handler)
+
+    @property
+    def enabled(self):
+        return self.threshold >= 0
+
+    def log(self, sql, params, elapsed, endpoint, many=False):
+        """Log the statement if it was slow; returns True if it was"""
+        if not self.enabled or elapsed < self.threshold:
+            return False
+        self.logger.warning("slow query %.1f ms endpoint=%s sql=%s params=%s",
+                            elapsed * 1000, endpoint, normalize_sql(sql), redact_params(params, many))
+        return True
+
+
+class SqlInstrumentation:
+    """Per-statement, per-request and connection-wait metrics plus the slow-query log"""
+
+    def __init__(self, slow_query_ms=200, slow_query_log='', prefix='hospital'):
+        self.registry = MetricsRegistry()
+        add = self.registry.add
+        self.requests = add(Counter(f"{prefix}_http_requests_total", "HTTP requests served",
+                                    ('endpoint', 'method', 'status')))
+        self.request_seconds = add(Histogram(f"{prefix}_http_request_duration_seconds",
+                                             "Time to produce a response", ('endpoint',)))
+        self.request_statements = add(Histogram(f"{prefix}_http_request_db_statements",
+                                                "SQL statements run per request", ('endpoint',),
+                                                STATEMENT_COUNT_BUCKETS))
+        self.statements = add(Counter(f"{prefix}_db_statements_total", "SQL statements executed",
+                                      ('endpoint', 'operation')))
+        self.statement_seconds = add(Histogram(f"{prefix}_db_statement_duration_seconds",
+                                               "Latency of a single SQL statement", ('operation',)))
+        self.statement_errors = add(Counter(f"{prefix}_db_statement_errors_total", "SQL statements that raised",
+                                            ('endpoint', 'operation')))
+        self.slow_statements = add(Counter(f"{prefix}_db_slow_statements_total",
+                                           "Statements written to the slow-query log", ('endpoint', 'operation')))
+        self.db_seconds = add(Counter(f"{prefix}_db_time_seconds_total",
+                                      "Time spent executing statements and fetching rows", ('endpoint',)))
+        self.rows = add(Counter(f"{prefix}_db_rows_returned_total", "Rows fetched from result sets", ('endpoint',)))
+        self.acquire_seconds = add(Histogram(f"{prefix}_db_acquire_wait_seconds",
+                                             "Time spent waiting for a pooled connection"))
+        self.slow_log = SlowQueryLog(slow_query_ms, slow_query_log)
+
+    def record_statement(self, stats, endpoint, sql, params, elapsed, many=False, failed=False):
+        operation = statement_operation(sql)
+        self.statements.inc(endpoint, operation)
+        self.statement_seconds.observe(elapsed, operation)
+        self.db_seconds.inc(endpoint, amount=elapsed)
+        if failed:
+            self.statement_errors.inc(endpoint, operation)
+        if stats is not None:
+            stats.queries += 1
+            stats.db_time += elapsed
+            stats.slowest = max(stats.slowest, elapsed)
+        if self.slow_log.log(sql, params, elapsed, endpoint, many):
+            self.slow_statements.inc(endpoint, operation)
+
+    def record_fetch(self, stats, endpoint, rows, elapsed):
+        self.rows.inc(endpoint, amount=rows)
+        self.db_seconds.inc(endpoint, amount=elapsed)
+        if stats is not None:
+            stats.rows += rows
+            stats.db_time += elapsed
+
+    def record_acquire(self, stats, elapsed):
+        self.acquire_seconds.observe(elapsed)
+        if stats is not None:
+            stats.acquire_wait += elapsed
+
+    def record_request(self, endpoint, method, status, elapsed, stats):
+        self.requests.inc(endpoint, method, str(status))
+        self.request_seconds.observe(elapsed, endpoint)
+        self.request_statements.observe(stats.queries if stats else 0, endpoint)
+
+    def render(self):
+        return self.registry.render()
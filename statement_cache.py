@@ -0,0 +1,190 @@
+import threading
+import weakref
+from collections import OrderedDict
+
+from sql_metrics import statement_operation
+
+# Statements that benefit from being parsed once; anything else runs as text
+PREPARABLE = {'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE'}
+# MySQL error for statements the prepared-statement protocol does not support
+ER_UNSUPPORTED_PS = 1295
+
+
+class StatementCache:
+    """LRU of prepared cursors for one connection, keyed on SQL text
+
+    Each cursor holds one server-side prepared statement, so a hit executes
+    with binary protocol parameters and no parse. Evicted cursors are closed,
+    which deallocates their statement on the server. Only used by whichever
+    thread has the connection checked out, so it needs no lock.
+    """
+
+    def __init__(self, connection, capacity, registry):
+        # Weak, or the registry's entry would keep its own key alive
+        self._connection = weakref.ref(connection)
+        self.capacity = capacity
+        self._registry = registry
+        self._entries = OrderedDict()  # sql -> (sql, cursor), most recently used last
+        self._unpreparable = set()
+
+    @property
+    def connection(self):
+        return self._connection()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, sql):
+        """Return (cached sql, prepared cursor), or None if sql should run as text
+
+        Callers must execute the cached sql object itself: mysql-connector
+        only skips the re-prepare when it gets the identical string back.
+        """
+        if sql in self._unpreparable or statement_operation(sql) not in PREPARABLE:
+            return None
+        entry = self._entries.get(sql)
+        if entry is not None:
+            self._entries.move_to_end(sql)
+            self._registry.count('hits')
+            return entry
+        self._registry.count('misses')
+        entry = self._entries[sql] = (sql, self.connection.cursor(prepared=True, dictionary=True))
+        if len(self._entries) > self.capacity:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._registry.count('evictions')
+            self._close(evicted)
+        return entry
+
+    def mark_unpreparable(self, sql):
+        """Run sql as text from now on (the server refused to prepare it)"""
+        entry = self._entries.pop(sql, None)
+        if entry is not None:
+            self._close(entry[1])
+        self._unpreparable.add(sql)
+        self._registry.count('unpreparable')
+
+    @staticmethod
+    def _close(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+
+class StatementCacheRegistry:
+    """Statement caches of all pooled connections, with shared counters
+
+    A connection's cache goes away with the connection, so connections the
+    pool discards take their prepared statements with them.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._caches = weakref.WeakKeyDictionary()
+        self._counts = {'hits': 0, 'misses': 0, 'evictions': 0, 'unpreparable': 0}
+
+    @property
+    def enabled(self):
+        return self.capacity > 0
+
+    def for_connection(self, connection):
+        with self._lock:
+            cache = self._caches.get(connection)
+            if cache is None:
+                cache = self._caches[connection] = StatementCache(connection, self.capacity, self)
+            return cache
+
+    def count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def stats(self):
+        """Counters plus the hit rate and how many statements are prepared right now"""
+        with self._lock:
+            stats = dict(self._counts)
+            caches = list(self._caches.values())
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['prepared'] = sum(len(cache) for cache in caches)
+        stats['connections'] = len(caches)
+        stats['capacity'] = self.capacity
+        return stats
+
+
+class CachedStatementCursor:
+    """Dictionary cursor that runs statements through a connection's statement cache
+
+    Results are read in full on execute, like a buffered cursor, because
+    unread rows of a prepared statement would block the connection. Bulk
+    executemany calls use a plain cursor: prepared statements would send
+    the rows one by one instead of as a multi-row INSERT.
+    """
+
+    def __init__(self, cache):
+        self._cache = cache
+        self._plain = None
+        self._rows = []
+        self._position = 0
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def _plain_cursor(self):
+        if self._plain is None:
+            self._plain = self._cache.connection.cursor(dictionary=True, buffered=True)
+        return self._plain
+
+    def execute(self, query, params=()):
+        entry = self._cache.lookup(query)
+        if entry is None:
+            cursor = self._plain_cursor()
+            cursor.execute(query, params)
+        else:
+            sql, cursor = entry
+            try:
+                cursor.execute(sql, params or ())
+            except Exception as e:
+                if getattr(e, 'errno', None) != ER_UNSUPPORTED_PS:
+                    raise
+                self._cache.mark_unpreparable(query)
+                cursor = self._plain_cursor()
+                cursor.execute(query, params)
+        self._capture(cursor)
+
+    def executemany(self, query, seq_params):
+        cursor = self._plain_cursor()
+        cursor.executemany(query, seq_params)
+        self._capture(cursor)
+
+    def _capture(self, cursor):
+        self.description = cursor.description
+        self._rows = cursor.fetchall() if cursor.description else []
+        self._position = 0
+        self.rowcount = len(self._rows) if cursor.description else cursor.rowcount
+        self.lastrowid = cursor.lastrowid
+
+    def fetchone(self):
+        if self._position >= len(self._rows):
+            return None
+        self._position += 1
+        return self._rows[self._position - 1]
+
+    def fetchmany(self, size=1):
+        rows = self._rows[self._position:self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._position:]
+        self._position = len(self._rows)
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        # Cached cursors stay open for the next statement on this connection
+        if self._plain is not None:
+            self._plain.close()
+            self._plain = None
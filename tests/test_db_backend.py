@@ -0,0 +1,24 @@
+from db_backend import SQLiteConnection
+
+
+def make_connection(tmp_path):
+    connection = SQLiteConnection(str(tmp_path / 'hospital.db'))
+    cursor = connection.cursor()
+    cursor.execute("CREATE TABLE rooms (room_id INTEGER PRIMARY KEY AUTOINCREMENT, room_number VARCHAR(10))")
+    return connection, cursor
+
+
+def test_insert_sets_lastrowid(tmp_path):
+    connection, cursor = make_connection(tmp_path)
+    cursor.execute("INSERT INTO rooms (room_number) VALUES (%s)", ('101',))
+    assert cursor.lastrowid == 1
+    connection.close()
+
+
+def test_update_of_missing_row_after_insert_has_no_lastrowid(tmp_path):
+    connection, cursor = make_connection(tmp_path)
+    cursor.execute("INSERT INTO rooms (room_number) VALUES (%s)", ('101',))
+    cursor.execute("UPDATE rooms SET room_number = %s WHERE room_id = %s", ('102', 999999))
+    assert cursor.rowcount == 0
+    assert not cursor.lastrowid
+    connection.close()
@@ -0,0 +1,51 @@
+import pytest
+
+from create_hospital_database import MigrationBlockedError, check_active_slots
+from db_backend import SQLiteConnection
+
+
+@pytest.fixture
+def cursor(tmp_path):
+    connection = SQLiteConnection(str(tmp_path / 'hospital.db'))
+    cursor = connection.cursor()
+    cursor.execute("""
+        CREATE TABLE appointments (
+            appointment_id INT AUTO_INCREMENT PRIMARY KEY,
+            patient_id INT NOT NULL,
+            doctor_id INT NOT NULL,
+            appointment_date DATE NOT NULL,
+            appointment_time TIME NOT NULL,
+            status VARCHAR(20) DEFAULT 'Scheduled'
+        )
+    """)
+    yield cursor
+    connection.close()
+
+
+def book(cursor, rows):
+    cursor.executemany(
+        "INSERT INTO appointments (patient_id, doctor_id, appointment_date, appointment_time, status) "
+        "VALUES (%s, %s, %s, %s, %s)", rows
+    )
+
+
+def test_active_slots_pass_without_duplicates(cursor):
+    book(cursor, [
+        (1, 1, '2026-10-18', '09:00:00', 'Scheduled'),
+        (2, 1, '2026-10-18', '09:00:00', 'Cancelled'),
+        (3, 2, '2026-10-18', '09:00:00', 'Scheduled'),
+    ])
+    check_active_slots(cursor)
+
+
+def test_active_slots_lists_duplicates(cursor):
+    book(cursor, [
+        (1, 1, '2026-10-18', '09:00:00', 'Scheduled'),
+        (2, 1, '2026-10-18', '09:00:00', 'In Progress'),
+        (3, 1, '2026-10-18', '09:30:00', 'Scheduled'),
+    ])
+    with pytest.raises(MigrationBlockedError) as blocked:
+        check_active_slots(cursor)
+    message = str(blocked.value)
+    assert "doctor 1 on 2026-10-18 at 09:00:00: appointments 1,2" in message
+    assert "09:30:00" not in message
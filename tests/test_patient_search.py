@@ -0,0 +1,52 @@
+import pytest
+
+from create_hospital_database import SCHEMA_MIGRATIONS
+from db_backend import SQLiteConnection
+from patient_search import build_search_query
+
+PHONE_MIGRATIONS = (3, 7)
+
+
+@pytest.fixture
+def cursor(tmp_path):
+    connection = SQLiteConnection(str(tmp_path / 'hospital.db'))
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute("""
+        CREATE TABLE patients (
+            patient_id INT AUTO_INCREMENT PRIMARY KEY,
+            first_name VARCHAR(50) NOT NULL,
+            last_name VARCHAR(50) NOT NULL,
+            phone VARCHAR(15),
+            email VARCHAR(100),
+            date_of_birth DATE
+        )
+    """)
+    for version, _, statements in SCHEMA_MIGRATIONS:
+        if version in PHONE_MIGRATIONS:
+            for statement in statements:
+                cursor.execute(statement)
+    cursor.executemany(
+        "INSERT INTO patients (first_name, last_name, phone) VALUES (%s, %s, %s)",
+        [('Kavya', 'Saxena', '+91-6000007919'), ('Arjun', 'Mehta', '+91-9876543210')]
+    )
+    yield cursor
+    connection.close()
+
+
+def search(cursor, term):
+    cursor.execute(*build_search_query(term, 50, 'fulltext'))
+    return [row['first_name'] for row in cursor.fetchall()]
+
+
+@pytest.mark.parametrize('term', ['7919', '007919', '6000007919', '+91-6000007919', '916000007919'])
+def test_phone_suffix(cursor, term):
+    assert search(cursor, term) == ['Kavya']
+
+
+@pytest.mark.parametrize('term', ['600000', '6000007', '+91 60000', '91600'])
+def test_phone_prefix(cursor, term):
+    assert search(cursor, term) == ['Kavya']
+
+
+def test_phone_digits_in_the_middle_do_not_match(cursor):
+    assert search(cursor, '00079') == []
@@ -3,10 +3,471 @@ from tkinter import ttk, messagebox, font
 from tkcalendar import DateEntry
 from datetime import date, datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import threading
 import time
 import math
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# (connect, read) timeouts in seconds; the longest matching endpoint prefix wins
+DEFAULT_TIMEOUT = (3.05, 10)
+ENDPOINT_TIMEOUTS = {
+    'test': (3.05, 5),
+    'sync/': (3.05, 30),
+    'records/sorted': (3.05, 60),
+    'patients/sorted': (3.05, 60),
+    'appointments/sorted': (3.05, 60),
+    'appointments/bulk': (3.05, 120),
+    'patients/import': (3.05, 600)
+}
+
+# Rows per server page for paged lists and sort results
+SERVER_PAGE_SIZE = 500
+
+def request_timeout(endpoint):
+    """Timeout for an endpoint from ENDPOINT_TIMEOUTS"""
+    path = endpoint.split('?')[0]
+    matches = [prefix for prefix in ENDPOINT_TIMEOUTS if path.startswith(prefix)]
+    return ENDPOINT_TIMEOUTS[max(matches, key=len)] if matches else DEFAULT_TIMEOUT
+
+def create_http_session():
+    """Shared keep-alive session for all API calls
+
+    Connections to the Flask server are pooled and reused, so GUI actions
+    skip the TCP handshake. Only idempotent methods are retried, with
+    backoff, on connection errors and 502/503/504; a POST such as a booking
+    is never sent twice.
+    """
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    return session
+
+class RequestStats:
+    """Latency of API calls per method and endpoint"""
+    
+    SLOW_CALL_SECONDS = 1.0
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+    
+    @staticmethod
+    def endpoint_key(endpoint):
+        """Group calls by path, with IDs and the query string dropped"""
+        path = endpoint.split('?')[0]
+        return '/'.join('{id}' if part.isdigit() else part for part in path.split('/'))
+    
+    def record(self, method, endpoint, elapsed, status):
+        key = f"{method} {self.endpoint_key(endpoint)}"
+        elapsed_ms = elapsed * 1000
+        with self.lock:
+            entry = self.calls.setdefault(key, {'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            entry['last_ms'] = elapsed_ms
+            if status is None or status >= 400:
+                entry['errors'] += 1
+        if elapsed >= self.SLOW_CALL_SECONDS:
+            print(f"🐢 Slow API call: {key} took {elapsed_ms:.0f} ms")
+    
+    def snapshot(self):
+        """Per-endpoint counters with the mean latency filled in"""
+        with self.lock:
+            return {key: dict(entry, mean_ms=round(entry['total_ms'] / entry['count'], 2))
+                    for key, entry in self.calls.items()}
+
+class BackgroundTask:
+    """Handle passed to a scheduled function for talking back to the UI"""
+    
+    def __init__(self, scheduler, key, generation):
+        self.scheduler = scheduler
+        self.key = key
+        self.generation = generation
+    
+    @property
+    def cancelled(self):
+        """True once a newer submission or cancel() has superseded this task"""
+        return not self.scheduler.is_current(self.key, self.generation)
+    
+    def ui(self, callback):
+        """Run callback on the Tk thread, unless the task has been superseded by then"""
+        if self.cancelled:
+            return
+        
+        def run():
+            if not self.cancelled:
+                callback()
+        
+        self.scheduler.root.after(0, run)
+
+class TaskScheduler:
+    """Runs GUI background work on a fixed pool of worker threads
+
+    Work is submitted under a key naming the widget it repaints. Every
+    submission bumps that key's generation, so older work for the key is
+    dropped if it has not started and its UI callbacks are skipped if it has;
+    the newest request always wins. With debounce_ms, submissions arriving
+    within that window are coalesced into the last one. With
+    skip_if_running, a submission is ignored while work for the key is still
+    in flight (used for writes, so a double click does not book twice).
+    """
+    
+    def __init__(self, root, max_workers=4):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='gui-task')
+        # Reentrant: submit() starts undebounced work while holding it
+        self.lock = threading.RLock()
+        self.generations = {}
+        self.timers = {}
+        self.running = {}
+    
+    def submit(self, key, fn, debounce_ms=0, skip_if_running=False):
+        """Schedule fn(task) for key, superseding earlier work for the same key"""
+        with self.lock:
+            if skip_if_running and self.running.get(key):
+                return None
+            generation = self.generations.get(key, 0) + 1
+            self.generations[key] = generation
+            timer = self.timers.pop(key, None)
+            if timer:
+                timer.cancel()
+            
+            task = BackgroundTask(self, key, generation)
+            if debounce_ms:
+                timer = threading.Timer(debounce_ms / 1000, self._start, args=(task, fn))
+                timer.daemon = True
+                self.timers[key] = timer
+                timer.start()
+            else:
+                self._start(task, fn)
+        return task
+    
+    def _start(self, task, fn):
+        with self.lock:
+            if task.cancelled:
+                return
+            self.timers.pop(task.key, None)
+            self.running[task.key] = self.running.get(task.key, 0) + 1
+        try:
+            self.executor.submit(self._run, task, fn)
+        except RuntimeError:
+            # Executor already shut down (window closing)
+            self._finish(task)
+    
+    def _run(self, task, fn):
+        try:
+            if not task.cancelled:
+                fn(task)
+        except Exception as e:
+            print(f"Background task '{task.key}' failed: {e}")
+        finally:
+            self._finish(task)
+    
+    def _finish(self, task):
+        with self.lock:
+            self.running[task.key] -= 1
+    
+    def is_current(self, key, generation):
+        with self.lock:
+            return self.generations.get(key) == generation
+    
+    def cancel(self, key):
+        """Drop pending work for key and the UI updates of running work"""
+        with self.lock:
+            self.generations[key] = self.generations.get(key, 0) + 1
+            timer = self.timers.pop(key, None)
+            if timer:
+                timer.cancel()
+    
+    def shutdown(self):
+        """Cancel everything and stop accepting work"""
+        with self.lock:
+            for key in list(self.generations):
+                self.generations[key] += 1
+            for timer in self.timers.values():
+                timer.cancel()
+            self.timers.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class LazyTreeview:
+    """Fills a ttk.Treeview a chunk at a time, only as far as the user scrolls
+
+    Rows become Treeview items in after()-scheduled chunks, so the Tk main
+    loop never blocks on a large result, and only until the visible area
+    plus a look-ahead is filled; more are added as the scrollbar nears the
+    end. When the rows in hand run out, fetch_more (run on the task
+    scheduler) loads the next server page.
+    """
+    
+    CHUNK_SIZE = 100
+    LOOKAHEAD_ROWS = 200
+    NEAR_END = 0.9
+    
+    def __init__(self, tree, scrollbar, scheduler, key):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.scheduler = scheduler
+        self.key = key
+        self.pending = deque()
+        self.format_row = None
+        self.iid_for = None
+        self.fetch_more = None
+        self.on_change = None
+        self.generation = 0
+        self.count = 0
+        self.fill_target = 0
+        self.filling = False
+        self.fetching = False
+        tree.configure(yscrollcommand=self._on_scroll)
+    
+    def load(self, rows, format_row, fetch_more=None, iid_for=None, on_change=None):
+        """Replace the contents with rows (dicts) turned into values by format_row
+
+        fetch_more() returns (rows, has_more) for the next page, or is None
+        when rows is everything. iid_for(row) picks the item id; on_change
+        is called after rows are added.
+        """
+        self.generation += 1
+        self.scheduler.cancel(self.key)
+        self.tree.delete(*self.tree.get_children())
+        self.pending = deque(rows)
+        self.format_row = format_row
+        self.iid_for = iid_for
+        self.fetch_more = fetch_more
+        self.on_change = on_change
+        self.count = 0
+        self.fill_target = self.LOOKAHEAD_ROWS
+        self.filling = False
+        self.fetching = False
+        self._schedule_fill()
+    
+    def clear(self):
+        self.load([], None)
+    
+    @property
+    def loaded(self):
+        """Rows received so far, shown or not"""
+        return self.count + len(self.pending)
+    
+    @property
+    def has_more(self):
+        """True while the server has pages that have not been fetched"""
+        return self.fetch_more is not None
+    
+    def _schedule_fill(self):
+        if not self.filling:
+            self.filling = True
+            self.tree.after(1, self._fill_chunk, self.generation)
+    
+    def _fill_chunk(self, generation):
+        if generation != self.generation:
+            return
+        self.filling = False
+        
+        inserted = 0
+        while self.pending and inserted < self.CHUNK_SIZE and self.count < self.fill_target:
+            row = self.pending.popleft()
+            iid = self.iid_for(row) if self.iid_for else None
+            self.tree.insert('', 'end', iid=iid, values=self.format_row(row))
+            self.count += 1
+            inserted += 1
+        
+        if self.count < self.fill_target:
+            if self.pending:
+                self._schedule_fill()
+            else:
+                self._fetch_next()
+        if inserted and self.on_change:
+            self.on_change(self)
+    
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if float(last) < self.NEAR_END:
+            return
+        self.fill_target = max(self.fill_target, self.count + self.LOOKAHEAD_ROWS)
+        if self.pending:
+            self._schedule_fill()
+        else:
+            self._fetch_next()
+    
+    def _fetch_next(self):
+        if self.fetch_more is None or self.fetching:
+            return
+        self.fetching = True
+        generation = self.generation
+        fetch_more = self.fetch_more
+        
+        def fetch(task):
+            try:
+                rows, more = fetch_more()
+            except Exception as e:
+                print(f"Failed to load more rows: {e}")
+                # Keep fetch_more so the next scroll retries
+                task.ui(lambda: self._fetch_done(generation, [], True))
+                return
+            task.ui(lambda: self._fetch_done(generation, rows, more))
+        
+        self.scheduler.submit(self.key, fetch)
+    
+    def _fetch_done(self, generation, rows, more):
+        if generation != self.generation:
+            return
+        self.fetching = False
+        if not more:
+            self.fetch_more = None
+        self.pending.extend(rows)
+        if rows:
+            self._schedule_fill()
+        if self.on_change:
+            self.on_change(self)
+
+class TableReplica:
+    """Local copy of one table, kept current through /api/sync deltas"""
+    
+    def __init__(self, table):
+        self.table = table
+        self.rows = {}
+        self.token = None
+        self.lock = threading.Lock()
+    
+    def apply(self, response):
+        """Apply one /api/sync response: upserts first, then deletes"""
+        key = response['key']
+        data = response['data']
+        if response['reset']:
+            self.rows = {}
+        for row in data['upserts']:
+            self.rows[row[key]] = row
+        for row_id in data['deletes']:
+            self.rows.pop(row_id, None)
+        self.token = response['next_token']
+        return len(data['upserts']) + len(data['deletes'])
+
+class RecordCache:
+    """Least recently used cache of full medical records by record_id"""
+    
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self.records = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def get(self, record_id):
+        with self.lock:
+            record = self.records.get(record_id)
+            if record is not None:
+                self.records.move_to_end(record_id)
+            return record
+    
+    def put(self, record_id, record):
+        with self.lock:
+            self.records[record_id] = record
+            self.records.move_to_end(record_id)
+            while len(self.records) > self.max_size:
+                self.records.popitem(last=False)
+
+class EventStream:
+    """Reads the server's /api/events Server-Sent Events stream
+
+    Runs on its own daemon thread, since the stream stays open for good and
+    would hold a scheduler worker forever. Each event is handed to on_event
+    on the Tk thread. A dropped connection is retried with backoff and
+    resumes from Last-Event-ID.
+    """
+    
+    # Longer than the server's 15 s heartbeat, so only a dead stream times out
+    READ_TIMEOUT = 45
+    MAX_BACKOFF = 30
+    
+    def __init__(self, root, url, on_event):
+        self.root = root
+        self.url = url
+        self.on_event = on_event
+        self.http = create_http_session()
+        self.last_event_id = None
+        self.backoff = 1
+        self.response = None
+        self.stopped = threading.Event()
+        self.thread = None
+    
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='event-stream', daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.stopped.set()
+        response = self.response
+        if response is not None:
+            response.close()
+    
+    def _run(self):
+        while not self.stopped.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                if self.stopped.is_set():
+                    break
+                print(f"Event stream disconnected: {e}")
+            self.stopped.wait(self.backoff)
+            self.backoff = min(self.backoff * 2, self.MAX_BACKOFF)
+    
+    def _listen(self):
+        headers = {'Accept': 'text/event-stream'}
+        if self.last_event_id:
+            headers['Last-Event-ID'] = self.last_event_id
+        
+        with self.http.get(self.url, headers=headers, stream=True,
+                           timeout=(3.05, self.READ_TIMEOUT)) as response:
+            response.raise_for_status()
+            self.response = response
+            self.backoff = 1
+            
+            event_type, event_id, data_lines = 'message', None, []
+            for line in response.iter_lines(decode_unicode=True):
+                if self.stopped.is_set():
+                    return
+                if not line:
+                    # A blank line ends an event
+                    if data_lines:
+                        if event_id:
+                            self.last_event_id = event_id
+                        self._dispatch(event_type, json.loads('\n'.join(data_lines)))
+                    event_type, event_id, data_lines = 'message', None, []
+                    continue
+                if line.startswith(':'):
+                    continue  # heartbeat comment
+                field, _, value = line.partition(':')
+                if value.startswith(' '):
+                    value = value[1:]
+                if field == 'event':
+                    event_type = value
+                elif field == 'id':
+                    event_id = value
+                elif field == 'data':
+                    data_lines.append(value)
+    
+    def _dispatch(self, event_type, data):
+        if not self.stopped.is_set():
+            self.root.after(0, self.on_event, event_type, data)
 
 class HospitalFlaskGUI:
     def __init__(self, root):
@@ -57,6 +518,26 @@ class HospitalFlaskGUI:
         # API base URL
         self.api_base = "http://localhost:5000/api"
         
+        # Keep-alive HTTP session and per-endpoint latency counters
+        self.http = create_http_session()
+        self.request_stats = RequestStats()
+        
+        # Bounded pool for background work started by buttons
+        self.tasks = TaskScheduler(self.root, max_workers=4)
+        
+        # Last response body and ETag per GET URL, for conditional requests
+        self.etag_cache = {}
+        
+        # Local replicas refreshed with delta syncs instead of full reloads,
+        # only for tables the GUI lists in full
+        self.replicas = {'patients': TableReplica('patients')}
+        
+        # Server date of the dashboard on screen (CURDATE(), not the client's clock)
+        self.dashboard_date = None
+        
+        # Recently opened medical records, so reopening one needs no request
+        self.record_cache = RecordCache()
+        
         # Configure perfect styling
         self.configure_perfect_styles()
         
@@ -66,10 +547,14 @@ class HospitalFlaskGUI:
         # Create perfect GUI
         self.create_perfect_widgets()
         
+        # Live dashboard updates pushed by the server
+        self.events = EventStream(self.root, f"{self.api_base}/events", self.apply_dashboard_event)
+        self.events.start()
+        
     def test_api_connection(self):
         """Test Flask API connection"""
         try:
-            response = requests.get(f"{self.api_base}/test", timeout=5)
+            response = self.http.get(f"{self.api_base}/test", timeout=request_timeout('test'))
             if response.status_code == 200:
                 print("✅ Flask API connection successful!")
                 messagebox.showinfo("Success", "✅ Connected to Flask API successfully!")
@@ -421,21 +906,34 @@ class HospitalFlaskGUI:
         ]
 
     def api_request(self, endpoint, method='GET', data=None):
-        """Make API request"""
+        """Make API request over the shared keep-alive session"""
+        started = time.perf_counter()
+        status = None
         try:
             url = f"{self.api_base}/{endpoint}"
+            timeout = request_timeout(endpoint)
+            cached = None
             
             if method == 'GET':
-                response = requests.get(url, timeout=10)
+                cached = self.etag_cache.get(url)
+                headers = {'If-None-Match': cached[0]} if cached else {}
+                response = self.http.get(url, headers=headers, timeout=timeout)
             elif method == 'POST':
-                response = requests.post(url, json=data, timeout=10)
+                response = self.http.post(url, json=data, timeout=timeout)
             elif method == 'PUT':
-                response = requests.put(url, json=data, timeout=10)
+                response = self.http.put(url, json=data, timeout=timeout)
             else:
                 raise Exception(f"Unsupported method: {method}")
+            status = response.status_code
             
+            if response.status_code == 304 and cached:
+                # Unchanged on the server: reuse the body we already have
+                return cached[1]
             if response.status_code == 200:
-                return response.json()
+                result = response.json()
+                if method == 'GET' and response.headers.get('ETag'):
+                    self.etag_cache[url] = (response.headers['ETag'], result)
+                return result
             else:
                 error_data = response.json() if response.content else {'message': 'Unknown error'}
                 raise Exception(error_data.get('message', 'API request failed'))
@@ -444,6 +942,96 @@ class HospitalFlaskGUI:
             raise Exception(f"Network error: {e}")
         except Exception as e:
             raise Exception(str(e))
+        finally:
+            self.request_stats.record(method, endpoint, time.perf_counter() - started, status)
+    
+    def show_api_stats(self):
+        """Show call counts and latency per API endpoint, slowest total first"""
+        stats = self.request_stats.snapshot()
+        if not stats:
+            messagebox.showinfo("API Stats", "No API calls made yet")
+            return
+        
+        lines = []
+        for key, entry in sorted(stats.items(), key=lambda item: item[1]['total_ms'], reverse=True):
+            lines.append(f"{key}\n    {entry['count']} calls, {entry['errors']} errors, "
+                         f"mean {entry['mean_ms']:.0f} ms, max {entry['max_ms']:.0f} ms, "
+                         f"last {entry['last_ms']:.0f} ms")
+        messagebox.showinfo("API Stats", "\n".join(lines))
+    
+    def sync_replica(self, table):
+        """Bring a local replica up to date and return a snapshot of its rows"""
+        replica = self.replicas[table]
+        with replica.lock:
+            endpoint = f"sync/{table}"
+            if replica.token:
+                endpoint += f"?since={replica.token}"
+            
+            response = self.api_request(endpoint)
+            if response['status'] != 'success':
+                raise Exception(response.get('message', f'Failed to sync {table}'))
+            
+            replica.apply(response)
+            return list(replica.rows.values())
+    
+    def page_fetcher(self, endpoint, pagination, method='GET', data=None):
+        """fetch_more callable for LazyTreeview that follows server keyset pages"""
+        if not pagination or not pagination.get('has_more'):
+            return None
+        state = {'cursor': pagination['next_cursor']}
+        
+        def fetch_more():
+            if method == 'GET':
+                separator = '&' if '?' in endpoint else '?'
+                response = self.api_request(f"{endpoint}{separator}after={state['cursor']}")
+            else:
+                response = self.api_request(endpoint, method=method, data=dict(data, after=state['cursor']))
+            if response['status'] != 'success':
+                raise Exception(response.get('message', 'Failed to load more rows'))
+            
+            page = response.get('pagination') or {}
+            state['cursor'] = page.get('next_cursor')
+            return response['data'], bool(page.get('has_more'))
+        
+        return fetch_more
+    
+    @staticmethod
+    def record_row_values(record):
+        """Values of one row in the medical records table"""
+        # Format date
+        visit_date = str(record.get('visit_date', 'N/A'))
+        if visit_date != 'N/A':
+            try:
+                date_obj = datetime.strptime(visit_date.split()[0], '%Y-%m-%d')
+                visit_date = date_obj.strftime('%d/%m/%Y')
+            except ValueError:
+                pass
+        
+        # Truncate long text for display
+        diagnosis = record.get('diagnosis', 'N/A') or 'N/A'
+        treatment = record.get('treatment', 'N/A') or 'N/A'
+        prescription = record.get('prescription', 'N/A') or 'N/A'
+        
+        return (
+            visit_date,
+            f"Dr. {record['doctor_first_name']} {record['doctor_last_name']}",
+            record['specialization'],
+            diagnosis[:40] + '...' if len(diagnosis) > 40 else diagnosis,
+            treatment[:40] + '...' if len(treatment) > 40 else treatment,
+            prescription[:30] + '...' if len(prescription) > 30 else prescription
+        )
+    
+    @staticmethod
+    def patient_row_values(patient):
+        """Values of one row in the patients table"""
+        return (
+            patient['patient_id'],
+            f"{patient['first_name']} {patient['last_name']}",
+            patient['phone'] or 'N/A',
+            patient['email'] or 'N/A',
+            patient['date_of_birth'],
+            patient.get('gender', 'N/A')
+        )
     
     def create_perfect_widgets(self):
         """Create perfect professional GUI with advanced styling"""
@@ -654,6 +1242,13 @@ class HospitalFlaskGUI:
         )
         settings_btn.pack(side='left', padx=10)
         
+        # API latency per endpoint, from the client's point of view
+        api_stats_btn = self.create_perfect_button(
+            button_container, "⏱️ API Stats", 
+            self.show_api_stats, self.colors['secondary']
+        )
+        api_stats_btn.pack(side='left', padx=10)
+        
         # Perfect info panel
         info_panel = tk.Frame(actions_content, bg='#f0f9ff', relief='flat', bd=0)
         info_panel.pack(fill='x', pady=(20,0))
@@ -963,6 +1558,7 @@ class HospitalFlaskGUI:
         h_scrollbar = ttk.Scrollbar(results_frame, orient='horizontal', command=self.patients_tree.xview)
         
         self.patients_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.patients_view = LazyTreeview(self.patients_tree, v_scrollbar, self.tasks, 'patients_tree:pages')
         
         self.patients_tree.pack(side='left', fill='both', expand=True)
         v_scrollbar.pack(side='right', fill='y')
@@ -1335,6 +1931,7 @@ class HospitalFlaskGUI:
         h_scrollbar = ttk.Scrollbar(table_frame, orient='horizontal', command=self.records_tree.xview)
         
         self.records_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.records_view = LazyTreeview(self.records_tree, v_scrollbar, self.tasks, 'medical_records:pages')
         
         # Bind double-click to show detailed record
         self.records_tree.bind('<Double-1>', self.show_detailed_record)
@@ -1350,11 +1947,12 @@ class HospitalFlaskGUI:
     
     def refresh_dashboard(self):
         """Refresh dashboard data"""
-        def refresh_thread():
+        def refresh_thread(task):
             try:
                 # Update status on main thread
-                self.root.after(0, lambda: self.status_var.set("Refreshing dashboard..."))
+                task.ui(lambda: self.status_var.set("Refreshing dashboard..."))
                 
+                # Conditional request: an unchanged dashboard comes back as a 304
                 response = self.api_request('dashboard')
                 
                 if response['status'] == 'success':
@@ -1362,6 +1960,8 @@ class HospitalFlaskGUI:
                     
                     # Update GUI elements on main thread
                     def update_gui():
+                        self.dashboard_date = data.get('today')
+                        
                         # Update metrics
                         self.patient_count_label.config(text=str(data['patient_count']))
                         self.doctor_count_label.config(text=str(data['doctor_count']))
@@ -1371,18 +1971,12 @@ class HospitalFlaskGUI:
                         # Update appointments tree
                         self.apt_tree.delete(*self.apt_tree.get_children())
                         for apt in data['today_appointments']:
-                            time_str = str(apt['appointment_time']) if apt['appointment_time'] else 'N/A'
-                            self.apt_tree.insert('', 'end', values=(
-                                time_str,
-                                f"{apt['first_name']} {apt['last_name']}",
-                                f"Dr. {apt['doctor_first_name']} {apt['doctor_last_name']}",
-                                apt['status'],
-                                apt.get('reason', 'N/A')[:50] + '...' if apt.get('reason', '') and len(apt.get('reason', '')) > 50 else apt.get('reason', 'N/A')
-                            ))
+                            iid = str(apt['appointment_id']) if apt.get('appointment_id') else None
+                            self.apt_tree.insert('', 'end', iid=iid, values=self.appointment_row_values(apt))
                         
                         self.status_var.set("Dashboard refreshed successfully")
                     
-                    self.root.after(0, update_gui)
+                    task.ui(update_gui)
                 else:
                     raise Exception(response.get('message', 'Unknown error'))
                     
@@ -1391,14 +1985,74 @@ class HospitalFlaskGUI:
                     messagebox.showerror("Error", f"Failed to refresh dashboard: {e}")
                     self.status_var.set("Dashboard refresh failed")
                 
-                self.root.after(0, show_error)
+                task.ui(show_error)
         
-        # Run in thread to prevent GUI freezing
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        # Run in the background; rapid refresh clicks are coalesced into one
+        self.tasks.submit('dashboard', refresh_thread, debounce_ms=250)
+    
+    @staticmethod
+    def appointment_row_values(apt):
+        """Values of one row in the dashboard's appointments table"""
+        time_str = str(apt['appointment_time']) if apt['appointment_time'] else 'N/A'
+        return (
+            time_str,
+            f"{apt['first_name']} {apt['last_name']}",
+            f"Dr. {apt['doctor_first_name']} {apt['doctor_last_name']}",
+            apt['status'],
+            apt.get('reason', 'N/A')[:50] + '...' if apt.get('reason', '') and len(apt.get('reason', '')) > 50 else apt.get('reason', 'N/A')
+        )
+    
+    def apply_dashboard_event(self, event_type, data):
+        """Patch the dashboard in place from one /api/events event"""
+        today = self.dashboard_date
+        
+        if event_type == 'appointment_booked':
+            iid = str(data['appointment_id'])
+            if data['appointment_date'] != today or self.apt_tree.exists(iid):
+                return
+            
+            def time_key(value):
+                try:
+                    return tuple(int(part) for part in str(value).split(':'))
+                except ValueError:
+                    return ()
+            
+            # Keep the table ordered by time
+            new_time = time_key(data['appointment_time'])
+            children = self.apt_tree.get_children()
+            index = next((i for i, child in enumerate(children)
+                          if time_key(self.apt_tree.set(child, 'Time')) > new_time), len(children))
+            self.apt_tree.insert('', index, iid=iid, values=self.appointment_row_values(data))
+            self.apt_count_label.config(text=str(len(children) + 1))
+        
+        elif event_type == 'appointment_status':
+            iid = str(data['appointment_id'])
+            if self.apt_tree.exists(iid):
+                self.apt_tree.set(iid, 'Status', data['status'])
+        
+        elif event_type == 'room_occupancy':
+            self.room_count_label.config(text=str(data['available_rooms']))
+        
+        elif event_type == 'patients_added':
+            # Recount rather than add, so a refresh that already saw the
+            # new patients does not count them twice
+            def recount(task):
+                count = self.api_request('dashboard')['data']['patient_count']
+                task.ui(lambda: self.patient_count_label.config(text=str(count)))
+            
+            self.tasks.submit('dashboard:patients', recount, debounce_ms=250)
+        
+        elif event_type == 'appointments_bulk_booked':
+            if today in data['dates']:
+                self.refresh_dashboard()
+        
+        elif event_type == 'resync':
+            # Events were missed; reload everything
+            self.refresh_dashboard()
     
     def register_patient(self):
         """Register new patient"""
-        def register_thread():
+        def register_thread(task):
             try:
                 # Validate required fields (get values on main thread)
                 first_name = self.first_name_entry.get()
@@ -1406,10 +2060,10 @@ class HospitalFlaskGUI:
                 gender = self.gender_combo.get()
                 
                 if not all([first_name, last_name, gender]):
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Please fill in all required fields (*)"))
+                    task.ui(lambda: messagebox.showerror("Error", "Please fill in all required fields (*)"))
                     return
                 
-                self.root.after(0, lambda: self.status_var.set("Registering patient..."))
+                task.ui(lambda: self.status_var.set("Registering patient..."))
                 
                 # Prepare patient data
                 patient_data = {
@@ -1432,7 +2086,7 @@ class HospitalFlaskGUI:
                         self.refresh_dashboard()
                         self.status_var.set("Patient registered successfully")
                     
-                    self.root.after(0, success_callback)
+                    task.ui(success_callback)
                 else:
                     raise Exception(response.get('message', 'Registration failed'))
                     
@@ -1441,9 +2095,9 @@ class HospitalFlaskGUI:
                     messagebox.showerror("Error", f"Registration failed: {e}")
                     self.status_var.set("Patient registration failed")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=register_thread, daemon=True).start()
+        self.tasks.submit('register_patient', register_thread, skip_if_running=True)
     
     def clear_patient_form(self):
         """Clear patient form"""
@@ -1457,34 +2111,25 @@ class HospitalFlaskGUI:
     
     def search_patients(self):
         """Search patients"""
-        def search_thread():
+        def search_thread(task):
             try:
                 search_term = self.search_entry.get()
                 if not search_term:
-                    self.root.after(0, lambda: messagebox.showwarning("Warning", "Please enter a search term"))
+                    task.ui(lambda: messagebox.showwarning("Warning", "Please enter a search term"))
                     return
                 
-                self.root.after(0, lambda: self.status_var.set("Searching patients..."))
+                task.ui(lambda: self.status_var.set("Searching patients..."))
                 
                 response = self.api_request('patients/search', method='POST', data={'search_term': search_term})
                 
                 if response['status'] == 'success':
                     def update_results():
-                        self.patients_tree.delete(*self.patients_tree.get_children())
-                        
-                        for patient in response['data']:
-                            self.patients_tree.insert('', 'end', values=(
-                                patient['patient_id'],
-                                f"{patient['first_name']} {patient['last_name']}",
-                                patient['phone'] or 'N/A',
-                                patient['email'] or 'N/A',
-                                patient['date_of_birth'],
-                                patient.get('gender', 'N/A')
-                            ))
+                        self.patients_view.load(response['data'], self.patient_row_values,
+                                                fetch_more=self.page_fetcher('patients', response.get('pagination')))
                         
                         self.status_var.set(f"Found {len(response['data'])} patients")
                     
-                    self.root.after(0, update_results)
+                    task.ui(update_results)
                 else:
                     raise Exception(response.get('message', 'Search failed'))
                     
@@ -1493,35 +2138,36 @@ class HospitalFlaskGUI:
                     messagebox.showerror("Error", f"Search failed: {e}")
                     self.status_var.set("Patient search failed")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=search_thread, daemon=True).start()
+        self.tasks.submit('patients_tree', search_thread, debounce_ms=300)
     
     def load_all_patients(self):
         """Load all patients"""
-        def load_thread():
+        def load_thread(task):
             try:
-                self.root.after(0, lambda: self.status_var.set("Loading all patients..."))
+                task.ui(lambda: self.status_var.set("Loading all patients..."))
                 
-                response = self.api_request('patients')
+                try:
+                    patients = self.sync_replica('patients')
+                    patients.sort(key=lambda p: (p['first_name'].casefold(), p['last_name'].casefold(), p['patient_id']))
+                    response = {'status': 'success', 'data': patients}
+                except Exception as e:
+                    # Server without delta sync (schema migration 6): page through the list
+                    print(f"Patient sync failed, loading page by page: {e}")
+                    response = self.api_request(f'patients?limit={SERVER_PAGE_SIZE}')
                 
                 if response['status'] == 'success':
                     def update_patients():
-                        self.patients_tree.delete(*self.patients_tree.get_children())
-                        
-                        for patient in response['data']:
-                            self.patients_tree.insert('', 'end', values=(
-                                patient['patient_id'],
-                                f"{patient['first_name']} {patient['last_name']}",
-                                patient['phone'] or 'N/A',
-                                patient['email'] or 'N/A',
-                                patient['date_of_birth'],
-                                patient.get('gender', 'N/A')
-                            ))
+                        self.patients_view.load(response['data'], self.patient_row_values,
+                                                fetch_more=self.page_fetcher('patients', response.get('pagination')))
                         
-                        self.status_var.set(f"Loaded {len(response['data'])} patients")
+                        if response.get('pagination', {}).get('has_more'):
+                            self.status_var.set(f"Loaded first {len(response['data'])} patients, more load as you scroll")
+                        else:
+                            self.status_var.set(f"Loaded {len(response['data'])} patients")
                     
-                    self.root.after(0, update_patients)
+                    task.ui(update_patients)
                 else:
                     raise Exception(response.get('message', 'Failed to load patients'))
                     
@@ -1530,15 +2176,15 @@ class HospitalFlaskGUI:
                     messagebox.showerror("Error", f"Failed to load patients: {e}")
                     self.status_var.set("Failed to load patients")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self.tasks.submit('patients_tree', load_thread)
     
     def refresh_patient_search(self):
         """Refresh patient search results"""
-        def refresh_thread():
+        def refresh_thread(task):
             try:
-                self.root.after(0, lambda: self.status_var.set("Refreshing patient data..."))
+                task.ui(lambda: self.status_var.set("Refreshing patient data..."))
                 
                 # Clear current search
                 search_term = self.search_entry.get()
@@ -1549,21 +2195,12 @@ class HospitalFlaskGUI:
                     
                     if response['status'] == 'success':
                         def update_search_results():
-                            self.patients_tree.delete(*self.patients_tree.get_children())
-                            
-                            for patient in response['data']:
-                                self.patients_tree.insert('', 'end', values=(
-                                    patient['patient_id'],
-                                    f"{patient['first_name']} {patient['last_name']}",
-                                    patient['phone'] or 'N/A',
-                                    patient['email'] or 'N/A',
-                                    patient['date_of_birth'],
-                                    patient.get('gender', 'N/A')
-                                ))
+                            self.patients_view.load(response['data'], self.patient_row_values,
+                                                    fetch_more=self.page_fetcher('patients', response.get('pagination')))
                             
                             self.status_var.set(f"Refreshed: Found {len(response['data'])} patients")
                         
-                        self.root.after(0, update_search_results)
+                        task.ui(update_search_results)
                     else:
                         raise Exception(response.get('message', 'Refresh failed'))
                 else:
@@ -1572,21 +2209,12 @@ class HospitalFlaskGUI:
                     
                     if response['status'] == 'success':
                         def update_all_results():
-                            self.patients_tree.delete(*self.patients_tree.get_children())
-                            
-                            for patient in response['data']:
-                                self.patients_tree.insert('', 'end', values=(
-                                    patient['patient_id'],
-                                    f"{patient['first_name']} {patient['last_name']}",
-                                    patient['phone'] or 'N/A',
-                                    patient['email'] or 'N/A',
-                                    patient['date_of_birth'],
-                                    patient.get('gender', 'N/A')
-                                ))
+                            self.patients_view.load(response['data'], self.patient_row_values,
+                                                    fetch_more=self.page_fetcher('patients', response.get('pagination')))
                             
                             self.status_var.set(f"Refreshed: Loaded {len(response['data'])} patients")
                         
-                        self.root.after(0, update_all_results)
+                        task.ui(update_all_results)
                     else:
                         raise Exception(response.get('message', 'Refresh failed'))
                         
@@ -1595,29 +2223,29 @@ class HospitalFlaskGUI:
                     messagebox.showerror("Error", f"Refresh failed: {e}")
                     self.status_var.set("Patient refresh failed")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self.tasks.submit('patients_tree', refresh_thread, debounce_ms=250)
     
     def load_doctors(self):
         """Load doctors for appointment booking"""
-        def load_thread():
+        def load_thread(task):
             try:
                 response = self.api_request('doctors')
                 
                 if response['status'] == 'success':
                     doctor_options = [f"Dr. {doctor['first_name']} {doctor['last_name']} ({doctor['specialization']}) - ID: {doctor['doctor_id']}" 
                                     for doctor in response['data']]
-                    self.apt_doctor_combo['values'] = doctor_options
+                    task.ui(lambda: self.apt_doctor_combo.configure(values=doctor_options))
                     
             except Exception as e:
                 print(f"Failed to load doctors: {e}")
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self.tasks.submit('doctors', load_thread)
     
     def book_appointment(self):
         """Book appointment"""
-        def book_thread():
+        def book_thread(task):
             try:
                 # Get values on main thread
                 patient_id = self.apt_patient_id.get()
@@ -1627,10 +2255,10 @@ class HospitalFlaskGUI:
                 
                 # Validate required fields
                 if not all([patient_id, doctor_combo, hour, minute]):
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Please fill in all required fields"))
+                    task.ui(lambda: messagebox.showerror("Error", "Please fill in all required fields"))
                     return
                 
-                self.root.after(0, lambda: self.status_var.set("Booking appointment..."))
+                task.ui(lambda: self.status_var.set("Booking appointment..."))
                 
                 # Extract doctor ID
                 doctor_id = int(doctor_combo.split("ID: ")[1])
@@ -1660,31 +2288,31 @@ class HospitalFlaskGUI:
                         self.apt_reason.delete('1.0', 'end')
                         self.status_var.set("Appointment booked successfully")
                     
-                    self.root.after(0, success_callback)
+                    task.ui(success_callback)
                 else:
                     raise Exception(response.get('message', 'Booking failed'))
                     
             except ValueError:
-                self.root.after(0, lambda: messagebox.showerror("Error", "Please enter a valid Patient ID"))
+                task.ui(lambda: messagebox.showerror("Error", "Please enter a valid Patient ID"))
             except Exception as e:
                 def error_callback():
                     messagebox.showerror("Error", f"Booking failed: {e}")
                     self.status_var.set("Appointment booking failed")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=book_thread, daemon=True).start()
+        self.tasks.submit('book_appointment', book_thread, skip_if_running=True)
     
     def validate_patient_for_records(self):
         """Validate patient ID before loading records"""
-        def validate_thread():
+        def validate_thread(task):
             try:
                 patient_id = self.records_patient_id.get().strip()
                 if not patient_id:
-                    self.root.after(0, lambda: messagebox.showwarning("Warning", "Please enter a Patient ID"))
+                    task.ui(lambda: messagebox.showwarning("Warning", "Please enter a Patient ID"))
                     return
                 
-                self.root.after(0, lambda: self.status_var.set(f"Validating Patient ID {patient_id}..."))
+                task.ui(lambda: self.status_var.set(f"Validating Patient ID {patient_id}..."))
                 
                 # Validate patient exists
                 response = self.api_request(f'validate/patient/{patient_id}')
@@ -1697,38 +2325,38 @@ class HospitalFlaskGUI:
                             self.patient_info_label.config(text=info_text, fg=self.colors['success'])
                             self.status_var.set("✅ Patient validated successfully")
                         
-                        self.root.after(0, show_patient_info)
+                        task.ui(show_patient_info)
                     else:
                         def show_not_found():
                             self.patient_info_label.config(text=f"❌ Patient ID {patient_id} not found in database", 
                                                           fg=self.colors['accent'])
                             self.status_var.set("❌ Patient not found")
                         
-                        self.root.after(0, show_not_found)
+                        task.ui(show_not_found)
                 else:
                     raise Exception(response.get('message', 'Validation failed'))
                     
             except ValueError:
-                self.root.after(0, lambda: messagebox.showerror("Error", "Please enter a valid numeric Patient ID"))
+                task.ui(lambda: messagebox.showerror("Error", "Please enter a valid numeric Patient ID"))
             except Exception as e:
                 def error_callback():
                     messagebox.showerror("Error", f"Validation failed: {e}")
                     self.status_var.set("❌ Validation failed")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=validate_thread, daemon=True).start()
+        self.tasks.submit('medical_records', validate_thread)
     
     def load_medical_records(self):
         """Load medical records for a patient with enhanced display"""
-        def load_thread():
+        def load_thread(task):
             try:
                 patient_id = self.records_patient_id.get().strip()
                 if not patient_id:
-                    self.root.after(0, lambda: messagebox.showwarning("Warning", "Please enter a Patient ID"))
+                    task.ui(lambda: messagebox.showwarning("Warning", "Please enter a Patient ID"))
                     return
                 
-                self.root.after(0, lambda: self.status_var.set(f"Loading medical records for Patient ID {patient_id}..."))
+                task.ui(lambda: self.status_var.set(f"Loading medical records for Patient ID {patient_id}..."))
                 
                 # First validate patient
                 validate_response = self.api_request(f'validate/patient/{patient_id}')
@@ -1742,63 +2370,40 @@ class HospitalFlaskGUI:
                                                       fg=self.colors['accent'])
                         self.status_var.set("❌ Patient not found")
                     
-                    self.root.after(0, show_not_found)
+                    task.ui(show_not_found)
                     return
                 
-                # Load medical records
-                response = self.api_request(f'patients/{patient_id}/medical-records')
+                # First page of medical records; later pages load as the user scrolls
+                records_endpoint = f'patients/{patient_id}/medical-records?limit={SERVER_PAGE_SIZE}'
+                response = self.api_request(records_endpoint)
                 
                 if response['status'] == 'success':
                     patient = validate_response['patient']
                     records = response['data']
+                    fetch_more = self.page_fetcher(records_endpoint, response.get('pagination'))
+                    shown = f"{len(records)}+" if fetch_more else str(len(records))
+                    
+                    def update_count(view):
+                        more = '+' if view.has_more else ''
+                        self.records_count_label.config(text=f"Total Records: {view.loaded}{more}")
                     
                     def update_records():
-                        # Clear existing records
-                        self.records_tree.delete(*self.records_tree.get_children())
-                        
                         # Update patient info
                         info_text = f"📋 Records for: {patient['first_name']} {patient['last_name']} (ID: {patient['patient_id']})"
                         self.patient_info_label.config(text=info_text, fg=self.colors['success'])
                         
-                        # Update records count
-                        self.records_count_label.config(text=f"Total Records: {len(records)}")
+                        # Populate records in chunks
+                        self.records_view.load(records, self.record_row_values,
+                                               fetch_more=fetch_more, on_change=update_count,
+                                               iid_for=lambda record: str(record['record_id']))
+                        update_count(self.records_view)
                         
                         if records:
-                            # Populate records
-                            for record in records:
-                                # Format date
-                                visit_date = str(record.get('visit_date', 'N/A'))
-                                if visit_date != 'N/A':
-                                    try:
-                                        from datetime import datetime
-                                        date_obj = datetime.strptime(visit_date.split()[0], '%Y-%m-%d')
-                                        visit_date = date_obj.strftime('%d/%m/%Y')
-                                    except:
-                                        pass
-                                
-                                # Truncate long text for display
-                                diagnosis = record.get('diagnosis', 'N/A') or 'N/A'
-                                treatment = record.get('treatment', 'N/A') or 'N/A'
-                                prescription = record.get('prescription', 'N/A') or 'N/A'
-                                
-                                diagnosis_display = diagnosis[:40] + '...' if len(diagnosis) > 40 else diagnosis
-                                treatment_display = treatment[:40] + '...' if len(treatment) > 40 else treatment
-                                prescription_display = prescription[:30] + '...' if len(prescription) > 30 else prescription
-                                
-                                self.records_tree.insert('', 'end', values=(
-                                    visit_date,
-                                    f"Dr. {record['doctor_first_name']} {record['doctor_last_name']}",
-                                    record['specialization'],
-                                    diagnosis_display,
-                                    treatment_display,
-                                    prescription_display
-                                ))
-                            
-                            self.status_var.set(f"✅ Loaded {len(records)} medical records for {patient['first_name']} {patient['last_name']}")
+                            self.status_var.set(f"✅ Loaded {shown} medical records for {patient['first_name']} {patient['last_name']}")
                             
                             # Show success message
                             messagebox.showinfo("Records Loaded", 
-                                              f"✅ Successfully loaded {len(records)} medical records for:\n\n"
+                                              f"✅ Successfully loaded {shown} medical records for:\n\n"
                                               f"Patient: {patient['first_name']} {patient['last_name']}\n"
                                               f"Patient ID: {patient['patient_id']}\n\n"
                                               f"Double-click any record for detailed view.")
@@ -1809,24 +2414,24 @@ class HospitalFlaskGUI:
                                               f"Patient: {patient['first_name']} {patient['last_name']}\n"
                                               f"Patient ID: {patient['patient_id']}")
                     
-                    self.root.after(0, update_records)
+                    task.ui(update_records)
                 else:
                     raise Exception(response.get('message', 'Failed to load records'))
                     
             except ValueError:
-                self.root.after(0, lambda: messagebox.showerror("Error", "Please enter a valid numeric Patient ID"))
+                task.ui(lambda: messagebox.showerror("Error", "Please enter a valid numeric Patient ID"))
             except Exception as e:
                 def error_callback():
                     messagebox.showerror("Error", f"Failed to load medical records: {e}")
                     self.status_var.set("❌ Failed to load medical records")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self.tasks.submit('medical_records', load_thread)
     
     def clear_medical_records(self):
         """Clear medical records display"""
-        self.records_tree.delete(*self.records_tree.get_children())
+        self.records_view.clear()
         self.records_patient_id.delete(0, 'end')
         self.patient_info_label.config(text="💡 Enter a Patient ID and click 'Validate Patient' to verify", 
                                       fg=self.colors['primary'])
@@ -1839,42 +2444,26 @@ class HospitalFlaskGUI:
         if not selection:
             return
         
-        item = self.records_tree.item(selection[0])
-        values = item['values']
-        
-        if not values:
-            return
-        
-        # Get the full record data
-        patient_id = self.records_patient_id.get().strip()
-        if not patient_id:
+        # Rows are inserted with the record_id as their item id
+        record_id = int(selection[0])
+        record = self.record_cache.get(record_id)
+        if record is not None:
+            self.display_detailed_record(record)
             return
         
-        def get_full_record():
+        def get_full_record(task):
             try:
-                response = self.api_request(f'patients/{patient_id}/medical-records')
+                response = self.api_request(f'medical-records/{record_id}')
                 if response['status'] == 'success':
-                    records = response['data']
-                    # Find the matching record by date and doctor
-                    visit_date = values[0]  # Date from display
-                    doctor_name = values[1]  # Doctor from display
-                    
-                    for record in records:
-                        record_date = str(record.get('visit_date', ''))
-                        if record_date:
-                            try:
-                                from datetime import datetime
-                                date_obj = datetime.strptime(record_date.split()[0], '%Y-%m-%d')
-                                formatted_date = date_obj.strftime('%d/%m/%Y')
-                                if formatted_date == visit_date:
-                                    self.root.after(0, lambda: self.display_detailed_record(record))
-                                    return
-                            except:
-                                pass
+                    record = response['data']
+                    self.record_cache.put(record_id, record)
+                    task.ui(lambda: self.display_detailed_record(record))
+                else:
+                    raise Exception(response.get('message', 'Record not found'))
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load detailed record: {e}"))
+                task.ui(lambda: messagebox.showerror("Error", f"Failed to load detailed record: {e}"))
         
-        threading.Thread(target=get_full_record, daemon=True).start()
+        self.tasks.submit('record_detail', get_full_record)
     
     def display_detailed_record(self, record):
         """Display detailed medical record in a popup window"""
@@ -1949,11 +2538,11 @@ class HospitalFlaskGUI:
     
     def validate_patient_id(self):
         """Validate patient ID"""
-        def validate_thread():
+        def validate_thread(task):
             try:
                 patient_id = self.apt_patient_id.get()
                 if not patient_id:
-                    self.root.after(0, lambda: messagebox.showwarning("Warning", "Please enter a Patient ID"))
+                    task.ui(lambda: messagebox.showwarning("Warning", "Please enter a Patient ID"))
                     return
                 
                 response = self.api_request(f'validate/patient/{patient_id}')
@@ -1961,20 +2550,20 @@ class HospitalFlaskGUI:
                 if response['status'] == 'success':
                     if response['exists']:
                         patient = response['patient']
-                        self.root.after(0, lambda: messagebox.showinfo("Valid Patient", 
+                        task.ui(lambda: messagebox.showinfo("Valid Patient", 
                                       f"✅ Patient found!\n\nID: {patient['patient_id']}\nName: {patient['first_name']} {patient['last_name']}"))
                     else:
-                        self.root.after(0, lambda: messagebox.showerror("Invalid Patient", 
+                        task.ui(lambda: messagebox.showerror("Invalid Patient", 
                                       f"❌ {response['message']}\n\nPlease check the Patient ID or register a new patient first."))
                 else:
                     raise Exception(response.get('message', 'Validation failed'))
                     
             except ValueError:
-                self.root.after(0, lambda: messagebox.showerror("Error", "Please enter a valid numeric Patient ID"))
+                task.ui(lambda: messagebox.showerror("Error", "Please enter a valid numeric Patient ID"))
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Validation failed: {e}"))
+                task.ui(lambda: messagebox.showerror("Error", f"Validation failed: {e}"))
         
-        threading.Thread(target=validate_thread, daemon=True).start()
+        self.tasks.submit('validate_patient', validate_thread)
     
     def create_data_sorting_tab(self):
         """Create perfect Quick Sort tab with advanced functionality"""
@@ -2079,6 +2668,7 @@ class HospitalFlaskGUI:
         h_scrollbar = ttk.Scrollbar(table_frame, orient='horizontal', command=self.sort_results_tree.xview)
         
         self.sort_results_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.sort_results_view = LazyTreeview(self.sort_results_tree, v_scrollbar, self.tasks, 'sort_results:pages')
         
         # Pack with perfect layout
         self.sort_results_tree.pack(side='left', fill='both', expand=True)
@@ -2099,9 +2689,9 @@ class HospitalFlaskGUI:
     
     def quick_sort_by_criteria(self, data_type, sort_field, order):
         """Perform quick sort with specific criteria"""
-        def sort_thread():
+        def sort_thread(task):
             try:
-                self.root.after(0, lambda: self.status_var.set(f"Quick sorting {data_type} by {sort_field}..."))
+                task.ui(lambda: self.status_var.set(f"Quick sorting {data_type} by {sort_field}..."))
                 
                 # Determine endpoint and data structure
                 if data_type == 'records':
@@ -2117,17 +2707,23 @@ class HospitalFlaskGUI:
                 # Make API request
                 request_data = {
                     'sort_by': sort_field,
-                    'order': order
+                    'order': order,
+                    'limit': SERVER_PAGE_SIZE
                 }
                 
                 response = self.api_request(endpoint, method='POST', data=request_data)
                 
                 if response['status'] == 'success':
+                    fetch_more = self.page_fetcher(endpoint, response.get('pagination'),
+                                                   method='POST', data=request_data)
+                    
                     def update_results():
-                        self.display_sort_results(response['data'], response['sort_info'], data_type_display)
-                        self.status_var.set(f"✅ Quick Sort completed: {response['sort_info']['record_count']} records")
+                        self.display_sort_results(response['data'], response['sort_info'], data_type_display,
+                                                  fetch_more=fetch_more)
+                        more = '+' if fetch_more else ''
+                        self.status_var.set(f"✅ Quick Sort completed: {response['sort_info']['record_count']}{more} records")
                     
-                    self.root.after(0, update_results)
+                    task.ui(update_results)
                 else:
                     raise Exception(response.get('message', 'Sort failed'))
                     
@@ -2136,85 +2732,75 @@ class HospitalFlaskGUI:
                     messagebox.showerror("Error", f"Quick Sort failed: {e}")
                     self.status_var.set("❌ Quick Sort failed")
                 
-                self.root.after(0, error_callback)
+                task.ui(error_callback)
         
-        threading.Thread(target=sort_thread, daemon=True).start()
+        self.tasks.submit('sort_results', sort_thread)
     
     
-    def display_sort_results(self, data, sort_info, data_type):
+    def display_sort_results(self, data, sort_info, data_type, fetch_more=None):
         """Display sorted results in treeview"""
-        # Clear existing results
-        self.sort_results_tree.delete(*self.sort_results_tree.get_children())
-        
         if not data:
+            self.sort_results_view.clear()
             self.sort_info_label.config(text="No data found to sort", fg='#e74c3c')
             return
         
         # Configure columns based on data type
         if data_type == "Medical Records":
             columns = ('Record ID', 'Patient', 'Doctor', 'Visit Date', 'Diagnosis', 'Specialization')
-            self.sort_results_tree['columns'] = columns
-            
-            for col in columns:
-                self.sort_results_tree.heading(col, text=col)
-                self.sort_results_tree.column(col, width=120)
             
-            # Populate data
-            for record in data:
+            def format_row(record):
                 visit_date = str(record.get('visit_date', 'N/A')).split()[0] if record.get('visit_date') else 'N/A'
-                self.sort_results_tree.insert('', 'end', values=(
+                return (
                     record.get('record_id', 'N/A'),
                     f"{record.get('patient_first_name', '')} {record.get('patient_last_name', '')}",
                     f"Dr. {record.get('doctor_first_name', '')} {record.get('doctor_last_name', '')}",
                     visit_date,
                     record.get('diagnosis', 'N/A')[:30] + '...' if len(str(record.get('diagnosis', ''))) > 30 else record.get('diagnosis', 'N/A'),
                     record.get('specialization', 'N/A')
-                ))
+                )
         
         elif data_type == "Patients":
             columns = ('Patient ID', 'Name', 'Date of Birth', 'Gender', 'Phone', 'Email')
-            self.sort_results_tree['columns'] = columns
             
-            for col in columns:
-                self.sort_results_tree.heading(col, text=col)
-                self.sort_results_tree.column(col, width=120)
-            
-            # Populate data
-            for patient in data:
+            def format_row(patient):
                 dob = str(patient.get('date_of_birth', 'N/A')).split()[0] if patient.get('date_of_birth') else 'N/A'
-                self.sort_results_tree.insert('', 'end', values=(
+                return (
                     patient.get('patient_id', 'N/A'),
                     f"{patient.get('first_name', '')} {patient.get('last_name', '')}",
                     dob,
                     patient.get('gender', 'N/A'),
                     patient.get('phone', 'N/A'),
                     patient.get('email', 'N/A')
-                ))
+                )
         
         elif data_type == "Appointments":
             columns = ('Appointment ID', 'Patient', 'Doctor', 'Date', 'Time', 'Status')
-            self.sort_results_tree['columns'] = columns
-            
-            for col in columns:
-                self.sort_results_tree.heading(col, text=col)
-                self.sort_results_tree.column(col, width=120)
             
-            # Populate data
-            for appointment in data:
+            def format_row(appointment):
                 apt_date = str(appointment.get('appointment_date', 'N/A')).split()[0] if appointment.get('appointment_date') else 'N/A'
-                self.sort_results_tree.insert('', 'end', values=(
+                return (
                     appointment.get('appointment_id', 'N/A'),
                     f"{appointment.get('patient_first_name', '')} {appointment.get('patient_last_name', '')}",
                     f"Dr. {appointment.get('doctor_first_name', '')} {appointment.get('doctor_last_name', '')}",
                     apt_date,
                     appointment.get('appointment_time', 'N/A'),
                     appointment.get('status', 'N/A')
-                ))
+                )
+        
+        # Clear existing results before switching columns
+        self.sort_results_view.clear()
+        self.sort_results_tree['columns'] = columns
+        for col in columns:
+            self.sort_results_tree.heading(col, text=col)
+            self.sort_results_tree.column(col, width=120)
+        
+        # Populate data in chunks
+        self.sort_results_view.load(data, format_row, fetch_more=fetch_more)
         
         # Update info label with perfect styling
         info_text = (f"✅ {sort_info['message']}\n"
                     f"📊 Algorithm: {sort_info['algorithm']} | "
-                    f"Records: {sort_info['record_count']} | "
+                    f"Records: {sort_info['record_count']}{'+' if fetch_more else ''} | "
                     f"Field: {sort_info['sort_by']} | "
                     f"Order: {sort_info['order'].title()}ending")
         
@@ -2222,7 +2808,7 @@ class HospitalFlaskGUI:
     
     def clear_sort_results(self):
         """Clear sort results with perfect styling"""
-        self.sort_results_tree.delete(*self.sort_results_tree.get_children())
+        self.sort_results_view.clear()
         self.sort_info_label.config(text="🔄 Select a sorting option above to see results", 
                                    fg=self.colors['text_secondary'], 
                                    font=self.fonts['body'])
@@ -2231,6 +2817,13 @@ class HospitalFlaskGUI:
 def main():
     root = tk.Tk()
     app = HospitalFlaskGUI(root)
+    
+    def on_close():
+        app.events.stop()
+        app.tasks.shutdown()
+        root.destroy()
+    
+    root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
 
 if __name__ == "__main__":